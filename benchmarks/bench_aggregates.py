@@ -0,0 +1,68 @@
+"""Incremental aggregates benchmark.
+
+Measures the cost of the temp setter on plain and observable objects, and
+compares keeping the sum, mean, min and max of many objects up to date with
+an Aggregate and with a rescan after each update.
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_aggregates.py [size] [updates]
+
+Copyright (c) 2020 Thierry P.G. DECKER
+All Rights Reserved.
+Released under the MIT license
+
+"""
+
+import random
+import sys
+import time
+import timeit
+
+from siarnaq.aggregates import Aggregate
+from siarnaq.degrees import Degree
+from siarnaq.degrees import ObservableDegree
+
+
+def _setter(temp):
+    def run():
+        temp.temp = 20.
+        temp.temp = 21.
+    return run
+
+
+def main(size=10_000, updates=1_000):
+    number = 1_000_000
+    watched = ObservableDegree('ce', 20)
+    Aggregate(Degree, 'ce', [watched])
+    for name, temp in (('Degree', Degree('ce', 20)),
+                       ('ObservableDegree', ObservableDegree('ce', 20)),
+                       ('aggregated', watched)):
+        seconds = min(timeit.repeat(_setter(temp), number=number, repeat=3))
+        print(f'{name + " setter":<28} {seconds / number / 2 * 1e9:>10.1f} '
+              f'ns')
+
+    generator = random.Random(0)
+    temps = ObservableDegree.from_values(
+        'fa', [generator.uniform(-40, 120) for _ in range(size)])
+    changes = [(generator.randrange(size), generator.uniform(-40, 120))
+               for _ in range(updates)]
+
+    start = time.perf_counter()
+    for index, value in changes:
+        temps[index].temp = value
+        celcius = [temp.celcius for temp in temps]
+        sum(celcius), sum(celcius) / size, min(celcius), max(celcius)
+    seconds = time.perf_counter() - start
+    print(f'{"rescan per update":<28} {seconds / updates * 1e6:>10.1f} us')
+
+    aggregate = Aggregate(Degree, 'ce', temps)
+    start = time.perf_counter()
+    for index, value in changes:
+        temps[index].temp = value
+        aggregate.sum, aggregate.mean, aggregate.min, aggregate.max
+    seconds = time.perf_counter() - start
+    print(f'{"Aggregate per update":<28} {seconds / updates * 1e6:>10.1f} us')
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,67 @@
+"""Time series compression benchmark.
+
+Encodes synthetic sensor channels (one reading a minute with jitter and
+gaps, slowly changing temperatures at 0.01 resolution) and reports the
+compression ratio against raw int64 timestamps and float64 values, and the
+encode and decode throughputs.
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_compression.py [size]
+
+Copyright (c) 2020 Thierry P.G. DECKER
+All Rights Reserved.
+Released under the MIT license
+
+"""
+
+import math
+import random
+import sys
+import time
+
+from siarnaq.compression import decode
+from siarnaq.compression import encode
+from siarnaq.degrees import DegreeArray
+
+
+def _channel(size, noise, seed):
+    generator = random.Random(seed)
+    timestamps = []
+    temps = []
+    timestamp = 1600000000
+    temp = 20.
+    for i in range(size):
+        timestamp += 60
+        if generator.random() < 0.01:
+            timestamp += generator.randint(-2, 2)
+        if generator.random() < 0.001:
+            timestamp += 3600
+        temp += generator.gauss(0, noise)
+        temps.append(round(temp + 3 * math.sin(i / 720), 2))
+        timestamps.append(timestamp)
+    return timestamps, DegreeArray('ce', temps)
+
+
+def main(size=200_000):
+    print(f'{"channel":<10} {"ratio":>7} {"bytes/pt":>9} '
+          f'{"encode pt/s":>12} {"decode pt/s":>12}')
+    channels = (
+        ('constant', 0.),
+        ('slow', 0.005),
+        ('noisy', 0.05),
+    )
+    for name, noise in channels:
+        timestamps, temps = _channel(size, noise, 0)
+        start = time.perf_counter()
+        data = encode(timestamps, temps)
+        encoding = time.perf_counter() - start
+        start = time.perf_counter()
+        decode(data)
+        decoding = time.perf_counter() - start
+        raw = 16 * size
+        print(f'{name:<10} {raw / len(data):>7.2f} {len(data) / size:>9.2f} '
+              f'{size / encoding:>12.0f} {size / decoding:>12.0f}')
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,65 @@
+"""Degree-days benchmark.
+
+Computes the daily degree-days of hourly readings of many buildings, fed
+in chunks of one hour of every building, and compares them with a loop over
+Degree objects computing daily means.
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_degree_days.py [buildings] [days]
+
+Copyright (c) 2020 Thierry P.G. DECKER
+All Rights Reserved.
+Released under the MIT license
+
+"""
+
+import math
+import random
+import sys
+import time
+
+from siarnaq.degree_days import DegreeDayEngine
+from siarnaq.degrees import Degree
+
+
+def main(buildings=1000, days=30):
+    generator = random.Random(0)
+    base = Degree('fa', 65)
+    hours = [3600 * hour for hour in range(24 * days)]
+    groups = list(range(buildings))
+    chunks = [
+        [50 + 15 * math.sin(hour / 86400 * 2 * math.pi)
+         + generator.gauss(0, 2) for _ in groups]
+        for hour in hours
+    ]
+    size = len(hours) * buildings
+
+    start = time.perf_counter()
+    sums = {}
+    for hour, chunk in zip(hours, chunks):
+        for group, value in zip(groups, chunk):
+            key = (group, hour // 86400)
+            total, count = sums.get(key, (0., 0))
+            sums[key] = (total + Degree('fa', value).celcius, count + 1)
+    naive = [max(0., base.celcius - total / count)
+             for total, count in sums.values()]
+    seconds = time.perf_counter() - start
+    print(f'{"Degree objects loop":<22} {seconds:>8.3f} s '
+          f'{size / seconds:>12.0f} readings/s')
+
+    for method in ('mean', 'integration'):
+        start = time.perf_counter()
+        engine = DegreeDayEngine(base, method)
+        results = []
+        for hour, chunk in zip(hours, chunks):
+            temps = Degree.from_values('fa', chunk, array=True)
+            results.extend(engine.feed([hour] * buildings, temps, groups))
+        results.extend(engine.flush())
+        seconds = time.perf_counter() - start
+        print(f'{method:<22} {seconds:>8.3f} s '
+              f'{size / seconds:>12.0f} readings/s')
+    assert len(results) == len(naive)
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,41 @@
+"""Bulk construction benchmark.
+
+Compares building many objects with a list comprehension of constructor
+calls, with the from_values factories and with arrays.
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_factories.py [size]
+
+Copyright (c) 2020 Thierry P.G. DECKER
+All Rights Reserved.
+Released under the MIT license
+
+"""
+
+import random
+import sys
+import timeit
+
+from siarnaq.degrees import Degree
+from siarnaq.distances import Distance
+
+
+def main(size=1_000_000):
+    generator = random.Random(0)
+    values = [generator.uniform(-40, 120) for _ in range(size)]
+    cases = [
+        ('[Degree(...)]', lambda: [Degree('fa', value) for value in values]),
+        ('Degree.from_values', lambda: Degree.from_values('fa', values)),
+        ('DegreeArray', lambda: Degree.from_values('fa', values, True)),
+        ('[Distance(...)]',
+         lambda: [Distance('mi', value) for value in values]),
+        ('Distance.from_values', lambda: Distance.from_values('mi', values)),
+        ('DistanceArray', lambda: Distance.from_values('mi', values, True)),
+    ]
+    for name, function in cases:
+        seconds = min(timeit.repeat(function, number=1, repeat=3))
+        print(f'{name:<22} {seconds:>8.3f} s {size / seconds:>14.0f} /s')
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,50 @@
+"""Bulk formatting benchmark.
+
+Compares rendering readings with str() calls on objects and with the bulk
+formatter, from objects and from an array, into text and binary streams.
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_formatting.py [size]
+
+Copyright (c) 2020 Thierry P.G. DECKER
+All Rights Reserved.
+Released under the MIT license
+
+"""
+
+import io
+import random
+import sys
+import timeit
+
+from siarnaq.degrees import Degree
+from siarnaq.formatting import format_values
+
+
+def main(size=1_000_000):
+    generator = random.Random(0)
+    values = [round(generator.uniform(-40, 120), 2) for _ in range(size)]
+    temps = Degree.from_values('fa', values)
+    array = Degree.from_values('fa', values, array=True)
+
+    def naive():
+        stream = io.StringIO()
+        for temp in temps:
+            stream.write(f'{temp}\n')
+
+    cases = [
+        ('str() per object', naive),
+        ('objects to text',
+         lambda: format_values(temps, stream=io.StringIO())),
+        ('array to text', lambda: format_values(array, stream=io.StringIO())),
+        ('array to bytes', lambda: format_values(array, stream=io.BytesIO())),
+        ('array to ce, 1 decimal',
+         lambda: format_values(array, 'ce', 1, stream=io.StringIO())),
+    ]
+    for name, function in cases:
+        seconds = min(timeit.repeat(function, number=1, repeat=3))
+        print(f'{name:<24} {seconds:>8.3f} s {size / seconds:>14.0f} /s')
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,178 @@
+"""Memory footprint benchmark.
+
+Measures with tracemalloc the memory held by objects, arrays and
+aggregators at several sizes, and the memory allocated by operations on
+objects, in bytes per item. The peak column includes the temporary
+allocations made while building the measured structure.
+
+The retained sizes are compared with a stored baseline, and the script
+exits with a non zero status if one of them grows by more than the
+tolerance. The sizes depend on the Python version, so the baseline should be
+refreshed with --update when the interpreter changes.
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_memory.py [--update] [--tolerance 0.1]
+
+Copyright (c) 2020 Thierry P.G. DECKER
+All Rights Reserved.
+Released under the MIT license
+
+"""
+
+import argparse
+import gc
+import json
+import pathlib
+import platform
+import random
+import sys
+import tracemalloc
+
+from siarnaq.degrees import Degree
+from siarnaq.degrees import DegreeArray
+from siarnaq.distances import Distance
+from siarnaq.interning import InternPool
+from siarnaq.rules import RuleEngine
+from siarnaq.sketches import QuantileSketch
+
+_baseline = pathlib.Path(__file__).with_name('memory_baseline.json')
+_sizes = (1_000, 100_000)
+
+
+def _views(temps):
+    for temp in temps:
+        temp.celcius
+        temp.kelvin
+        temp.rankine
+    return temps
+
+
+def _scale_change(temps):
+    for temp in temps:
+        temp.scale = 'ke'
+    return temps
+
+
+def _rules(values):
+    engine = RuleEngine()
+    for rule, value in enumerate(values):
+        engine.add(rule, rule % 100, '>', Degree('fa', value))
+    return engine
+
+
+def _interned(values):
+    pool = InternPool(Degree)
+    return [pool.get('fa', round(value)) for value in values]
+
+
+def _sketch(values):
+    sketch = QuantileSketch(Degree, seed=0)
+    sketch.extend(values, 'fa')
+    return sketch
+
+
+_cases = [
+    #
+    # (name, setup of the input from the values, measured function)
+    #
+    ('Degree objects', None, lambda values: [
+        Degree('fa', value) for value in values]),
+    ('Degree.from_values', None,
+     lambda values: Degree.from_values('fa', values)),
+    ('Distance objects', None, lambda values: [
+        Distance('mi', value) for value in values]),
+    ('DegreeArray float64', None,
+     lambda values: DegreeArray('fa', values)),
+    ('DegreeArray float32', None,
+     lambda values: DegreeArray('fa', values, 'float32')),
+    ('DegreeArray int16', None,
+     lambda values: DegreeArray('fa', values, 'int16')),
+    ('InternPool setpoints', None, _interned),
+    ('RuleEngine rules', None, _rules),
+    ('QuantileSketch', None, _sketch),
+    ('Degree + Degree', lambda values: Degree.from_values('fa', values),
+     lambda temps: [temp + temp for temp in temps]),
+    ('Degree cold views', lambda values: Degree.from_values('fa', values),
+     _views),
+    ('Degree scale change',
+     lambda values: Degree.from_values('fa', values), _scale_change),
+    ('DegreeArray.to', lambda values: DegreeArray('fa', values),
+     lambda temps: temps.to('ce')),
+]
+
+
+def _measure(function, data):
+    """Retained and peak bytes allocated by a call."""
+    gc.collect()
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    before, _ = tracemalloc.get_traced_memory()
+    result = function(data)
+    after, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return after - before, peak - before
+
+
+def measure():
+    """Measure every case at every size.
+
+    Returns:
+        A dict of (retained, peak) bytes per item by 'name@size' key.
+    """
+    results = {}
+    generator = random.Random(0)
+    for size in _sizes:
+        values = [round(generator.uniform(-40, 120), 2) for _ in range(size)]
+        for name, setup, function in _cases:
+            data = values if setup is None else setup(values)
+            retained, peak = _measure(function, data)
+            results[f'{name}@{size}'] = (retained / size, peak / size)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--update', action='store_true',
+                        help='store the measures as the new baseline')
+    parser.add_argument('--tolerance', type=float, default=0.1,
+                        help='allowed relative growth (default: 0.1)')
+    args = parser.parse_args(argv)
+
+    results = measure()
+    baseline = {}
+    if _baseline.exists() and not args.update:
+        stored = json.loads(_baseline.read_text())
+        if stored['python'] != platform.python_version():
+            print(f'warning: baseline measured with Python '
+                  f'{stored["python"]}')
+        baseline = stored['retained']
+
+    print(f'{"case":<32} {"bytes/item":>10} {"peak/item":>10} '
+          f'{"baseline":>10}')
+    regressions = []
+    for key, (retained, peak) in results.items():
+        reference = baseline.get(key)
+        print(f'{key:<32} {retained:>10.1f} {peak:>10.1f} '
+              f'{"-" if reference is None else f"{reference:.1f}":>10}')
+        if reference is not None and \
+                retained > reference * (1 + args.tolerance) + 1:
+            regressions.append(key)
+
+    if args.update:
+        _baseline.write_text(json.dumps({
+            'python': platform.python_version(),
+            'retained': {
+                key: round(retained, 1)
+                for key, (retained, _) in results.items()
+            },
+        }, indent=4) + '\n')
+        print(f'baseline stored in {_baseline}')
+    if regressions:
+        print(f'regressions: {", ".join(regressions)}')
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
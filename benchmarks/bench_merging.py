@@ -0,0 +1,66 @@
+"""Stream merge benchmark.
+
+Merges many time ordered streams in Fahrenheit and Celcius into Celcius
+batches, from raw floats and from Degree objects, and compares the merge
+with heapq.merge and a conversion of each reading through a Degree object.
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_merging.py [streams] [length]
+
+Copyright (c) 2020 Thierry P.G. DECKER
+All Rights Reserved.
+Released under the MIT license
+
+"""
+
+import heapq
+import random
+import sys
+import time
+
+from siarnaq.degrees import Degree
+from siarnaq.merging import merge
+
+
+def main(streams=200, length=5000):
+    generator = random.Random(0)
+    scales = ['fa' if index % 2 else 'ce' for index in range(streams)]
+    raw = []
+    for _ in range(streams):
+        timestamp = 0
+        readings = []
+        for _ in range(length):
+            timestamp += generator.randint(1, 120)
+            readings.append((timestamp, generator.uniform(-10, 40)))
+        raw.append(readings)
+    objects = [
+        [(timestamp, Degree(scale, value)) for timestamp, value in readings]
+        for scale, readings in zip(scales, raw)
+    ]
+    size = streams * length
+
+    def naive():
+        iterators = [
+            ((timestamp, Degree(scale, value).celcius)
+             for timestamp, value in readings)
+            for scale, readings in zip(scales, raw)
+        ]
+        return sum(1 for _ in heapq.merge(*iterators))
+
+    cases = (
+        ('heapq.merge + Degree', naive),
+        ('merge raw floats',
+         lambda: sum(len(batch) for _, _, batch in merge(
+             raw, 'ce', scales=scales))),
+        ('merge Degree objects',
+         lambda: sum(len(batch) for _, _, batch in merge(objects, 'ce'))),
+    )
+    for name, function in cases:
+        start = time.perf_counter()
+        assert function() == size
+        seconds = time.perf_counter() - start
+        print(f'{name:<24} {seconds:>8.3f} s {size / seconds:>12.0f} /s')
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
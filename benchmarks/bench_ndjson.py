@@ -0,0 +1,65 @@
+"""NDJSON benchmark.
+
+Compares encoding readings with json.dumps of dicts and decoding them with
+json.loads into objects, with the ndjson module working from objects and
+from arrays, converting from Fahrenheit to Celcius.
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_ndjson.py [size]
+
+Copyright (c) 2020 Thierry P.G. DECKER
+All Rights Reserved.
+Released under the MIT license
+
+"""
+
+import io
+import json
+import random
+import sys
+import timeit
+
+from siarnaq import ndjson
+from siarnaq.degrees import Degree
+
+
+def main(size=1_000_000):
+    generator = random.Random(0)
+    values = [round(generator.uniform(-40, 120), 2) for _ in range(size)]
+    temps = Degree.from_values('fa', values)
+    array = Degree.from_values('fa', values, array=True)
+    text = io.StringIO()
+    ndjson.write(array, text)
+    lines = text.getvalue().splitlines(keepends=True)
+
+    def naive_write():
+        stream = io.StringIO()
+        for temp in temps:
+            stream.write(json.dumps({'scale': 'ce', 'temp': temp.celcius}))
+            stream.write('\n')
+
+    def naive_read():
+        return [
+            Degree(record['scale'], record['temp']).celcius
+            for record in map(json.loads, lines)
+        ]
+
+    cases = [
+        ('json.dumps of dicts', naive_write),
+        ('write objects',
+         lambda: ndjson.write(temps, io.StringIO(), 'ce')),
+        ('write array', lambda: ndjson.write(array, io.StringIO(), 'ce')),
+        ('write array to bytes',
+         lambda: ndjson.write(array, io.BytesIO(), 'ce')),
+        ('json.loads to objects', naive_read),
+        ('read objects', lambda: list(ndjson.read(lines, scale='ce'))),
+        ('read arrays',
+         lambda: list(ndjson.read_arrays(lines, scale='ce'))),
+    ]
+    for name, function in cases:
+        seconds = min(timeit.repeat(function, number=1, repeat=3))
+        print(f'{name:<24} {seconds:>8.3f} s {size / seconds:>14.0f} /s')
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
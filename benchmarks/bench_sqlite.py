@@ -0,0 +1,82 @@
+"""SQLite storage benchmark.
+
+Measures the insert throughput of a ReadingStore from arrays and from
+objects, and the throughput of range queries answered from the canonical
+index, compared with a table of repr strings parsed and converted in Python.
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_sqlite.py [size]
+
+Copyright (c) 2020 Thierry P.G. DECKER
+All Rights Reserved.
+Released under the MIT license
+
+"""
+
+import random
+import sqlite3
+import sys
+import time
+
+from siarnaq.degrees import Degree
+from siarnaq.sqlite import ReadingStore
+
+
+def _report(name, seconds, rows):
+    print(f'{name:<34} {seconds:>8.3f} s {rows / seconds:>12.0f} rows/s')
+
+
+def main(size=1_000_000):
+    generator = random.Random(0)
+    scales = ('ce', 'fa', 'ke')
+    values = [round(generator.uniform(-40, 120), 2) for _ in range(size)]
+    timestamps = list(range(size))
+    store = ReadingStore(sqlite3.connect(':memory:'))
+
+    start = time.perf_counter()
+    chunk = size // len(scales)
+    for index, scale in enumerate(scales):
+        temps = Degree.from_values(
+            scale, values[index * chunk:(index + 1) * chunk], array=True)
+        store.insert_array(
+            'sensor', timestamps[index * chunk:(index + 1) * chunk], temps)
+    _report('insert_array', time.perf_counter() - start, len(store))
+
+    temps = [Degree(scales[i % 3], value)
+             for i, value in enumerate(values[:size // 10])]
+    objects = ReadingStore(sqlite3.connect(':memory:'))
+    start = time.perf_counter()
+    objects.insert(('sensor', i, temp) for i, temp in enumerate(temps))
+    _report('insert objects', time.perf_counter() - start, len(temps))
+
+    naive = sqlite3.connect(':memory:')
+    naive.execute('CREATE TABLE readings (timestamp REAL, value TEXT)')
+    with naive:
+        naive.executemany(
+            'INSERT INTO readings VALUES (?, ?)',
+            ((i, repr(Degree(scales[i // chunk], values[i])))
+             for i in range(len(scales) * chunk)))
+
+    low, high = Degree('fa', 70), Degree('ce', 22)
+    for name, function in (
+            ('query_array (index)',
+             lambda: store.query_array(low, high, 'ce')[0]),
+            ('query objects (index)', lambda: store.query(low, high)),
+            ('repr strings (scan)', lambda: _naive(naive, low, high))):
+        start = time.perf_counter()
+        rows = len(function())
+        _report(f'{name}, {rows} rows', time.perf_counter() - start, rows)
+
+
+def _naive(connection, low, high):
+    results = []
+    for timestamp, text in connection.execute('SELECT * FROM readings'):
+        scale, temp = text[8:-1].split(', ')
+        kelvin = Degree(scale.strip("'"), float(temp)).kelvin
+        if low.kelvin <= kelvin <= high.kelvin:
+            results.append(timestamp)
+    return results
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
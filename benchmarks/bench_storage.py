@@ -0,0 +1,41 @@
+"""Storage dtypes benchmark.
+
+Compares the memory footprint, the conversion throughput and the round-trip
+error of the DegreeArray storage dtypes against float64.
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_storage.py [size]
+
+Copyright (c) 2020 Thierry P.G. DECKER
+All Rights Reserved.
+Released under the MIT license
+
+"""
+
+import random
+import sys
+import timeit
+
+from siarnaq.degrees import DegreeArray
+
+
+def main(size=1_000_000):
+    random.seed(0)
+    readings = [round(random.uniform(-40, 60), 2) for _ in range(size)]
+    print(f'{size} Celcius readings at 0.01 °C resolution')
+    print(f'{"dtype":<8} {"bytes":>10} {"ce->fa /s":>12} '
+          f'{"round-trip err":>15} {"bound":>10}')
+    for dtype in ('float64', 'float32', 'int32', 'int16'):
+        temps = DegreeArray('ce', readings, dtype=dtype)
+        seconds = min(timeit.repeat(
+            lambda: temps.to('fa'), number=1, repeat=3))
+        back = temps.to('fa').to('ce')
+        error = max(abs(a - b) for a, b in zip(readings, back.values))
+        bound = temps.conversion_error('fa')
+        bound += temps.to('fa').conversion_error('ce')
+        print(f'{dtype:<8} {temps.nbytes:>10} {size / seconds:>12.0f} '
+              f'{error:>15.2e} {bound:>10.2e}')
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,41 @@
+"""Multi-threaded conversion benchmark.
+
+Converts an array and a list of frozen objects with 1, 4 and 8 threads.
+The threads only run in parallel on a free-threaded Python build.
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_threads.py [size]
+
+Copyright (c) 2020 Thierry P.G. DECKER
+All Rights Reserved.
+Released under the MIT license
+
+"""
+
+import random
+import sys
+import timeit
+
+from siarnaq import parallel
+from siarnaq.degrees import FrozenDegree
+
+
+def main(size=1_000_000):
+    gil = getattr(sys, '_is_gil_enabled', lambda: True)()
+    print(f'Python {sys.version.split()[0]}, GIL '
+          f'{"enabled" if gil else "disabled"}')
+    generator = random.Random(0)
+    values = [generator.uniform(-40, 120) for _ in range(size)]
+    array = FrozenDegree.from_values('fa', values, array=True)
+    temps = FrozenDegree.from_values('fa', values[:size // 10])
+    for threads in (1, 4, 8):
+        for name, data in (('array', array), ('frozen objects', temps)):
+            seconds = min(timeit.repeat(
+                lambda: parallel.convert(data, 'ce', threads),
+                number=1, repeat=3))
+            print(f'{threads} threads, {name:<15} {seconds:>8.3f} s '
+                  f'{len(data) / seconds:>14.0f} /s')
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
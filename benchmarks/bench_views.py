@@ -0,0 +1,61 @@
+"""Cached views benchmark.
+
+Measures repeated reads of the scale properties of one object, the first read
+computing the conversion and the following ones hitting the cache, next to
+the reads of a plain attribute and of a property returning an attribute,
+which is the lowest cost of a property. The statements are timed without a
+wrapping function call, so the figures are the cost of the reads alone.
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_views.py [number]
+
+Copyright (c) 2020 Thierry P.G. DECKER
+All Rights Reserved.
+Released under the MIT license
+
+"""
+
+import sys
+import timeit
+
+from siarnaq.degrees import Degree
+from siarnaq.distances import Distance
+
+
+class _Plain:
+    """Reference object exposing a plain attribute and a property."""
+
+    __slots__ = ('value',)
+
+    def __init__(self):
+        self.value = 0.
+
+    @property
+    def attribute(self):
+        return self.value
+
+
+def main(number=1_000_000):
+    namespace = {
+        'plain': _Plain(),
+        'temp': Degree('fa', 70.1),
+        'dist': Distance('mi', 12.5),
+        'Degree': Degree,
+    }
+    cases = [
+        ('plain attribute', 'plain.value'),
+        ('property', 'plain.attribute'),
+        ('Degree.celcius', 'temp.celcius'),
+        ('Degree.kelvin', 'temp.kelvin'),
+        ('Degree.rankine', 'temp.rankine'),
+        ('Distance.kilometer', 'dist.kilometer'),
+        ('uncached conversion', 'Degree.conv_fa_to_ke(temp.temp)'),
+    ]
+    for name, statement in cases:
+        seconds = min(timeit.repeat(
+            statement, number=number, repeat=5, globals=namespace))
+        print(f'{name:<20} {seconds / number * 1e9:>8.1f} ns per read')
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,101 @@
+"""Conversion service load test.
+
+Sends concurrent single and bulk conversion requests to a running
+`python -m siarnaq serve` instance and reports the client side latencies
+and the server side counters.
+
+Usage:
+    python -m siarnaq serve --port 8000 &
+    PYTHONPATH=. python benchmarks/load_serve.py [--port 8000] [--clients 50]
+        [--requests 200] [--bulk 0]
+
+Copyright (c) 2020 Thierry P.G. DECKER
+All Rights Reserved.
+Released under the MIT license
+
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+
+
+async def _client(host, port, requests, bulk, latencies):
+    reader, writer = await asyncio.open_connection(host, port)
+    for _ in range(requests):
+        if bulk:
+            payload = {
+                'quantity': 'degree', 'scale': 'fa', 'to': 'ce',
+                'values': [random.uniform(-40, 120) for _ in range(bulk)],
+            }
+        else:
+            payload = {
+                'quantity': 'degree', 'scale': 'fa', 'to': 'ce',
+                'value': random.uniform(-40, 120),
+            }
+        body = json.dumps(payload).encode()
+        start = time.perf_counter()
+        writer.write(
+            f'POST /convert HTTP/1.1\r\n'
+            f'Content-Length: {len(body)}\r\n\r\n'.encode() + body
+        )
+        await writer.drain()
+        length = 0
+        while True:
+            line = await reader.readline()
+            if not line.strip():
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            if name.lower() == 'content-length':
+                length = int(value)
+        await reader.readexactly(length)
+        latencies.append(time.perf_counter() - start)
+    writer.close()
+
+
+async def _stats(host, port):
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(b'GET /stats HTTP/1.1\r\nConnection: close\r\n\r\n')
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    return json.loads(response.partition(b'\r\n\r\n')[2])
+
+
+async def main(host, port, clients, requests, bulk):
+    latencies = []
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        _client(host, port, requests, bulk, latencies)
+        for _ in range(clients)
+    ))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    count = len(latencies)
+    print(f'{count} requests in {elapsed:.2f} s: {count / elapsed:.0f} req/s')
+    for label, quantile in (('p50', 0.5), ('p95', 0.95), ('p99', 0.99)):
+        latency = latencies[min(count - 1, int(quantile * count))]
+        print(f'{label} latency: {latency * 1000:.2f} ms')
+    stats = await _stats(host, port)
+    print(f'server: {stats["requests"]} requests, {stats["values"]} values, '
+          f'{stats["batches"]} batches, '
+          f'{stats["values"] / max(stats["batches"], 1):.1f} values per batch')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--clients', type=int, default=50)
+    parser.add_argument('--requests', type=int, default=200)
+    parser.add_argument(
+        '--bulk',
+        type=int,
+        default=0,
+        help='values per request, 0 for single conversions',
+    )
+    args = parser.parse_args()
+    asyncio.run(main(
+        args.host, args.port, args.clients, args.requests, args.bulk))
@@ -0,0 +1,39 @@
+"""Command line interface.
+
+Usage:
+    python -m siarnaq serve [--host HOST] [--port PORT] [--window SECONDS]
+
+Copyright (c) 2020 Thierry P.G. DECKER
+All Rights Reserved.
+Released under the MIT license
+
+"""
+
+import argparse
+import asyncio
+
+from siarnaq import server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m siarnaq')
+    commands = parser.add_subparsers(dest='command', required=True)
+    serve = commands.add_parser('serve', help='run the conversion service')
+    serve.add_argument('--host', default='127.0.0.1')
+    serve.add_argument('--port', type=int, default=8000)
+    serve.add_argument(
+        '--window',
+        type=float,
+        default=0.001,
+        help='batching window in seconds',
+    )
+    args = parser.parse_args(argv)
+    if args.command == 'serve':
+        try:
+            asyncio.run(server.serve(args.host, args.port, args.window))
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == '__main__':
+    main()
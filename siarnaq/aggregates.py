@@ -0,0 +1,193 @@
+"""Incremental aggregates.
+
+This module maintains the sum, mean, minimum and maximum of a set of
+observable quantities (ObservableDegree, ObservableDistance), updated when
+one of them changes instead of rescanning the set.
+
+The aggregate keeps the canonical value of each member. The sum is updated
+in O(1) per change. The minimum and maximum are read from heaps where
+changes push new entries in O(log n); outdated entries are dropped when
+they reach the top. The heaps are rebuilt, and the sum recomputed to clear
+its rounding drift, when outdated entries outnumber the members.
+
+Copyright (c) 2020 Thierry P.G. DECKER
+All Rights Reserved.
+Released under the MIT license
+
+"""
+
+import heapq
+import math
+
+from siarnaq.degrees import Degree
+
+
+class Aggregate:
+    """Aggregate class.
+
+    """
+
+    def __init__(self, quantity=Degree, scale=None, members=()):
+        """Initialize new Aggregate instances.
+
+        Args:
+            quantity: The quantity class of the members.
+            scale: A string containing the scale of the aggregates, the
+                canonical scale of the quantity by default.
+            members: An iterable of observable quantities to add.
+
+        Raises:
+            NameError if the scale is not supported.
+        """
+        if scale is None:
+            scale = quantity._base
+        if scale not in quantity._scales:
+            raise NameError(scale)
+        self._quantity = quantity
+        self._scale = scale
+        self._gain, self._offset = quantity._canonical[scale]
+        self._values = {}
+        self._members = {}
+        self._sum = 0.
+        self._low = []
+        self._high = []
+        for member in members:
+            self.add(member)
+
+    def __len__(self):
+        return len(self._values)
+
+    def __contains__(self, member):
+        return id(member) in self._values
+
+    @property
+    def scale(self):
+        """Scale of the aggregates."""
+        return self._scale
+
+    def _canonical(self, member):
+        gain, offset = self._quantity._canonical[member.scale]
+        return gain * member.value + offset
+
+    def _push(self, key, value):
+        heapq.heappush(self._low, (value, key))
+        heapq.heappush(self._high, (-value, key))
+        if len(self._low) > 2 * len(self._values) + 32:
+            self._rebuild()
+
+    def _rebuild(self):
+        values = self._values
+        self._low = [(value, key) for key, value in values.items()]
+        self._high = [(-value, key) for key, value in values.items()]
+        heapq.heapify(self._low)
+        heapq.heapify(self._high)
+        self._sum = math.fsum(values.values())
+
+    def add(self, member):
+        """Add an observable quantity, in any scale.
+
+        Raises:
+            TypeError if the member is not observable or not of the
+            aggregate dimension.
+            KeyError if the member has already been added.
+        """
+        if member.dimension != self._quantity.dimension or \
+                not hasattr(member, 'observe'):
+            raise TypeError(type(member).__name__)
+        key = id(member)
+        if key in self._values:
+            raise KeyError(member)
+        value = self._canonical(member)
+        self._values[key] = value
+        self._members[key] = member
+        self._sum += value
+        member.observe(self._update)
+        self._push(key, value)
+
+    def remove(self, member):
+        """Remove a member.
+
+        Raises:
+            KeyError if the member has not been added.
+        """
+        key = id(member)
+        value = self._values.pop(key)
+        del self._members[key]
+        member.unobserve(self._update)
+        self._sum -= value
+        if len(self._low) > 2 * len(self._values) + 32:
+            self._rebuild()
+
+    def _update(self, member):
+        """Observer of the members.
+
+        Objects which are not members are ignored, such as copies made
+        with an observer list shared with a member.
+        """
+        key = id(member)
+        if self._members.get(key) is not member:
+            return
+        value = self._canonical(member)
+        previous = self._values[key]
+        if value != previous:
+            self._values[key] = value
+            self._sum += value - previous
+            self._push(key, value)
+
+    def _top(self, heap, sign):
+        values = self._values
+        if not values:
+            raise ValueError('empty aggregate')
+        while values.get(heap[0][1]) != sign * heap[0][0]:
+            heapq.heappop(heap)
+        return sign * heap[0][0]
+
+    def _scaled(self, value):
+        return (value - self._offset) / self._gain
+
+    @property
+    def sum(self):
+        """Sum of the members.
+
+        Returns:
+            A float expressed in the scale of the aggregate.
+        """
+        return (self._sum - len(self._values) * self._offset) / self._gain
+
+    @property
+    def mean(self):
+        """Mean of the members.
+
+        Returns:
+            A float expressed in the scale of the aggregate.
+
+        Raises:
+            ValueError if the aggregate is empty.
+        """
+        if not self._values:
+            raise ValueError('empty aggregate')
+        return self._scaled(self._sum / len(self._values))
+
+    @property
+    def min(self):
+        """Minimum of the members.
+
+        Returns:
+            A float expressed in the scale of the aggregate.
+
+        Raises:
+            ValueError if the aggregate is empty.
+        """
+        return self._scaled(self._top(self._low, 1))
+
+    @property
+    def max(self):
+        """Maximum of the members.
+
+        Returns:
+            A float expressed in the scale of the aggregate.
+
+        Raises:
+            ValueError if the aggregate is empty.
+        """
+        return self._scaled(self._top(self._high, -1))
@@ -0,0 +1,297 @@
+"""Scaled arrays.
+
+This module provides the compact storage shared by the array types of the
+quantities (DegreeArray, DistanceArray...).
+
+Copyright (c) 2020 Thierry P.G. DECKER
+All Rights Reserved.
+Released under the MIT license
+
+"""
+
+import array
+
+from siarnaq import dimensions
+
+_storages = {
+    #
+    # Supported storage dtypes: (typecode, fixed point)
+    #
+    'float64': ('d', False),
+    'float32': ('f', False),
+    'int32': ('i', True),
+    'int16': ('h', True),
+}
+
+_epsilons = {
+    #
+    # Unit roundoff of the floating point storages
+    #
+    'float64': 2. ** -53,
+    'float32': 2. ** -24,
+}
+
+
+class ScaledArray:
+    """Scaled array class.
+
+    Base class of the array types. Values share one scale and are stored in
+    an array.array of the requested dtype. Fixed point dtypes store
+    round(value / resolution) integers.
+
+    Subclasses set _quantity to the scalar class the values belong to.
+    """
+    _quantity = None
+
+    def __init__(self, scale, values=(), dtype='float64', resolution=None):
+        """Initialize new array instances.
+
+        Args:
+            scale: A string containing a scale of the quantity.
+            values: An iterable of floats expressed in the given scale.
+            dtype: A string containing the storage dtype.
+            resolution: A float containing the step of the fixed point
+                dtypes (defaults to 0.01). Ignored by the float dtypes.
+
+        Raises:
+            NameError if the given scale or dtype is not supported.
+            ValueError if the given resolution is not positive.
+            OverflowError if a value does not fit in a fixed point dtype.
+        """
+        if scale not in self._quantity._scales:
+            raise NameError(scale)
+        if dtype not in _storages:
+            raise NameError(dtype)
+        typecode, fixed = _storages[dtype]
+        if fixed:
+            resolution = 0.01 if resolution is None else float(resolution)
+            if resolution <= 0:
+                raise ValueError(resolution)
+        else:
+            resolution = None
+        self._scale = scale
+        self._dtype = dtype
+        self._resolution = resolution
+        self._data = array.array(typecode, self._encode(values))
+
+    def _encode(self, values):
+        if self._resolution is None:
+            return [float(value) for value in values]
+        step = self._resolution
+        return [round(float(value) / step) for value in values]
+
+    def _converted(self, scale):
+        """Convert the stored data without decoding it.
+
+        The float dtypes are converted with the conversion function of the
+        quantity, so they give the same values as the objects. The fixed
+        point dtypes fold the scale conversion and the resolution into one
+        affine transform of the stored integers.
+
+        Returns:
+            An array.array holding the data expressed in the given scale.
+        """
+        converter = self._quantity.converter(self._scale, scale)
+        data = self._data
+        if scale == self._scale:
+            return array.array(data.typecode, data)
+        if self._resolution is None:
+            return array.array(data.typecode, map(converter, data))
+        gain, offset = self._quantity.affine(self._scale, scale)
+        offset /= self._resolution
+        return array.array(
+            data.typecode,
+            [round(gain * value + offset) for value in data],
+        )
+
+    @classmethod
+    def _from_data(cls, scale, data, dtype, resolution):
+        new = cls.__new__(cls)
+        new._scale = scale
+        new._dtype = dtype
+        new._resolution = resolution
+        new._data = data
+        return new
+
+    def __len__(self):
+        return len(self._data)
+
+    def __iter__(self):
+        quantity = self._quantity
+        scale = self._scale
+        for value in self.values:
+            yield quantity(scale, value)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._from_data(
+                self._scale,
+                self._data[index],
+                self._dtype,
+                self._resolution,
+            )
+        value = self._data[index]
+        if self._resolution is not None:
+            value *= self._resolution
+        return self._quantity(self._scale, value)
+
+    def __mul__(self, other):
+        if hasattr(other, 'dimension'):
+            return dimensions.combine(self, other, '*')
+        factor = float(other)
+        return type(self)(
+            self._scale,
+            [value * factor for value in self.values],
+            self._dtype,
+            self._resolution,
+        )
+
+    def __rmul__(self, other):
+        return self.__mul__(other)
+
+    def __truediv__(self, other):
+        if hasattr(other, 'dimension'):
+            return dimensions.combine(self, other, '/')
+        return self.__mul__(1 / float(other))
+
+    def __repr__(self):
+        name = type(self).__name__
+        if self._resolution is None:
+            return f'{name}(\'{self._scale}\', {self.values}, ' \
+                   f'dtype=\'{self._dtype}\')'
+        return f'{name}(\'{self._scale}\', {self.values}, ' \
+               f'dtype=\'{self._dtype}\', resolution={self._resolution})'
+
+    @property
+    def scales(self):
+        """Supported scales.
+
+        Returns:
+            A set of the managed scales.
+        """
+        return self._quantity._scales
+
+    @property
+    def dimension(self):
+        """Dimension of the values.
+
+        Returns:
+            A tuple of the exponents of the base dimensions.
+        """
+        return self._quantity.dimension
+
+    @property
+    def scale(self):
+        """Scale of the array.
+
+        Returns:
+            A string containing a scale included in the supported scales set.
+        """
+        return self._scale
+
+    @scale.setter
+    def scale(self, scale):
+        """Set the scale
+
+        Set the scale value and convert the stored values in the new scale.
+
+        Raises:
+             NameError if the given scale is not supported.
+             OverflowError if a converted value does not fit in the dtype.
+        """
+        if scale != self._scale:
+            self._data = self._converted(scale)
+            self._scale = scale
+
+    @property
+    def dtype(self):
+        """Storage dtype of the array.
+
+        Returns:
+            A string containing the storage dtype.
+        """
+        return self._dtype
+
+    @property
+    def resolution(self):
+        """Resolution of the fixed point storage.
+
+        Returns:
+            A float containing the step of the stored integers, or None for
+            the float dtypes.
+        """
+        return self._resolution
+
+    @property
+    def nbytes(self):
+        """Size of the stored data.
+
+        Returns:
+            An int containing the number of bytes used by the values.
+        """
+        return len(self._data) * self._data.itemsize
+
+    @property
+    def values(self):
+        """Values of the array.
+
+        Returns:
+            A list of floats expressed in the scale of the array.
+        """
+        if self._resolution is None:
+            return self._data.tolist()
+        step = self._resolution
+        return [value * step for value in self._data]
+
+    def append(self, value):
+        """Append a value expressed in the scale of the array."""
+        self._data.extend(self._encode((value,)))
+
+    def extend(self, values):
+        """Append values expressed in the scale of the array."""
+        self._data.extend(self._encode(values))
+
+    def to(self, scale):
+        """Convert the array.
+
+        Returns:
+            A new array of the same dtype expressed in the given scale.
+
+        Raises:
+             NameError if the given scale is not supported.
+        """
+        return self._from_data(
+            scale,
+            self._converted(scale),
+            self._dtype,
+            self._resolution,
+        )
+
+    def astype(self, dtype, resolution=None):
+        """Change the storage dtype.
+
+        Returns:
+            A new array of the given dtype in the same scale.
+        """
+        return type(self)(self._scale, self.values, dtype, resolution)
+
+    def conversion_error(self, scale):
+        """Worst-case error of a conversion to the given scale.
+
+        The bound covers the storage rounding of the values and the rounding
+        of the converted values, compared with a float64 conversion of the
+        original readings.
+
+        Returns:
+            A float containing the maximum absolute error, expressed in the
+            given scale.
+        """
+        gain, offset = self._quantity.affine(self._scale, scale)
+        if self._resolution is not None:
+            if scale == self._scale:
+                return self._resolution / 2
+            return (abs(gain) + 1) * self._resolution / 2
+        epsilon = _epsilons[self._dtype]
+        magnitude = max((abs(value) for value in self._data), default=0.)
+        converted = abs(gain) * magnitude + abs(offset)
+        return (abs(gain) * magnitude + converted) * epsilon
@@ -0,0 +1,142 @@
+"""Sensors calibration.
+
+This module applies the linear calibration of sensors to raw readings and
+converts them in the same pass: a calibration (gain, offset) followed by an
+affine scale conversion is itself an affine transform, computed once per
+(sensor, source scale, target scale).
+
+Copyright (c) 2020 Thierry P.G. DECKER
+All Rights Reserved.
+Released under the MIT license
+
+"""
+
+from siarnaq import dimensions
+from siarnaq.degrees import Degree
+
+
+def fuse(gain, offset, quantity, source, target):
+    """Fuse a linear calibration with a scale conversion.
+
+    Args:
+        gain: A float containing the calibration gain.
+        offset: A float containing the calibration offset, in the source
+            scale.
+        quantity: The quantity class of the readings (Degree, Distance...).
+        source: A string containing the native scale of the sensor.
+        target: A string containing the scale to convert to.
+
+    Returns:
+        A (gain, offset) tuple of floats such as
+        target value = gain * raw reading + offset.
+
+    Raises:
+        NameError if one of the given scales is not supported.
+    """
+    conversion_gain, conversion_offset = quantity.affine(source, target)
+    return (
+        conversion_gain * gain,
+        conversion_gain * offset + conversion_offset,
+    )
+
+
+class Calibrations:
+    """Calibrations class.
+
+    Registry of the sensors calibrations, caching the fused transforms.
+    """
+
+    def __init__(self, quantity=Degree):
+        """Initialize new Calibrations instances.
+
+        Args:
+            quantity: The quantity class of the readings.
+        """
+        self._quantity = quantity
+        self._sensors = {}
+        self._fused = {}
+
+    def __len__(self):
+        return len(self._sensors)
+
+    def __contains__(self, sensor):
+        return sensor in self._sensors
+
+    def set(self, sensor, gain=1., offset=0.):
+        """Set the calibration of a sensor.
+
+        calibrated reading = gain * raw reading + offset, in the native
+        scale of the sensor.
+        """
+        self._sensors[sensor] = (float(gain), float(offset))
+        self._fused.pop(sensor, None)
+
+    def remove(self, sensor):
+        """Remove the calibration of a sensor.
+
+        Raises:
+            KeyError if the sensor is not calibrated.
+        """
+        del self._sensors[sensor]
+        self._fused.pop(sensor, None)
+
+    def fused(self, sensor, source, target):
+        """Fused transform of a sensor.
+
+        Returns:
+            A (gain, offset) tuple converting a raw reading of the sensor,
+            in the source scale, into a calibrated value in the target scale.
+
+        Raises:
+            KeyError if the sensor is not calibrated.
+            NameError if one of the given scales is not supported.
+        """
+        transforms = self._fused.get(sensor)
+        if transforms is None:
+            transforms = self._fused[sensor] = {}
+        try:
+            return transforms[(source, target)]
+        except KeyError:
+            gain, offset = self._sensors[sensor]
+            transform = fuse(gain, offset, self._quantity, source, target)
+            transforms[(source, target)] = transform
+            return transform
+
+    def apply(self, sensors, values, source, target):
+        """Calibrate and convert a batch of raw readings.
+
+        Args:
+            sensors: An iterable of the sensor ids of the readings.
+            values: An iterable of the raw readings.
+            source: A string containing the native scale of every reading,
+                or an iterable of the native scale of each reading.
+            target: A string containing the scale to convert to.
+
+        Returns:
+            An array of the quantity expressed in the target scale.
+
+        Raises:
+            KeyError if a sensor is not calibrated.
+            NameError if one of the given scales is not supported.
+        """
+        transforms = {}
+        results = []
+        append = results.append
+        if isinstance(source, str):
+            for sensor, value in zip(sensors, values):
+                try:
+                    gain, offset = transforms[sensor]
+                except KeyError:
+                    gain, offset = transforms[sensor] = self.fused(
+                        sensor, source, target)
+                append(gain * value + offset)
+        else:
+            for sensor, value, scale in zip(sensors, values, source):
+                key = (sensor, scale)
+                try:
+                    gain, offset = transforms[key]
+                except KeyError:
+                    gain, offset = transforms[key] = self.fused(
+                        sensor, scale, target)
+                append(gain * value + offset)
+        return dimensions.array_type(self._quantity)(target, results)
@@ -0,0 +1,287 @@
+"""Time series compression.
+
+This module compresses series of timestamped quantities with the scheme of
+Facebook's Gorilla database (Pelkonen et al., 2015): timestamps are stored
+as variable length deltas of deltas and values as the XOR of each value
+with the previous one, which are mostly zero bits for slowly changing
+channels.
+
+Layout of the encoded bytes:
+    header: magic, version, dimension and scale of the values, block size,
+        number of points and number of blocks.
+    index: first timestamp, byte offset and number of points of each block.
+    blocks: independently decodable bit streams, so a time range is decoded
+        without reading the blocks before it.
+
+Timestamps are ints, for instance epoch seconds or milliseconds.
+
+Copyright (c) 2020 Thierry P.G. DECKER
+All Rights Reserved.
+Released under the MIT license
+
+"""
+
+import array
+import bisect
+import struct
+
+from siarnaq import dimensions
+
+_magic = b'SQGZ'
+_header = struct.Struct('<4sBbbb4sIQI')
+_entry = struct.Struct('<qQI')
+
+
+class _BitWriter:
+    """Bit stream writer."""
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self._pending = 0
+        self._count = 0
+
+    def write(self, value, bits):
+        self._pending = (self._pending << bits) | (value & ((1 << bits) - 1))
+        self._count += bits
+        while self._count >= 8:
+            self._count -= 8
+            self._buffer.append((self._pending >> self._count) & 0xFF)
+        self._pending &= (1 << self._count) - 1
+
+    def getvalue(self):
+        if self._count:
+            return bytes(self._buffer) + bytes(
+                [(self._pending << (8 - self._count)) & 0xFF])
+        return bytes(self._buffer)
+
+
+class _BitReader:
+    """Bit stream reader."""
+
+    def __init__(self, data):
+        self._data = data
+        self._position = 0
+        self._pending = 0
+        self._count = 0
+
+    def read(self, bits):
+        while self._count < bits:
+            self._pending = (self._pending << 8) | self._data[self._position]
+            self._position += 1
+            self._count += 8
+        self._count -= bits
+        value = self._pending >> self._count
+        self._pending &= (1 << self._count) - 1
+        return value
+
+
+def _signed(value, bits):
+    if value >= 1 << (bits - 1):
+        return value - (1 << bits)
+    return value
+
+
+def _encode_block(timestamps, bits):
+    """Encode the timestamps and the float bits of one block."""
+    writer = _BitWriter()
+    write = writer.write
+    previous_time = timestamps[0]
+    previous_delta = 0
+    previous = bits[0]
+    leading = trailing = 64
+    write(previous, 64)
+    for timestamp, value in zip(timestamps[1:], bits[1:]):
+        delta = timestamp - previous_time
+        dod = delta - previous_delta
+        if dod == 0:
+            write(0, 1)
+        elif -64 <= dod <= 63:
+            write(0b10, 2)
+            write(dod, 7)
+        elif -256 <= dod <= 255:
+            write(0b110, 3)
+            write(dod, 9)
+        elif -2048 <= dod <= 2047:
+            write(0b1110, 4)
+            write(dod, 12)
+        else:
+            write(0b1111, 4)
+            write(dod, 64)
+        previous_time = timestamp
+        previous_delta = delta
+
+        xor = value ^ previous
+        previous = value
+        if not xor:
+            write(0, 1)
+            continue
+        new_leading = min(64 - xor.bit_length(), 31)
+        new_trailing = (xor & -xor).bit_length() - 1
+        if new_leading >= leading and new_trailing >= trailing:
+            write(0b10, 2)
+            write(xor >> trailing, 64 - leading - trailing)
+        else:
+            leading = new_leading
+            trailing = new_trailing
+            meaningful = 64 - leading - trailing
+            write(0b11, 2)
+            write(leading, 5)
+            write(meaningful & 63, 6)
+            write(xor >> trailing, meaningful)
+    return writer.getvalue()
+
+
+def _decode_block(data, first_time, count, timestamps, bits):
+    """Decode one block, appending to the timestamps and bits lists."""
+    reader = _BitReader(data)
+    read = reader.read
+    previous_time = first_time
+    previous_delta = 0
+    previous = read(64)
+    leading = trailing = 0
+    timestamps.append(previous_time)
+    bits.append(previous)
+    for _ in range(count - 1):
+        if not read(1):
+            dod = 0
+        elif not read(1):
+            dod = _signed(read(7), 7)
+        elif not read(1):
+            dod = _signed(read(9), 9)
+        elif not read(1):
+            dod = _signed(read(12), 12)
+        else:
+            dod = _signed(read(64), 64)
+        previous_delta += dod
+        previous_time += previous_delta
+        timestamps.append(previous_time)
+
+        if read(1):
+            if read(1):
+                leading = read(5)
+                meaningful = read(6) or 64
+                trailing = 64 - leading - meaningful
+            previous ^= read(64 - leading - trailing) << trailing
+        bits.append(previous)
+
+
+def _integer(timestamp):
+    """Timestamp as an int, rejecting the values int() would truncate."""
+    try:
+        integer = int(timestamp)
+    except OverflowError:
+        raise ValueError(timestamp) from None
+    if integer != timestamp:
+        raise ValueError(timestamp)
+    return integer
+
+
+def encode(timestamps, values, block_size=1024):
+    """Compress a time series.
+
+    Args:
+        timestamps: A sequence of ints. Floats are accepted when they
+            hold an integer value, such as 60.0.
+        values: A quantity array of the same length, in any scale. The
+            values are stored as float64 in the scale of the array.
+        block_size: An int containing the number of points per block.
+
+    Returns:
+        A bytes object.
+
+    Raises:
+        ValueError if the lengths differ, the block size is not positive or
+        a timestamp is not an integer.
+    """
+    if len(timestamps) != len(values):
+        raise ValueError((len(timestamps), len(values)))
+    if block_size <= 0:
+        raise ValueError(block_size)
+    timestamps = [_integer(timestamp) for timestamp in timestamps]
+    bits = array.array('Q')
+    bits.frombytes(array.array('d', values.values).tobytes())
+    index = []
+    blocks = []
+    offset = 0
+    for start in range(0, len(timestamps), block_size):
+        stop = start + block_size
+        block = _encode_block(timestamps[start:stop], bits[start:stop])
+        index.append(_entry.pack(
+            timestamps[start], offset, len(timestamps[start:stop])))
+        blocks.append(block)
+        offset += len(block)
+    header = _header.pack(
+        _magic,
+        1,
+        *values.dimension,
+        values.scale.encode('ascii'),
+        block_size,
+        len(timestamps),
+        len(blocks),
+    )
+    return b''.join([header] + index + blocks)
+
+
+def decode(data, start=None, stop=None):
+    """Decompress a time series.
+
+    Args:
+        data: A bytes-like object returned by encode.
+        start: An optional int, first timestamp to return.
+        stop: An optional int, timestamps from stop on are not returned.
+
+    Returns:
+        A (timestamps, array) tuple, the array being a float64 array of the
+        quantity of the series, in its stored scale. Only the blocks
+        overlapping [start, stop) are decoded.
+
+    Raises:
+        ValueError if the data is not an encoded series, including
+        truncated data.
+    """
+    if len(data) < _header.size:
+        raise ValueError('not an encoded series')
+    magic, version, *dimension, scale, _, _, count = \
+        _header.unpack_from(data)
+    if magic != _magic or version != 1 or \
+            len(data) < _header.size + count * _entry.size:
+        raise ValueError('not an encoded series')
+    try:
+        quantity = dimensions.quantity_type(tuple(dimension))
+    except KeyError:
+        raise ValueError('not an encoded series') from None
+    scale = scale.rstrip(b'\0').decode('ascii')
+    entries = [
+        _entry.unpack_from(data, _header.size + i * _entry.size)
+        for i in range(count)
+    ]
+    base = _header.size + count * _entry.size
+    firsts = [first for first, _, _ in entries]
+    first_block = 0
+    if start is not None:
+        first_block = max(0, bisect.bisect_left(firsts, start) - 1)
+    last_block = count
+    if stop is not None:
+        last_block = bisect.bisect_left(firsts, stop)
+    timestamps = []
+    bits = []
+    for block in range(first_block, last_block):
+        first, offset, points = entries[block]
+        end = base + entries[block + 1][1] if block + 1 < count \
+            else len(data)
+        try:
+            _decode_block(
+                memoryview(data)[base + offset:end], first, points,
+                timestamps, bits)
+        except IndexError:
+            raise ValueError('not an encoded series') from None
+    floats = array.array('d')
+    floats.frombytes(array.array('Q', bits).tobytes())
+    if start is not None or stop is not None:
+        low = 0 if start is None else bisect.bisect_left(timestamps, start)
+        high = len(timestamps) if stop is None \
+            else bisect.bisect_left(timestamps, stop)
+        timestamps = timestamps[low:high]
+        floats = floats[low:high]
+    array_type = dimensions.array_type(quantity)
+    return timestamps, array_type._from_data(scale, floats, 'float64', None)
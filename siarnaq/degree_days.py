@@ -0,0 +1,269 @@
+"""Heating and cooling degree-days.
+
+This module computes daily heating and cooling degree-days from streams of
+timestamped temperatures, for one or many buildings at once.
+
+Two methods are supported:
+    mean: the degree-days of a day are the difference between the base
+        temperature and the mean of the readings of the day.
+    integration: the differences between the base and the readings, linearly
+        interpolated between readings, are integrated over the day. Segments
+        crossing midnight are split, so each day gets its share. The integral
+        is divided by the time the readings cover in the day, so a partly
+        covered first or last day gets the degree-days of the covered part
+        at a daily rate. A day without two readings to interpolate between
+        is not emitted.
+
+Readings of any scale are converted once per chunk into Kelvin, and the
+degree-days are accumulated in Kelvin (or Celcius) degree-days. As they are
+temperature differences, they are expressed in Fahrenheit degree-days by a
+gain, without going back to the readings.
+
+Copyright (c) 2020 Thierry P.G. DECKER
+All Rights Reserved.
+Released under the MIT license
+
+"""
+
+import itertools
+
+from siarnaq import dimensions
+from siarnaq.degrees import Degree
+
+_methods = {
+    #
+    # Supported methods
+    #
+    'mean',  # Difference between the base and the daily mean
+    'integration',  # Integral of the difference between the base and readings
+}
+
+
+def _clipped(start, stop, duration):
+    """Integral of the positive part of a linear function over a segment."""
+    if start >= 0 and stop >= 0:
+        return (start + stop) / 2 * duration
+    if start <= 0 and stop <= 0:
+        return 0.
+    positive = max(start, stop)
+    return positive * positive / (abs(start) + abs(stop)) * duration / 2
+
+
+class DegreeDays:
+    """Degree-days of one day of one group.
+
+    Attributes:
+        group: The key of the group (building...), None for ungrouped input.
+        day: The timestamp of the start of the day.
+    """
+    __slots__ = ('group', 'day', '_heating', '_cooling')
+
+    def __init__(self, group, day, heating, cooling):
+        """Initialize new DegreeDays instances.
+
+        Args:
+            group: The key of the group.
+            day: The timestamp of the start of the day.
+            heating: A float containing the heating degree-days, in Kelvin.
+            cooling: A float containing the cooling degree-days, in Kelvin.
+        """
+        self.group = group
+        self.day = day
+        self._heating = heating
+        self._cooling = cooling
+
+    def __repr__(self):
+        return (f'DegreeDays({self.group!r}, {self.day}, '
+                f'heating={self._heating}, cooling={self._cooling})')
+
+    def heating(self, scale='ce'):
+        """Heating degree-days.
+
+        Args:
+            scale: A string containing the temperature scale of the
+                degree-days: 'ce' and 'ke' give the same value, as do 'fa'
+                and 'ra'.
+
+        Returns:
+            A float.
+
+        Raises:
+            NameError if the given scale is not supported.
+        """
+        if scale not in Degree._scales:
+            raise NameError(scale)
+        return self._heating / Degree._canonical[scale][0]
+
+    def cooling(self, scale='ce'):
+        """Cooling degree-days.
+
+        Returns:
+            A float.
+
+        Raises:
+            NameError if the given scale is not supported.
+        """
+        if scale not in Degree._scales:
+            raise NameError(scale)
+        return self._cooling / Degree._canonical[scale][0]
+
+
+class DegreeDayEngine:
+    """Degree-day engine class.
+
+    Days are [origin + i * day, origin + (i + 1) * day). The degree-days of a
+    day of a group are emitted once a reading of a later day of the group
+    has been fed, or on flush.
+    """
+
+    def __init__(self, base, method='mean', cooling_base=None, day=86400,
+                 origin=0):
+        """Initialize new DegreeDayEngine instances.
+
+        Args:
+            base: A Degree containing the base temperature.
+            method: A string, 'mean' or 'integration'.
+            cooling_base: A Degree containing the base temperature of the
+                cooling degree-days, the base by default.
+            day: A positive number containing the length of a day, in the
+                unit of the timestamps (86400 for epoch seconds).
+            origin: A number containing the start of a day, for instance
+                to follow a local time zone.
+
+        Raises:
+            NameError if the method is not supported.
+            ValueError if the day length is not positive.
+        """
+        if method not in _methods:
+            raise NameError(method)
+        if day <= 0:
+            raise ValueError(day)
+        if cooling_base is None:
+            cooling_base = base
+        self._heating_base = base.kelvin
+        self._cooling_base = cooling_base.kelvin
+        self._integration = method == 'integration'
+        self._day = day
+        self._origin = origin
+        self._states = {}
+
+    def _emit(self, group, state, results):
+        index, _, _, total, count, heating, cooling, covered = state
+        day = self._origin + index * self._day
+        if self._integration:
+            if covered:
+                results.append(DegreeDays(
+                    group, day, heating / covered, cooling / covered))
+        elif count:
+            mean = total / count
+            results.append(DegreeDays(
+                group, day,
+                max(0., self._heating_base - mean),
+                max(0., mean - self._cooling_base)))
+        state[3:] = [0., 0, 0., 0., 0.]
+
+    def _integrate(self, state, stop_time, stop):
+        """Add the segment from the previous reading to the open day."""
+        start_time, start = state[1:3]
+        duration = stop_time - start_time
+        state[7] += duration
+        state[5] += _clipped(
+            self._heating_base - start, self._heating_base - stop, duration)
+        state[6] += _clipped(
+            start - self._cooling_base, stop - self._cooling_base, duration)
+
+    def feed(self, timestamps, temps, groups=None):
+        """Feed a chunk of readings.
+
+        Args:
+            timestamps: A sequence of numbers, in increasing order within
+                each group and after the previous chunks of the group.
+            temps: A DegreeArray of the same length, in any scale.
+            groups: An optional sequence of the same length of the group
+                keys (building ids...) of the readings.
+
+        Returns:
+            A list of the DegreeDays of the days completed by the chunk.
+
+        Raises:
+            ValueError if the lengths differ or timestamps are out of order.
+            TypeError if the readings are not temperatures.
+        """
+        if temps.dimension != dimensions.TEMPERATURE:
+            raise TypeError(type(temps).__name__)
+        if len(timestamps) != len(temps):
+            raise ValueError((len(timestamps), len(temps)))
+        if groups is None:
+            groups = itertools.repeat(None)
+        elif len(groups) != len(temps):
+            raise ValueError((len(groups), len(temps)))
+        gain, offset = Degree._canonical[temps.scale]
+        kelvins = [gain * value + offset for value in temps.values]
+        states = self._states
+        origin = self._origin
+        length = self._day
+        integration = self._integration
+        results = []
+        for group, timestamp, kelvin in zip(groups, timestamps, kelvins):
+            index = (timestamp - origin) // length
+            state = states.get(group)
+            if state is None:
+                states[group] = [index, timestamp, kelvin, kelvin, 1,
+                                 0., 0., 0.]
+                continue
+            if timestamp < state[1]:
+                raise ValueError(timestamp)
+            if integration:
+                while index > state[0]:
+                    boundary = origin + (state[0] + 1) * length
+                    start_time, start = state[1:3]
+                    middle = start + (kelvin - start) \
+                        * (boundary - start_time) / (timestamp - start_time)
+                    self._integrate(state, boundary, middle)
+                    self._emit(group, state, results)
+                    state[0] += 1
+                    state[1] = boundary
+                    state[2] = middle
+                self._integrate(state, timestamp, kelvin)
+            elif index > state[0]:
+                self._emit(group, state, results)
+                state[0] = index
+            state[1] = timestamp
+            state[2] = kelvin
+            state[3] += kelvin
+            state[4] += 1
+        return results
+
+    def flush(self):
+        """Emit the open days of every group.
+
+        Returns:
+            A list of DegreeDays.
+        """
+        results = []
+        for group, state in self._states.items():
+            self._emit(group, state, results)
+        self._states = {}
+        return results
+
+
+def degree_days(timestamps, temps, base, method='mean', groups=None,
+                cooling_base=None, day=86400, origin=0):
+    """Degree-days of whole series.
+
+    Args:
+        timestamps: A sequence of numbers, increasing within each group.
+        temps: A DegreeArray of the same length.
+        base: A Degree containing the base temperature.
+        method: A string, 'mean' or 'integration'.
+        groups: An optional sequence of the group keys of the readings.
+        cooling_base: A Degree containing the base temperature of the
+            cooling degree-days, the base by default.
+        day: A positive number containing the length of a day.
+        origin: A number containing the start of a day.
+
+    Returns:
+        A list of DegreeDays.
+    """
+    engine = DegreeDayEngine(base, method, cooling_base, day, origin)
+    return engine.feed(timestamps, temps, groups) + engine.flush()
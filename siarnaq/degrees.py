@@ -8,6 +8,11 @@ Released under the MIT license
 
 """
 
+from fractions import Fraction
+
+from siarnaq import dimensions
+from siarnaq.arrays import ScaledArray
+
 
 class Degree:
     """Degree class.
@@ -22,6 +27,39 @@ class Degree:
         'ke',  # Kelvin
         'ra'  # Rankine
     }
+    _exact = {
+        #
+        # Exact affine coefficients (gain, offset) from each scale to Kelvin,
+        # from which the affine conversions between scales are composed
+        #
+        'ce': (Fraction(1), Fraction('273.15')),
+        'fa': (Fraction(5, 9), Fraction('459.67') * Fraction(5, 9)),
+        'ke': (Fraction(1), Fraction(0)),
+        'ra': (Fraction(5, 9), Fraction(0)),
+    }
+    _canonical = {
+        #
+        # Affine coefficients (gain, offset) from each scale to Kelvin
+        #
+        'ce': (1., 273.15),
+        'fa': (5 / 9, 459.67 * 5 / 9),
+        'ke': (1., 0.),
+        'ra': (5 / 9, 0.),
+    }
+    _symbols = {
+        'ce': '°C',
+        'fa': '°F',
+        'ke': 'K',
+        'ra': '°Ra',
+    }
+    dimension = dimensions.TEMPERATURE
+    _base = 'ke'
+    _preferred = {}
+    #
+    # The views of the temperature in each scale are cached in the _ce, _fa,
+    # _ke and _ra slots, None until they are first read
+    #
+    __slots__ = ('_scale', '_temp', '_ce', '_fa', '_ke', '_ra', '__weakref__')
 
     def __init__(self, scale='ce', temp=0.):
         """Initialize new Degree instances.
@@ -33,6 +71,7 @@ class Degree:
             raise NameError(scale)
         self._scale = scale
         self._temp = float(temp)
+        self._ce = self._fa = self._ke = self._ra = None
 
     def __add__(self, other):
         new_scale = self.scale
@@ -48,7 +87,7 @@ class Degree:
                 new_temp += other.rankine
         else:
             new_temp += float(other)
-        return Degree(scale=new_scale, temp=new_temp)
+        return type(self)(scale=new_scale, temp=new_temp)
 
     def __radd__(self, other):
         return self.__add__(other)
@@ -67,29 +106,35 @@ class Degree:
                 new_temp -= other.rankine
         else:
             new_temp -= float(other)
-        return Degree(scale=new_scale, temp=new_temp)
+        return type(self)(scale=new_scale, temp=new_temp)
 
     def __mul__(self, other):
-        return Degree(scale=self.scale, temp=self.temp * float(other))
+        if hasattr(other, 'dimension'):
+            return dimensions.combine(self, other, '*')
+        return type(self)(scale=self.scale, temp=self.temp * float(other))
 
     def __rmul__(self, other):
         return self.__mul__(other)
 
     def __truediv__(self, other):
-        return Degree(scale=self.scale, temp=self.temp / float(other))
+        if hasattr(other, 'dimension'):
+            return dimensions.combine(self, other, '/')
+        return type(self)(scale=self.scale, temp=self.temp / float(other))
 
     def __str__(self):
-        if self.scale == 'ce':
-            return f'{self.temp} °C'
-        if self.scale == 'fa':
-            return f'{self.temp} °F'
-        if self.scale == 'ke':
-            return f'{self.temp} K'
-        if self.scale == 'ra':
-            return f'{self.temp} °Ra'
+        return f'{self.temp} {self._symbols[self.scale]}'
 
     def __repr__(self):
-        return f'Degree(\'{self.scale}\', {self.temp})'
+        return f'{type(self).__name__}(\'{self.scale}\', {self.temp})'
+
+    def __getstate__(self):
+        # The slots rule out the default state of the pickle protocols 0
+        # and 1, and the cached views are not worth storing
+        return self._scale, self._temp
+
+    def __setstate__(self, state):
+        self._scale, self._temp = state
+        self._ce = self._fa = self._ke = self._ra = None
 
     @property
     def scales(self):
@@ -122,36 +167,9 @@ class Degree:
             raise NameError(scale)
 
         if scale != self._scale:
-
-            if self._scale == 'ce' and scale == 'fa':
-                self._temp = self.conv_ce_to_fa(temp=self._temp)
-            if self._scale == 'ce' and scale == 'ke':
-                self._temp = self.conv_ce_to_ke(temp=self._temp)
-            if self._scale == 'ce' and scale == 'ra':
-                self._temp = self.conv_ce_to_ra(temp=self._temp)
-
-            if self._scale == 'fa' and scale == 'ce':
-                self._temp = self.conv_fa_to_ce(temp=self._temp)
-            if self._scale == 'fa' and scale == 'ke':
-                self._temp = self.conv_fa_to_ke(temp=self._temp)
-            if self._scale == 'fa' and scale == 'ra':
-                self._temp = self.conv_fa_to_ra(temp=self._temp)
-
-            if self._scale == 'ke' and scale == 'ce':
-                self._temp = self.conv_ke_to_ce(temp=self._temp)
-            if self._scale == 'ke' and scale == 'fa':
-                self._temp = self.conv_ke_to_fa(temp=self._temp)
-            if self._scale == 'ke' and scale == 'ra':
-                self._temp = self.conv_ke_to_ra(temp=self._temp)
-
-            if self._scale == 'ra' and scale == 'ce':
-                self._temp = self.conv_ra_to_ce(temp=self._temp)
-            if self._scale == 'ra' and scale == 'fa':
-                self._temp = self.conv_ra_to_fa(temp=self._temp)
-            if self._scale == 'ra' and scale == 'ke':
-                self._temp = self.conv_ra_to_ke(temp=self._temp)
-
+            self._temp = self._view(scale)
             self._scale = scale
+            self._ce = self._fa = self._ke = self._ra = None
 
     @property
     def temp(self):
@@ -171,6 +189,30 @@ class Degree:
         """
         if float(temp) != self._temp:
             self._temp = float(temp)
+            self._ce = self._fa = self._ke = self._ra = None
+
+    @property
+    def value(self):
+        """Value of the object, expressed in its scale.
+
+        Same as the temp property, for the code handling any quantity.
+
+        Returns:
+            A float.
+        """
+        return self._temp
+
+    def _view(self, scale):
+        """Compute the temperature in the given scale and cache it.
+
+        The cache is emptied by the scale and temp setters.
+
+        Returns:
+            A float containing the temperature in the given scale.
+        """
+        view = self.converter(self._scale, scale)(self._temp)
+        setattr(self, '_' + scale, view)
+        return view
 
     @property
     def celcius(self):
@@ -179,14 +221,10 @@ class Degree:
         Returns:
             A float containg the Celcius value.
         """
-        if self._scale == 'ce':
-            return self._temp
-        if self._scale == 'fa':
-            return self.conv_fa_to_ce(self._temp)
-        if self._scale == 'ke':
-            return self.conv_ke_to_ce(self._temp)
-        if self._scale == 'ra':
-            return self.conv_ra_to_ce(self._temp)
+        view = self._ce
+        if view is None:
+            view = self._view('ce')
+        return view
 
     @property
     def fahrenheit(self):
@@ -195,14 +233,10 @@ class Degree:
         Returns:
             A float containing the Fahrenheit value.
         """
-        if self._scale == 'ce':
-            return self.conv_ce_to_fa(self._temp)
-        if self._scale == 'fa':
-            return self._temp
-        if self._scale == 'ke':
-            return self.conv_ke_to_fa(self._temp)
-        if self._scale == 'ra':
-            return self.conv_ra_to_fa(self._temp)
+        view = self._fa
+        if view is None:
+            view = self._view('fa')
+        return view
 
     @property
     def kelvin(self):
@@ -211,14 +245,10 @@ class Degree:
         Returns:
             A float containing the Kelvine value.
         """
-        if self._scale == 'ce':
-            return self.conv_ce_to_ke(self._temp)
-        if self._scale == 'fa':
-            return self.conv_fa_to_ke(self._temp)
-        if self._scale == 'ke':
-            return self._temp
-        if self._scale == 'ra':
-            return self.conv_ra_to_ke(self._temp)
+        view = self._ke
+        if view is None:
+            view = self._view('ke')
+        return view
 
     @property
     def rankine(self):
@@ -227,14 +257,123 @@ class Degree:
         Returns:
             A float containing the Fahrenheit value.
         """
-        if self._scale == 'ce':
-            return self.conv_ce_to_ra(self._temp)
-        if self._scale == 'fa':
-            return self.conv_fa_to_ra(self._temp)
-        if self._scale == 'ke':
-            return self.conv_ke_to_ra(self.temp)
-        if self._scale == 'ra':
-            return self._temp
+        view = self._ra
+        if view is None:
+            view = self._view('ra')
+        return view
+
+    def in_scale(self, scale):
+        """Temperature of the object in the given scale.
+
+        The converted values are cached until the object changes.
+
+        Returns:
+            A float.
+
+        Raises:
+            NameError if the given scale is not supported.
+        """
+        if scale not in self._scales:
+            raise NameError(scale)
+        view = getattr(self, '_' + scale)
+        if view is None:
+            view = self._view(scale)
+        return view
+
+    def to(self, scale):
+        """Same degree expressed in another scale.
+
+        Returns:
+            A new object of the same class, the object being left unchanged.
+
+        Raises:
+            NameError if the given scale is not supported.
+        """
+        return type(self)(scale, self.in_scale(scale))
+
+    @classmethod
+    def converter(cls, source, target):
+        """Conversion function between two scales.
+
+        Args:
+            source: A string containing the scale to convert from.
+            target: A string containing the scale to convert to.
+
+        Returns:
+            A function converting a float from the source scale to the
+            target scale.
+
+        Raises:
+            NameError if one of the given scales is not supported.
+        """
+        for scale in (source, target):
+            if scale not in cls._scales:
+                raise NameError(scale)
+        if source == target:
+            return float
+        return getattr(cls, f'conv_{source}_to_{target}')
+
+    @classmethod
+    def affine(cls, source, target):
+        """Affine coefficients of a scale conversion.
+
+        Args:
+            source: A string containing the scale to convert from.
+            target: A string containing the scale to convert to.
+
+        Returns:
+            A (gain, offset) tuple of floats such as
+            target value = gain * source value + offset.
+
+        Raises:
+            NameError if one of the given scales is not supported.
+        """
+        for scale in (source, target):
+            if scale not in cls._scales:
+                raise NameError(scale)
+        #
+        # The coefficients are composed from the exact ones, and rounded
+        # once
+        #
+        source_gain, source_offset = cls._exact[source]
+        target_gain, target_offset = cls._exact[target]
+        return (
+            float(source_gain / target_gain),
+            float((source_offset - target_offset) / target_gain),
+        )
+
+    @classmethod
+    def from_values(cls, scale, values, array=False):
+        """Create many Degree objects sharing the same scale.
+
+        The scale is validated once and the objects are built without going
+        through __init__, which saves the per value scale check.
+
+        Args:
+            scale: A string containing the scale of the values.
+            values: An iterable of numbers.
+            array: A boolean, True to return a DegreeArray instead of a list.
+
+        Returns:
+            A list of Degree objects, or a DegreeArray.
+
+        Raises:
+            NameError if the given scale is not supported.
+        """
+        if scale not in cls._scales:
+            raise NameError(scale)
+        if array:
+            return DegreeArray(scale, values)
+        new = cls.__new__
+        instances = []
+        append = instances.append
+        for value in map(float, values):
+            instance = new(cls)
+            instance._scale = scale
+            instance._temp = value
+            instance._ce = instance._fa = instance._ke = instance._ra = None
+            append(instance)
+        return instances
 
     @staticmethod
     def conv_ce_to_fa(temp):
@@ -379,3 +518,93 @@ class Degree:
             A Float containing the Kelvin value.
         """
         return temp / 1.8
+
+
+class FrozenDegree(Degree):
+    """Immutable Degree class.
+
+    The scale and temp setters raise AttributeError: conversions go
+    through the to method, which returns a new object. FrozenDegree objects
+    can be shared between threads without locks, and are hashable so they
+    can be used as dict keys. Two objects are equal when they have the same
+    scale and the same temp.
+    """
+    __slots__ = ()
+
+    @Degree.scale.setter
+    def scale(self, scale):
+        raise AttributeError(f'{type(self).__name__} objects are immutable')
+
+    @Degree.temp.setter
+    def temp(self, temp):
+        raise AttributeError(f'{type(self).__name__} objects are immutable')
+
+    def __eq__(self, other):
+        if isinstance(other, FrozenDegree):
+            return (self._scale, self._temp) == (other._scale, other._temp)
+        return NotImplemented
+
+    def __hash__(self):
+        return hash((self._scale, self._temp))
+
+
+class ObservableDegree(Degree):
+    """Observable Degree class.
+
+    The scale and temp setters call the observers of the object, with the
+    object as argument, after each assignment. Plain Degree objects are not
+    observable, so they pay nothing for it.
+    """
+    __slots__ = ('_observers',)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._observers = []
+
+    def __setstate__(self, state):
+        # Copies and unpickled objects start without observers
+        super().__setstate__(state)
+        self._observers = []
+
+    @Degree.scale.setter
+    def scale(self, scale):
+        Degree.scale.fset(self, scale)
+        for observer in self._observers:
+            observer(self)
+
+    @Degree.temp.setter
+    def temp(self, temp):
+        Degree.temp.fset(self, temp)
+        for observer in self._observers:
+            observer(self)
+
+    @classmethod
+    def from_values(cls, scale, values, array=False):
+        instances = super().from_values(scale, values, array)
+        if not array:
+            for instance in instances:
+                instance._observers = []
+        return instances
+
+    def observe(self, observer):
+        """Register an observer, a function taking the object."""
+        self._observers.append(observer)
+
+    def unobserve(self, observer):
+        """Unregister an observer.
+
+        Raises:
+            ValueError if the observer is not registered.
+        """
+        self._observers.remove(observer)
+
+
+class DegreeArray(ScaledArray):
+    """Degree array class.
+
+    A compact container of temperatures sharing one scale.
+    """
+    _quantity = Degree
+
+
+dimensions.register(Degree, DegreeArray)
@@ -0,0 +1,398 @@
+"""Dimensional analysis.
+
+This module derives quantities such as speeds from the products and
+quotients of other quantities.
+
+Dimensions are tuples of integer exponents of the base dimensions
+(length, time, temperature): a speed is (1, -1, 0). Each quantity class is
+registered under its dimension, and the class resulting from an operation
+is looked up once per pair of classes.
+
+Values are combined in the canonical units of the library (kilometer, hour),
+so the canonical unit of a derived quantity is the combination of the
+canonical units of its factors (km/h for speeds). Temperatures, whose scales
+are affine, are not combined.
+
+Copyright (c) 2020 Thierry P.G. DECKER
+All Rights Reserved.
+Released under the MIT license
+
+"""
+
+import functools
+import importlib
+
+LENGTH = (1, 0, 0)
+TIME = (0, 1, 0)
+TEMPERATURE = (0, 0, 1)
+DIMENSIONLESS = (0, 0, 0)
+
+_registry = {}
+_arrays = {}
+_modules = (
+    #
+    # Modules registering the quantities of the library
+    #
+    'siarnaq.degrees',
+    'siarnaq.distances',
+    'siarnaq.durations',
+    'siarnaq.speeds',
+)
+
+
+def register(quantity, array=None):
+    """Register a quantity class under its dimension.
+
+    Args:
+        quantity: A class with dimension, _scales, _canonical, _base and
+            _preferred attributes.
+        array: The ScaledArray subclass holding values of the quantity.
+    """
+    _registry[quantity.dimension] = quantity
+    if array is not None:
+        _arrays[quantity] = array
+    result_type.cache_clear()
+
+
+def array_type(quantity):
+    """Array class of a quantity class.
+
+    Subclasses of a registered quantity share its array class.
+
+    Returns:
+        The registered ScaledArray subclass.
+
+    Raises:
+        KeyError if the quantity has no registered array class.
+    """
+    for cls in quantity.__mro__:
+        if cls in _arrays:
+            return _arrays[cls]
+    raise KeyError(quantity)
+
+
+def quantity_type(dimension):
+    """Quantity class registered under a dimension.
+
+    Returns:
+        The registered quantity class.
+
+    Raises:
+        KeyError if no quantity is registered under the dimension.
+    """
+    if dimension not in _registry:
+        for module in _modules:
+            importlib.import_module(module)
+    return _registry[dimension]
+
+
+def product(left, right):
+    """Dimension of a product.
+
+    Returns:
+        A tuple of ints.
+    """
+    return tuple(a + b for a, b in zip(left, right))
+
+
+def quotient(left, right):
+    """Dimension of a quotient.
+
+    Returns:
+        A tuple of ints.
+    """
+    return tuple(a - b for a, b in zip(left, right))
+
+
+@functools.lru_cache(maxsize=None)
+def result_type(left, right, operation):
+    """Quantity class resulting from an operation between two classes.
+
+    Args:
+        left: The quantity class of the left operand.
+        right: The quantity class of the right operand.
+        operation: A string, '*' or '/'.
+
+    Quantities with affine scales, such as temperatures, can not be
+    combined: their canonical values are absolute (Kelvin), so the product
+    or quotient of two Celcius temperatures would not be what the users of
+    the scale expect, and there is no temperature difference quantity to
+    express heating rates.
+
+    Returns:
+        The registered quantity class, or float for dimensionless results.
+
+    Raises:
+        TypeError if one of the classes has an affine scale, or if no
+        quantity is registered under the resulting dimension.
+    """
+    for quantity in (left, right):
+        if any(offset for _, offset in quantity._canonical.values()):
+            raise TypeError(
+                f'{left.__name__} {operation} {right.__name__}: '
+                f'{quantity.__name__} scales are affine')
+    if operation == '*':
+        dimension = product(left.dimension, right.dimension)
+    else:
+        dimension = quotient(left.dimension, right.dimension)
+    if dimension == DIMENSIONLESS:
+        return float
+    try:
+        return quantity_type(dimension)
+    except KeyError:
+        raise TypeError(
+            f'{left.__name__} {operation} {right.__name__}') from None
+
+
+def _canonical_values(operand):
+    """Split an operand into its quantity class and canonical values.
+
+    Returns:
+        A (quantity, scale, values, is_array) tuple, values being a list of
+        floats expressed in the canonical unit of the quantity.
+    """
+    quantity = getattr(operand, '_quantity', None)
+    if quantity is not None:
+        gain, offset = quantity._canonical[operand.scale]
+        values = [gain * value + offset for value in operand.values]
+        return quantity, operand.scale, values, True
+    quantity = type(operand)
+    gain, offset = quantity._canonical[operand.scale]
+    return quantity, operand.scale, [gain * operand.value + offset], False
+
+
+def combine(left, right, operation):
+    """Multiply or divide two quantities or quantity arrays.
+
+    The dimensions are checked once, whatever the size of the operands.
+    The result is expressed in the scale the result class prefers for the
+    scale of the left operand (a quotient of miles is in mph).
+
+    Args:
+        left: A quantity or quantity array.
+        right: A quantity or quantity array.
+        operation: A string, '*' or '/'.
+
+    Returns:
+        A quantity (or a float if dimensionless) when both operands are
+        scalars, otherwise an array (or a list of floats if dimensionless).
+
+    Raises:
+        TypeError if the resulting dimension is not registered.
+        ValueError if two arrays do not share the same length.
+    """
+    left_quantity, scale, left_values, left_array = _canonical_values(left)
+    right_quantity, _, right_values, right_array = _canonical_values(right)
+    result = result_type(left_quantity, right_quantity, operation)
+    if left_array and right_array:
+        if len(left_values) != len(right_values):
+            raise ValueError((len(left_values), len(right_values)))
+    elif left_array:
+        right_values = right_values * len(left_values)
+    elif right_array:
+        left_values = left_values * len(right_values)
+    if operation == '*':
+        values = [a * b for a, b in zip(left_values, right_values)]
+    else:
+        values = [a / b for a, b in zip(left_values, right_values)]
+    if result is float:
+        return values if left_array or right_array else values[0]
+    scale = result._preferred.get(scale, result._base)
+    gain, offset = result._canonical[scale]
+    values = [(value - offset) / gain for value in values]
+    if left_array or right_array:
+        return array_type(result)(scale, values)
+    return result(scale, values[0])
+
+
+class Quantity:
+    """Quantity class.
+
+    Base class of the derived quantities. Subclasses describe their scales
+    with class attributes:
+
+        dimension: A tuple of the exponents of the base dimensions.
+        _scales: A set of the supported scales.
+        _canonical: A dict of (gain, offset) from each scale to the
+            canonical unit.
+        _symbols: A dict of the unit symbol of each scale.
+        _base: A string containing the default scale.
+        _preferred: A dict of the scale used when the quantity results from
+            an operation, by scale of the left operand.
+    """
+    dimension = DIMENSIONLESS
+    _scales = set()
+    _canonical = {}
+    _symbols = {}
+    _base = None
+    _preferred = {}
+
+    def __init__(self, scale=None, value=0.):
+        """Initialize new instances.
+
+        Raises:
+            NameError if the given scale is not supported.
+        """
+        if scale is None:
+            scale = self._base
+        if scale not in self._scales:
+            raise NameError(scale)
+        self._scale = scale
+        self._value = float(value)
+        self._views = None
+
+    def __add__(self, other):
+        if isinstance(other, type(self)):
+            return type(self)(self._scale, self._value + other.in_scale(
+                self._scale))
+        return type(self)(self._scale, self._value + float(other))
+
+    def __radd__(self, other):
+        return self.__add__(other)
+
+    def __sub__(self, other):
+        if isinstance(other, type(self)):
+            return type(self)(self._scale, self._value - other.in_scale(
+                self._scale))
+        return type(self)(self._scale, self._value - float(other))
+
+    def __mul__(self, other):
+        if hasattr(other, 'dimension'):
+            return combine(self, other, '*')
+        return type(self)(self._scale, self._value * float(other))
+
+    def __rmul__(self, other):
+        return self.__mul__(other)
+
+    def __truediv__(self, other):
+        if hasattr(other, 'dimension'):
+            return combine(self, other, '/')
+        return type(self)(self._scale, self._value / float(other))
+
+    def __str__(self):
+        return f'{self._value} {self._symbols[self._scale]}'
+
+    def __repr__(self):
+        return f'{type(self).__name__}(\'{self._scale}\', {self._value})'
+
+    @property
+    def scales(self):
+        """Supported scales.
+
+        Returns:
+            A set of the managed scales.
+        """
+        return self._scales
+
+    @property
+    def scale(self):
+        """Scale of the object.
+
+        Returns:
+            A string containing a scale included in the supported scales set.
+        """
+        return self._scale
+
+    @scale.setter
+    def scale(self, scale):
+        """Set the scale
+
+        Set the scale value and convert the value in the new scale.
+
+        Raises:
+             NameError if the given scale is not supported.
+        """
+        if scale not in self._scales:
+            raise NameError(scale)
+
+        if scale != self._scale:
+            self._value = self.in_scale(scale)
+            self._scale = scale
+            self._views = None
+
+    @property
+    def value(self):
+        """Value of the object, expressed in its scale.
+
+        Returns:
+            A float.
+        """
+        return self._value
+
+    @value.setter
+    def value(self, value):
+        """Set the value
+
+        """
+        if float(value) != self._value:
+            self._value = float(value)
+            self._views = None
+
+    def in_scale(self, scale):
+        """Value of the object in the given scale.
+
+        The converted values are cached, in a dict created on the first
+        conversion, until the object changes.
+
+        Returns:
+            A float.
+
+        Raises:
+            NameError if the given scale is not supported.
+        """
+        views = self._views
+        if views is None:
+            views = self._views = {}
+        elif scale in views:
+            return views[scale]
+        view = self.converter(self._scale, scale)(self._value)
+        views[scale] = view
+        return view
+
+    def to(self, scale):
+        """Same quantity expressed in another scale.
+
+        Returns:
+            A new object of the same class, the object being left unchanged.
+
+        Raises:
+            NameError if the given scale is not supported.
+        """
+        return type(self)(scale, self.in_scale(scale))
+
+    @classmethod
+    def affine(cls, source, target):
+        """Affine coefficients of a scale conversion.
+
+        Returns:
+            A (gain, offset) tuple of floats such as
+            target value = gain * source value + offset.
+
+        Raises:
+            NameError if one of the given scales is not supported.
+        """
+        for scale in (source, target):
+            if scale not in cls._scales:
+                raise NameError(scale)
+        source_gain, source_offset = cls._canonical[source]
+        target_gain, target_offset = cls._canonical[target]
+        return (
+            source_gain / target_gain,
+            (source_offset - target_offset) / target_gain,
+        )
+
+    @classmethod
+    def converter(cls, source, target):
+        """Conversion function between two scales.
+
+        Returns:
+            A function converting a float from the source scale to the
+            target scale.
+
+        Raises:
+            NameError if one of the given scales is not supported.
+        """
+        gain, offset = cls.affine(source, target)
+        if source == target:
+            return float
+        return lambda value: gain * value + offset
@@ -6,6 +6,9 @@ Released under the MIT license
 
 """
 
+from siarnaq import dimensions
+from siarnaq.arrays import ScaledArray
+
 
 class Distance:
     """Distance class.
@@ -15,6 +18,31 @@ class Distance:
         'km',  # Kilometer
         'mi',  # Mile
     }
+    _canonical = {
+        #
+        # Affine coefficients (gain, offset) from each scale to Kilometer
+        #
+        'km': (1., 0.),
+        'mi': (1.609, 0.),
+    }
+    _symbols = {
+        'km': 'km',
+        'mi': 'mi',
+    }
+    dimension = dimensions.LENGTH
+    _base = 'km'
+    _preferred = {
+        #
+        # Speed scale of the left operand: distance scale
+        #
+        'kmh': 'km',
+        'mph': 'mi',
+    }
+    #
+    # The views of the distance in each scale are cached in the _km and _mi
+    # slots, None until they are first read
+    #
+    __slots__ = ('_scale', '_dist', '_km', '_mi', '__weakref__')
 
     def __init__(self, scale='km', dist=0.):
         """Initialize new Distance instances.
@@ -26,6 +54,7 @@ class Distance:
             raise NameError(scale)
         self._scale = scale
         self._dist = float(dist)
+        self._km = self._mi = None
 
     def __add__(self, other):
         new_scale = self.scale
@@ -37,7 +66,7 @@ class Distance:
                 new_dist += other.mile
         else:
             new_dist += float(other)
-        return Distance(scale=new_scale, dist=new_dist)
+        return type(self)(scale=new_scale, dist=new_dist)
 
     def __radd__(self, other):
         return self.__add__(other)
@@ -52,25 +81,35 @@ class Distance:
                 new_dist -= other.mile
         else:
             new_dist -= float(other)
-        return Distance(scale=new_scale, dist=new_dist)
+        return type(self)(scale=new_scale, dist=new_dist)
 
     def __mul__(self, other):
-        return Distance(scale=self.scale, dist=self.dist * float(other))
+        if hasattr(other, 'dimension'):
+            return dimensions.combine(self, other, '*')
+        return type(self)(scale=self.scale, dist=self.dist * float(other))
 
     def __rmul__(self, other):
         return self.__mul__(other)
 
     def __truediv__(self, other):
-        return Distance(scale=self.scale, dist=self.dist / float(other))
+        if hasattr(other, 'dimension'):
+            return dimensions.combine(self, other, '/')
+        return type(self)(scale=self.scale, dist=self.dist / float(other))
 
     def __str__(self):
-        if self.scale == 'km':
-            return f'{self.dist} km'
-        if self.scale == 'mi':
-            return f'{self.dist} mi'
+        return f'{self.dist} {self._symbols[self.scale]}'
 
     def __repr__(self):
-        return f'Distance(\'{self.scale}\', {self.dist})'
+        return f'{type(self).__name__}(\'{self.scale}\', {self.dist})'
+
+    def __getstate__(self):
+        # The slots rule out the default state of the pickle protocols 0
+        # and 1, and the cached views are not worth storing
+        return self._scale, self._dist
+
+    def __setstate__(self, state):
+        self._scale, self._dist = state
+        self._km = self._mi = None
 
     @property
     def scales(self):
@@ -103,13 +142,9 @@ class Distance:
             raise NameError(scale)
 
         if scale != self._scale:
-
-            if self._scale == 'km' and scale == 'mi':
-                self.dist = self.conv_km_to_mi(dist=self.dist)
-            if self._scale == 'mi' and scale == 'km':
-                self.dist = self.conv_mi_to_km(dist=self.dist)
-
+            self._dist = self._view(scale)
             self._scale = scale
+            self._km = self._mi = None
 
     @property
     def dist(self):
@@ -127,6 +162,30 @@ class Distance:
         """
         if float(dist) != self._dist:
             self._dist = float(dist)
+            self._km = self._mi = None
+
+    @property
+    def value(self):
+        """Value of the object, expressed in its scale.
+
+        Same as the dist property, for the code handling any quantity.
+
+        Returns:
+            A float.
+        """
+        return self._dist
+
+    def _view(self, scale):
+        """Compute the distance in the given scale and cache it.
+
+        The cache is emptied by the scale and dist setters.
+
+        Returns:
+            A float containing the distance in the given scale.
+        """
+        view = self.converter(self._scale, scale)(self._dist)
+        setattr(self, '_' + scale, view)
+        return view
 
     @property
     def kilometer(self):
@@ -135,10 +194,10 @@ class Distance:
         Returns:
             A float containg the Kilometer value.
         """
-        if self._scale == 'km':
-            return self._dist
-        if self._scale == 'mi':
-            return self.conv_mi_to_km(self._dist)
+        view = self._km
+        if view is None:
+            view = self._view('km')
+        return view
 
     @property
     def mile(self):
@@ -147,10 +206,119 @@ class Distance:
         Returns:
             A float containg the Mile value.
         """
-        if self._scale == 'km':
-            return self.conv_km_to_mi(self._dist)
-        if self._scale == 'mi':
-            return self._dist
+        view = self._mi
+        if view is None:
+            view = self._view('mi')
+        return view
+
+    def in_scale(self, scale):
+        """Distance of the object in the given scale.
+
+        The converted values are cached until the object changes.
+
+        Returns:
+            A float.
+
+        Raises:
+            NameError if the given scale is not supported.
+        """
+        if scale not in self._scales:
+            raise NameError(scale)
+        view = getattr(self, '_' + scale)
+        if view is None:
+            view = self._view(scale)
+        return view
+
+    def to(self, scale):
+        """Same distance expressed in another scale.
+
+        Returns:
+            A new object of the same class, the object being left unchanged.
+
+        Raises:
+            NameError if the given scale is not supported.
+        """
+        return type(self)(scale, self.in_scale(scale))
+
+    @classmethod
+    def converter(cls, source, target):
+        """Conversion function between two scales.
+
+        Args:
+            source: A string containing the scale to convert from.
+            target: A string containing the scale to convert to.
+
+        Returns:
+            A function converting a float from the source scale to the
+            target scale.
+
+        Raises:
+            NameError if one of the given scales is not supported.
+        """
+        for scale in (source, target):
+            if scale not in cls._scales:
+                raise NameError(scale)
+        if source == target:
+            return float
+        return getattr(cls, f'conv_{source}_to_{target}')
+
+    @classmethod
+    def affine(cls, source, target):
+        """Affine coefficients of a scale conversion.
+
+        Args:
+            source: A string containing the scale to convert from.
+            target: A string containing the scale to convert to.
+
+        Returns:
+            A (gain, offset) tuple of floats such as
+            target value = gain * source value + offset.
+
+        Raises:
+            NameError if one of the given scales is not supported.
+        """
+        for scale in (source, target):
+            if scale not in cls._scales:
+                raise NameError(scale)
+        source_gain, source_offset = cls._canonical[source]
+        target_gain, target_offset = cls._canonical[target]
+        return (
+            source_gain / target_gain,
+            (source_offset - target_offset) / target_gain,
+        )
+
+    @classmethod
+    def from_values(cls, scale, values, array=False):
+        """Create many Distance objects sharing the same scale.
+
+        The scale is validated once and the objects are built without going
+        through __init__, which saves the per value scale check.
+
+        Args:
+            scale: A string containing the scale of the values.
+            values: An iterable of numbers.
+            array: A boolean, True to return a DistanceArray instead of a list.
+
+        Returns:
+            A list of Distance objects, or a DistanceArray.
+
+        Raises:
+            NameError if the given scale is not supported.
+        """
+        if scale not in cls._scales:
+            raise NameError(scale)
+        if array:
+            return DistanceArray(scale, values)
+        new = cls.__new__
+        instances = []
+        append = instances.append
+        for value in map(float, values):
+            instance = new(cls)
+            instance._scale = scale
+            instance._dist = value
+            instance._km = instance._mi = None
+            append(instance)
+        return instances
 
     @staticmethod
     def conv_km_to_mi(dist):
@@ -175,3 +343,93 @@ class Distance:
             A float containing the Kilomeer value.
         """
         return dist * 1.609
+
+
+class FrozenDistance(Distance):
+    """Immutable Distance class.
+
+    The scale and dist setters raise AttributeError: conversions go
+    through the to method, which returns a new object. FrozenDistance objects
+    can be shared between threads without locks, and are hashable so they
+    can be used as dict keys. Two objects are equal when they have the same
+    scale and the same dist.
+    """
+    __slots__ = ()
+
+    @Distance.scale.setter
+    def scale(self, scale):
+        raise AttributeError(f'{type(self).__name__} objects are immutable')
+
+    @Distance.dist.setter
+    def dist(self, dist):
+        raise AttributeError(f'{type(self).__name__} objects are immutable')
+
+    def __eq__(self, other):
+        if isinstance(other, FrozenDistance):
+            return (self._scale, self._dist) == (other._scale, other._dist)
+        return NotImplemented
+
+    def __hash__(self):
+        return hash((self._scale, self._dist))
+
+
+class ObservableDistance(Distance):
+    """Observable Distance class.
+
+    The scale and dist setters call the observers of the object, with the
+    object as argument, after each assignment. Plain Distance objects are not
+    observable, so they pay nothing for it.
+    """
+    __slots__ = ('_observers',)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._observers = []
+
+    def __setstate__(self, state):
+        # Copies and unpickled objects start without observers
+        super().__setstate__(state)
+        self._observers = []
+
+    @Distance.scale.setter
+    def scale(self, scale):
+        Distance.scale.fset(self, scale)
+        for observer in self._observers:
+            observer(self)
+
+    @Distance.dist.setter
+    def dist(self, dist):
+        Distance.dist.fset(self, dist)
+        for observer in self._observers:
+            observer(self)
+
+    @classmethod
+    def from_values(cls, scale, values, array=False):
+        instances = super().from_values(scale, values, array)
+        if not array:
+            for instance in instances:
+                instance._observers = []
+        return instances
+
+    def observe(self, observer):
+        """Register an observer, a function taking the object."""
+        self._observers.append(observer)
+
+    def unobserve(self, observer):
+        """Unregister an observer.
+
+        Raises:
+            ValueError if the observer is not registered.
+        """
+        self._observers.remove(observer)
+
+
+class DistanceArray(ScaledArray):
+    """Distance array class.
+
+    A compact container of distances sharing one scale.
+    """
+    _quantity = Distance
+
+
+dimensions.register(Distance, DistanceArray)
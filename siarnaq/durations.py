@@ -0,0 +1,78 @@
+"""Durations conversions.
+
+Copyright (c) 2020 Thierry P.G. DECKER
+All Rights Reserved.
+Released under the MIT license
+
+"""
+
+from siarnaq import dimensions
+from siarnaq.arrays import ScaledArray
+
+
+class Duration(dimensions.Quantity):
+    """Duration class.
+
+    """
+    dimension = dimensions.TIME
+    _scales = {
+        #
+        # Supported scales
+        #
+        'se',  # Second
+        'mn',  # Minute
+        'ho',  # Hour
+    }
+    _canonical = {
+        #
+        # Affine coefficients (gain, offset) from each scale to Hour
+        #
+        'se': (1 / 3600, 0.),
+        'mn': (1 / 60, 0.),
+        'ho': (1., 0.),
+    }
+    _symbols = {
+        'se': 's',
+        'mn': 'min',
+        'ho': 'h',
+    }
+    _base = 'ho'
+    _preferred = {}
+
+    @property
+    def second(self):
+        """Second value.
+
+        Returns:
+            A float containing the Second value.
+        """
+        return self.in_scale('se')
+
+    @property
+    def minute(self):
+        """Minute value.
+
+        Returns:
+            A float containing the Minute value.
+        """
+        return self.in_scale('mn')
+
+    @property
+    def hour(self):
+        """Hour value.
+
+        Returns:
+            A float containing the Hour value.
+        """
+        return self.in_scale('ho')
+
+
+class DurationArray(ScaledArray):
+    """Duration array class.
+
+    A compact container of durations sharing one scale.
+    """
+    _quantity = Duration
+
+
+dimensions.register(Duration, DurationArray)
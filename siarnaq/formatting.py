@@ -0,0 +1,187 @@
+"""Bulk formatting.
+
+This module renders many quantities as text, for reports and exports.
+
+The format of a target scale, precision and unit style is compiled once into
+a str.format template. Values are converted into the target scale chunk by
+chunk, with one conversion function per source scale, and each chunk is
+written to the stream in one call.
+
+With the default style and precision, each value is rendered exactly as by
+the __str__ method of its quantity.
+
+Copyright (c) 2020 Thierry P.G. DECKER
+All Rights Reserved.
+Released under the MIT license
+
+"""
+
+import io
+import itertools
+
+_styles = {
+    #
+    # Supported unit styles
+    #
+    'symbol',  # Unit symbol, as in 20.5 °C
+    'ascii',  # ASCII unit symbol, as in 20.5 degC
+    'none',  # Value alone, as in 20.5
+}
+
+
+class Formatter:
+    """Formatter class.
+
+    """
+
+    def __init__(self, quantity, scale, precision=None, style='symbol',
+                 separator='\n'):
+        """Initialize new Formatter instances.
+
+        Args:
+            quantity: The quantity class of the values (Degree, Distance...).
+            scale: A string containing the scale of the rendered values.
+            precision: An optional int containing the number of decimals. By
+                default the shortest representation of the floats is used.
+            style: A string containing the unit style, one of 'symbol',
+                'ascii' and 'none'.
+            separator: A string written after each value.
+
+        Raises:
+            NameError if the scale or the style is not supported.
+        """
+        if scale not in quantity._scales:
+            raise NameError(scale)
+        if style not in _styles:
+            raise NameError(style)
+        if precision is None:
+            number = '{}'
+        else:
+            number = f'{{:.{int(precision)}f}}'
+        symbol = quantity._symbols[scale]
+        if style == 'ascii':
+            symbol = symbol.replace('°', 'deg')
+        if style == 'none':
+            template = number
+        else:
+            template = f'{number} {symbol}'
+        self._quantity = quantity
+        self._scale = scale
+        self._separator = separator
+        self._format = template.format
+
+    @property
+    def scale(self):
+        """Scale of the rendered values."""
+        return self._scale
+
+    def format(self, value):
+        """Render one quantity, in any scale.
+
+        Returns:
+            A string, without separator.
+        """
+        return self._format(next(self._chunks([value], 1))[0])
+
+    def _chunks(self, values, size):
+        """Yield lists of floats converted into the target scale.
+
+        Raises:
+            TypeError if the values are not of the formatter dimension.
+        """
+        quantity = self._quantity
+        dimension = quantity.dimension
+        if hasattr(values, '_quantity'):
+            if values.dimension != dimension:
+                raise TypeError(type(values).__name__)
+            converter = quantity.converter(values.scale, self._scale)
+            floats = values.values
+            for start in range(0, len(floats), size):
+                yield list(map(converter, floats[start:start + size]))
+            return
+        converters = {}
+        iterator = iter(values)
+        while True:
+            chunk = list(itertools.islice(iterator, size))
+            if not chunk:
+                return
+            floats = []
+            append = floats.append
+            for value in chunk:
+                key = (type(value), value.scale)
+                try:
+                    converter = converters[key]
+                except KeyError:
+                    if value.dimension != dimension:
+                        raise TypeError(type(value).__name__)
+                    converter = quantity.converter(value.scale, self._scale)
+                    converters[key] = converter
+                append(converter(value.value))
+            yield floats
+
+    def write(self, values, stream, chunk_size=4096):
+        """Render many quantities into a stream.
+
+        Args:
+            values: A quantity array, or an iterable of quantities in any
+                scale.
+            stream: A text stream, or a binary stream receiving UTF-8.
+            chunk_size: An int containing the number of values rendered per
+                write call.
+
+        Returns:
+            An int containing the number of rendered values.
+        """
+        binary = not isinstance(stream, io.TextIOBase)
+        separator = self._separator
+        count = 0
+        for floats in self._chunks(values, chunk_size):
+            text = separator.join(map(self._format, floats)) + separator
+            stream.write(text.encode('utf-8') if binary else text)
+            count += len(floats)
+        return count
+
+    def dumps(self, values):
+        """Render many quantities into a string.
+
+        Returns:
+            A string, each value being followed by the separator.
+        """
+        stream = io.StringIO()
+        self.write(values, stream)
+        return stream.getvalue()
+
+
+def format_values(values, scale=None, precision=None, style='symbol',
+                  stream=None, separator='\n'):
+    """Render many quantities.
+
+    Args:
+        values: A quantity array, or an iterable of quantities.
+        scale: A string containing the scale of the rendered values, the
+            scale of the array or of the first quantity by default.
+        precision: An optional int containing the number of decimals.
+        style: A string containing the unit style.
+        stream: An optional text or binary stream.
+        separator: A string written after each value.
+
+    Returns:
+        A string if no stream is given, else the number of rendered values.
+    """
+    if hasattr(values, '_quantity'):
+        quantity = values._quantity
+        if scale is None:
+            scale = values.scale
+    else:
+        iterator = iter(values)
+        first = next(iterator, None)
+        if first is None:
+            return '' if stream is None else 0
+        quantity = type(first)
+        if scale is None:
+            scale = first.scale
+        values = itertools.chain([first], iterator)
+    formatter = Formatter(quantity, scale, precision, style, separator)
+    if stream is None:
+        return formatter.dumps(values)
+    return formatter.write(values, stream)
@@ -0,0 +1,119 @@
+"""Interning of repeated values.
+
+This module hands out shared frozen objects for repeated (scale, value)
+pairs, such as thermostat setpoints or fixed route legs, instead of creating
+a new object per reading.
+
+The shared objects are kept in a bounded least recently used cache. As they
+are frozen, they cannot be changed by one of their holders, and the values
+converted into other scales are cached once in each shared object.
+
+Copyright (c) 2020 Thierry P.G. DECKER
+All Rights Reserved.
+Released under the MIT license
+
+"""
+
+import functools
+
+from siarnaq.degrees import Degree
+from siarnaq.degrees import FrozenDegree
+from siarnaq.distances import Distance
+from siarnaq.distances import FrozenDistance
+
+_frozen = {
+    #
+    # Frozen class handed out for each quantity class
+    #
+    Degree: FrozenDegree,
+    FrozenDegree: FrozenDegree,
+    Distance: FrozenDistance,
+    FrozenDistance: FrozenDistance,
+}
+
+
+class InternPool:
+    """Intern pool class.
+
+    Pools are safe to share between threads.
+    """
+
+    def __init__(self, quantity=Degree, maxsize=4096):
+        """Initialize new InternPool instances.
+
+        Args:
+            quantity: Degree or Distance, or their frozen variants.
+            maxsize: An int containing the maximum number of shared objects.
+
+        Raises:
+            TypeError if the quantity has no frozen variant.
+            ValueError if maxsize is not positive.
+        """
+        if quantity not in _frozen:
+            raise TypeError(getattr(quantity, '__name__', quantity))
+        if maxsize <= 0:
+            raise ValueError(maxsize)
+        self._quantity = _frozen[quantity]
+        self._maxsize = maxsize
+        self._get = functools.lru_cache(maxsize)(self._quantity)
+
+    def __len__(self):
+        return self._get.cache_info().currsize
+
+    @property
+    def quantity(self):
+        """Frozen class of the shared objects."""
+        return self._quantity
+
+    @property
+    def stats(self):
+        """Statistics of the pool.
+
+        The scale and value are checked before the cache lookup, so every
+        miss adds an object to the pool and the evictions are the misses
+        which are no longer in it. Only two threads missing the same pair
+        at the same time count two misses, and an eviction, for one object.
+
+        Returns:
+            A dict of the hits, misses and evictions counts and of the size
+            and maximum size of the pool.
+        """
+        info = self._get.cache_info()
+        return {
+            'hits': info.hits,
+            'misses': info.misses,
+            'evictions': info.misses - info.currsize,
+            'size': info.currsize,
+            'maxsize': self._maxsize,
+        }
+
+    def get(self, scale, value):
+        """Shared object of a scale and value.
+
+        Values are compared as numbers: 70 and 70.0 give the same object.
+
+        Returns:
+            A FrozenDegree or FrozenDistance object.
+
+        Raises:
+            NameError if the scale is not supported.
+            ValueError or TypeError if the value is not a number.
+        """
+        if scale not in self._quantity._scales:
+            raise NameError(scale)
+        return self._get(scale, float(value))
+
+    def convert(self, scale, value, target):
+        """Value converted into another scale, cached in the shared object.
+
+        Returns:
+            A float.
+
+        Raises:
+            NameError if one of the scales is not supported.
+        """
+        return self.get(scale, value).in_scale(target)
+
+    def clear(self):
+        """Drop the shared objects and reset the statistics."""
+        self._get.cache_clear()
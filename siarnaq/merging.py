@@ -0,0 +1,122 @@
+"""Merge of time ordered streams.
+
+This module merges many time ordered streams of readings, each in its own
+scale, into one time ordered stream of batches in a single scale.
+
+The merge is a k-way merge on a heap holding the next reading of each
+stream, so memory is bounded by the number of streams plus one batch,
+however long the streams. The affine conversion of each stream into the
+target scale is resolved once, when the scale of the stream is first seen,
+and applied to every reading of the stream.
+
+Copyright (c) 2020 Thierry P.G. DECKER
+All Rights Reserved.
+Released under the MIT license
+
+"""
+
+import heapq
+
+from siarnaq import dimensions
+from siarnaq.degrees import Degree
+
+
+class _Source:
+    """State of a merged stream."""
+
+    __slots__ = ('iterator', 'raw', 'scale', 'gain', 'offset', 'previous')
+
+    def __init__(self, iterator, scale):
+        self.iterator = iterator
+        self.raw = scale is not None
+        self.scale = scale
+        self.gain = self.offset = None
+        self.previous = None
+
+
+def merge(streams, scale, quantity=Degree, scales=None, batch_size=1024):
+    """Merge time ordered streams.
+
+    Args:
+        streams: A sequence of iterables, each yielding (timestamp, value)
+            pairs in increasing timestamp order. Values are quantities in
+            any scale, or floats for the streams given a scale in scales.
+        scale: A string containing the scale of the merged values.
+        quantity: The quantity class of the values.
+        scales: An optional sequence of the same length as the streams,
+            holding the scale of the floats of each raw stream, or None for
+            the streams yielding quantities.
+        batch_size: An int containing the maximum length of the batches.
+
+    Yields:
+        (timestamps, sources, array) tuples: the timestamps, the indexes of
+        the streams the readings come from, and a quantity array of the
+        values in the target scale. Readings of equal timestamps come in
+        stream order.
+
+    Raises:
+        NameError if a scale is not supported.
+        ValueError if the scales do not match the streams, the batch size is
+        not positive or a stream is out of order.
+        TypeError if a value is not of the quantity dimension.
+    """
+    if scale not in quantity._scales:
+        raise NameError(scale)
+    if batch_size <= 0:
+        raise ValueError(batch_size)
+    streams = list(streams)
+    if scales is None:
+        scales = [None] * len(streams)
+    elif len(scales) != len(streams):
+        raise ValueError((len(streams), len(scales)))
+    sources = [
+        _Source(iter(stream), source)
+        for stream, source in zip(streams, scales)
+    ]
+    for source in sources:
+        if source.raw:
+            source.gain, source.offset = quantity.affine(source.scale, scale)
+    dimension = quantity.dimension
+    array_type = dimensions.array_type(quantity)
+
+    def pull(index):
+        """Next heap entry of a stream, or None when it is exhausted."""
+        source = sources[index]
+        for timestamp, value in source.iterator:
+            if source.previous is not None and timestamp < source.previous:
+                raise ValueError(timestamp)
+            source.previous = timestamp
+            if not source.raw:
+                if value.scale != source.scale:
+                    if value.dimension != dimension:
+                        raise TypeError(type(value).__name__)
+                    source.scale = value.scale
+                    source.gain, source.offset = quantity.affine(
+                        value.scale, scale)
+                value = value.value
+            return (timestamp, index, source.gain * value + source.offset)
+        return None
+
+    heap = []
+    for index in range(len(sources)):
+        entry = pull(index)
+        if entry is not None:
+            heap.append(entry)
+    heapq.heapify(heap)
+
+    timestamps, indexes, values = [], [], []
+    while heap:
+        timestamp, index, value = heap[0]
+        entry = pull(index)
+        if entry is None:
+            heapq.heappop(heap)
+        else:
+            heapq.heapreplace(heap, entry)
+        timestamps.append(timestamp)
+        indexes.append(index)
+        values.append(value)
+        if len(values) == batch_size:
+            yield timestamps, indexes, array_type(scale, values)
+            timestamps, indexes, values = [], [], []
+    if values:
+        yield timestamps, indexes, array_type(scale, values)
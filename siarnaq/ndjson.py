@@ -0,0 +1,277 @@
+"""JSON and NDJSON streaming.
+
+This module encodes and decodes quantities as JSON objects holding their
+scale and their value, under the name of the constructor argument of their
+class:
+
+    {"scale": "fa", "temp": 70.1}
+    {"scale": "mi", "dist": 12.5}
+    {"scale": "kmh", "value": 90.0}
+
+NDJSON streams hold one object per line. Arrays are encoded straight from
+their values, and decoded chunk by chunk into arrays, without building a
+quantity object per reading. Both directions convert into a target scale on
+the fly, with one conversion function per source scale.
+
+Copyright (c) 2020 Thierry P.G. DECKER
+All Rights Reserved.
+Released under the MIT license
+
+"""
+
+import io
+import itertools
+import json
+import math
+
+from siarnaq import dimensions
+from siarnaq.degrees import Degree
+
+_fields = {
+    #
+    # Name of the value field by dimension, 'value' for the others
+    #
+    dimensions.TEMPERATURE: 'temp',
+    dimensions.LENGTH: 'dist',
+}
+
+
+def _field(quantity):
+    return _fields.get(quantity.dimension, 'value')
+
+
+def _prefix(quantity, scale):
+    """Constant start of the encoded objects of a quantity and scale."""
+    return f'{{"scale": {json.dumps(scale)}, "{_field(quantity)}": '
+
+
+def _number(value):
+    """JSON representation of a float, as rendered by json.dumps."""
+    if math.isfinite(value):
+        return repr(value)
+    return json.dumps(value)
+
+
+def to_dict(value):
+    """Convert a quantity into a dict.
+
+    Returns:
+        A dict such as {'scale': 'fa', 'temp': 70.1}.
+    """
+    return {'scale': value.scale, _field(type(value)): value.value}
+
+
+def from_dict(data, quantity=Degree, scale=None):
+    """Convert a dict into a quantity.
+
+    Args:
+        data: A dict holding a scale and a value.
+        quantity: The quantity class of the value.
+        scale: A string containing the scale of the result, the scale of
+            the dict by default.
+
+    Returns:
+        A quantity object.
+
+    Raises:
+        KeyError if a field is missing.
+        NameError if a scale is not supported.
+    """
+    source = data['scale']
+    if scale is None:
+        scale = source
+    value = quantity.converter(source, scale)(data[_field(quantity)])
+    return quantity(scale, value)
+
+
+def _lines(values, scale, size):
+    """Yield lists of NDJSON lines encoding the values.
+
+    Raises:
+        NameError if the scale is not supported.
+    """
+    if hasattr(values, '_quantity'):
+        quantity = values._quantity
+        if scale is None:
+            scale = values.scale
+        floats = values.to(scale).values
+        prefix = _prefix(quantity, scale)
+        for start in range(0, len(floats), size):
+            chunk = floats[start:start + size]
+            if all(map(math.isfinite, chunk)):
+                yield [f'{prefix}{value!r}}}\n' for value in chunk]
+            else:
+                yield [f'{prefix}{_number(value)}}}\n' for value in chunk]
+        return
+    encoders = {}
+    iterator = iter(values)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        lines = []
+        append = lines.append
+        for value in chunk:
+            key = (type(value), value.scale)
+            try:
+                prefix, converter = encoders[key]
+            except KeyError:
+                quantity = type(value)
+                target = value.scale if scale is None else scale
+                prefix = _prefix(quantity, target)
+                converter = quantity.converter(value.scale, target)
+                encoders[key] = (prefix, converter)
+            append(f'{prefix}{_number(converter(value.value))}}}\n')
+        yield lines
+
+
+def write(values, stream, scale=None, chunk_size=4096):
+    """Write quantities into a NDJSON stream.
+
+    Args:
+        values: A quantity array, or an iterable of quantities.
+        stream: A text stream, or a binary stream receiving UTF-8.
+        scale: A string containing the scale of the written values. By
+            default each value keeps its scale.
+        chunk_size: An int containing the number of lines per write call.
+
+    Returns:
+        An int containing the number of written lines.
+
+    Raises:
+        NameError if the scale is not supported.
+    """
+    binary = not isinstance(stream, io.TextIOBase)
+    count = 0
+    for lines in _lines(values, scale, chunk_size):
+        text = ''.join(lines)
+        stream.write(text.encode('utf-8') if binary else text)
+        count += len(lines)
+    return count
+
+
+def _records(stream):
+    """Yield the decoded objects of the non blank lines of a stream."""
+    loads = json.loads
+    for line in stream:
+        if line.strip():
+            yield loads(line)
+
+
+def read(stream, quantity=Degree, scale=None):
+    """Read quantities from a NDJSON stream.
+
+    Args:
+        stream: A text or binary stream, or any iterable of lines.
+        quantity: The quantity class of the values.
+        scale: A string containing the scale of the results. By default
+            each value keeps its scale.
+
+    Yields:
+        Quantity objects.
+
+    Raises:
+        ValueError if a line is not valid JSON.
+        KeyError if a field is missing.
+        NameError if a scale is not supported.
+    """
+    field = _field(quantity)
+    converters = {}
+    for record in _records(stream):
+        source = record['scale']
+        target = source if scale is None else scale
+        try:
+            converter = converters[source]
+        except KeyError:
+            converter = converters[source] = quantity.converter(
+                source, target)
+        yield quantity(target, converter(record[field]))
+
+
+def _arrays(records, quantity, scale, size):
+    """Yield arrays of the values of decoded objects."""
+    if scale is None:
+        scale = quantity._base
+    array_type = dimensions.array_type(quantity)
+    field = _field(quantity)
+    converters = {}
+    records = iter(records)
+    while True:
+        chunk = list(itertools.islice(records, size))
+        if not chunk:
+            return
+        floats = []
+        append = floats.append
+        for record in chunk:
+            source = record['scale']
+            try:
+                converter = converters[source]
+            except KeyError:
+                converter = converters[source] = quantity.converter(
+                    source, scale)
+            append(converter(record[field]))
+        yield array_type(scale, floats)
+
+
+def read_arrays(stream, quantity=Degree, scale=None, chunk_size=4096):
+    """Read a NDJSON stream into arrays.
+
+    Args:
+        stream: A text or binary stream, or any iterable of lines.
+        quantity: The quantity class of the values.
+        scale: A string containing the scale of the arrays, the canonical
+            scale of the quantity by default.
+        chunk_size: An int containing the maximum length of the arrays.
+
+    Yields:
+        Quantity arrays of the given scale.
+
+    Raises:
+        ValueError if a line is not valid JSON.
+        KeyError if a field is missing.
+        NameError if a scale is not supported.
+    """
+    yield from _arrays(_records(stream), quantity, scale, chunk_size)
+
+
+def dumps(values, scale=None):
+    """Encode quantities into a JSON array.
+
+    Args:
+        values: A quantity array, or an iterable of quantities.
+        scale: A string containing the scale of the encoded values.
+
+    Returns:
+        A string.
+    """
+    objects = [
+        line[:-1]
+        for lines in _lines(values, scale, 4096)
+        for line in lines
+    ]
+    return f'[{", ".join(objects)}]'
+
+
+def loads(text, quantity=Degree, scale=None):
+    """Decode a JSON array of quantities into an array.
+
+    Args:
+        text: A string or bytes object.
+        quantity: The quantity class of the values.
+        scale: A string containing the scale of the result, the canonical
+            scale of the quantity by default.
+
+    Returns:
+        A quantity array.
+
+    Raises:
+        ValueError if the text is not valid JSON.
+        KeyError if a field is missing.
+        NameError if a scale is not supported.
+    """
+    records = json.loads(text)
+    for array in _arrays(records, quantity, scale, max(len(records), 1)):
+        return array
+    if scale is None:
+        scale = quantity._base
+    return dimensions.array_type(quantity)(scale)
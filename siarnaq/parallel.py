@@ -0,0 +1,78 @@
+"""Multi-threaded conversions.
+
+This module converts large arrays or sequences of quantities on a pool of
+threads, each thread converting a contiguous chunk.
+
+The conversions are pure Python code: with the GIL of the standard CPython
+build the threads take turns and the speed stays about the one of a single
+thread, while on a free-threaded build (Python 3.13t and later) the chunks
+are converted in parallel. Sequences are expected to hold frozen objects,
+as the workers read them without locks.
+
+Copyright (c) 2020 Thierry P.G. DECKER
+All Rights Reserved.
+Released under the MIT license
+
+"""
+
+import concurrent.futures
+import os
+
+from siarnaq import dimensions
+
+
+def _ranges(length, chunks):
+    size = max(1, -(-length // chunks))
+    return [(start, min(start + size, length))
+            for start in range(0, length, size)]
+
+
+def convert(values, scale, threads=None, executor=None):
+    """Convert values on a pool of threads.
+
+    Args:
+        values: A quantity array, or a sequence of quantities such as
+            FrozenDegree objects.
+        scale: A string containing the target scale.
+        threads: An int containing the number of chunks and threads, the
+            number of CPUs by default.
+        executor: An optional concurrent.futures.Executor to run the chunks
+            on, instead of a new thread pool.
+
+    Returns:
+        A float64 array expressed in the given scale for arrays, else a
+        list of new objects returned by the to method of the values.
+
+    Raises:
+        NameError if the scale is not supported.
+        ValueError if the number of threads is not positive.
+    """
+    if threads is None:
+        threads = os.cpu_count() or 1
+    if threads <= 0:
+        raise ValueError(threads)
+    if hasattr(values, '_quantity'):
+        quantity = values._quantity
+        converter = quantity.converter(values.scale, scale)
+        floats = values.values
+
+        def work(bounds):
+            start, stop = bounds
+            return list(map(converter, floats[start:stop]))
+    else:
+        def work(bounds):
+            start, stop = bounds
+            return [value.to(scale) for value in values[start:stop]]
+
+    ranges = _ranges(len(values), threads)
+    if len(ranges) <= 1:
+        chunks = list(map(work, ranges))
+    elif executor is None:
+        with concurrent.futures.ThreadPoolExecutor(threads) as pool:
+            chunks = list(pool.map(work, ranges))
+    else:
+        chunks = list(executor.map(work, ranges))
+    results = [result for chunk in chunks for result in chunk]
+    if hasattr(values, '_quantity'):
+        return dimensions.array_type(quantity)(scale, results)
+    return results
@@ -0,0 +1,217 @@
+"""Time series resampling.
+
+This module resamples irregular readings onto a regular time grid, either
+by interpolation (linear or previous value) or by bucketed downsampling
+(mean, min, max or last value per bucket).
+
+Readings are fed as time ordered chunks of timestamps and quantity arrays
+in any scale, so long series never need to be loaded at once. Each chunk is
+converted into the resampling scale in one pass.
+
+Copyright (c) 2020 Thierry P.G. DECKER
+All Rights Reserved.
+Released under the MIT license
+
+"""
+
+import math
+
+from siarnaq import dimensions
+
+_methods = {
+    #
+    # Supported methods
+    #
+    'linear',  # Linear interpolation on the grid points
+    'previous',  # Last reading at or before the grid points
+    'mean',  # Mean of the readings of each bucket
+    'min',  # Minimum of the readings of each bucket
+    'max',  # Maximum of the readings of each bucket
+    'last',  # Last reading of each bucket
+}
+
+
+class Resampler:
+    """Resampler class.
+
+    Grid points are start + i * step. Interpolated points are emitted once a
+    reading after them has been fed, so that the last of several readings
+    sharing the timestamp of a grid point is the one emitted; buckets
+    [point, point + step) are emitted once a reading after them has been
+    fed. Both are emitted on flush. Grid points before the first reading and
+    empty buckets are not emitted.
+    """
+
+    def __init__(self, step, scale, method='linear', start=None):
+        """Initialize new Resampler instances.
+
+        Args:
+            step: A positive number containing the grid step, in the unit of
+                the timestamps.
+            scale: A string containing the scale of the resampled values.
+            method: A string containing the resampling method.
+            start: A number containing the first grid point, the first
+                timestamp by default.
+
+        Raises:
+            NameError if the method is not supported.
+            ValueError if the step is not positive.
+        """
+        if method not in _methods:
+            raise NameError(method)
+        if step <= 0:
+            raise ValueError(step)
+        self._step = step
+        self._scale = scale
+        self._method = method
+        self._start = start
+        self._quantity = None
+        self._previous = None
+        self._point = None
+        self._bucket = None
+        self._accumulator = None
+
+    def feed(self, timestamps, values):
+        """Feed a chunk of readings.
+
+        Args:
+            timestamps: A sequence of numbers, in increasing order and after
+                the timestamps of the previous chunks.
+            values: A quantity array of the same length, in any scale.
+
+        Returns:
+            A (timestamps, array) tuple of the grid points completed by the
+            chunk, the array being expressed in the resampling scale.
+
+        Raises:
+            ValueError if the timestamps are out of order or the lengths
+            differ.
+            TypeError if the quantity changes between chunks.
+        """
+        if len(timestamps) != len(values):
+            raise ValueError((len(timestamps), len(values)))
+        if self._quantity is None:
+            self._quantity = values._quantity
+        elif values.dimension != self._quantity.dimension:
+            raise TypeError(type(values).__name__)
+        converted = values.to(self._scale).values
+        if self._method in ('linear', 'previous'):
+            points, results = self._interpolate(timestamps, converted)
+        else:
+            points, results = self._downsample(timestamps, converted)
+        return points, dimensions.array_type(self._quantity)(
+            self._scale, results)
+
+    def flush(self):
+        """Emit the last incomplete bucket.
+
+        Returns:
+            A (timestamps, array) tuple, the array being None if nothing was
+            fed.
+        """
+        points, results = [], []
+        if self._accumulator is not None:
+            points.append(self._grid(self._bucket))
+            results.append(self._aggregate())
+            self._accumulator = None
+        if self._point is not None and \
+                self._previous[0] == self._grid(self._point):
+            points.append(self._previous[0])
+            results.append(self._previous[1])
+            self._point += 1
+        quantity = self._quantity
+        if quantity is None:
+            return points, None
+        return points, dimensions.array_type(quantity)(self._scale, results)
+
+    def _grid(self, index):
+        return self._start + index * self._step
+
+    def _check(self, timestamp):
+        if self._previous is not None and timestamp < self._previous[0]:
+            raise ValueError(timestamp)
+        if self._start is None:
+            self._start = timestamp
+
+    def _interpolate(self, timestamps, values):
+        points, results = [], []
+        linear = self._method == 'linear'
+        for timestamp, value in zip(timestamps, values):
+            self._check(timestamp)
+            if self._point is None:
+                self._point = max(
+                    0, math.ceil((timestamp - self._start) / self._step))
+            point = self._grid(self._point)
+            while point < timestamp:
+                before, previous = self._previous
+                if linear and before != point:
+                    ratio = (point - before) / (timestamp - before)
+                    results.append(previous + (value - previous) * ratio)
+                else:
+                    results.append(previous)
+                points.append(point)
+                self._point += 1
+                point = self._grid(self._point)
+            self._previous = (timestamp, value)
+        return points, results
+
+    def _downsample(self, timestamps, values):
+        points, results = [], []
+        for timestamp, value in zip(timestamps, values):
+            self._check(timestamp)
+            self._previous = (timestamp, value)
+            bucket = math.floor((timestamp - self._start) / self._step)
+            if bucket < 0:
+                continue
+            if bucket != self._bucket and self._accumulator is not None:
+                points.append(self._grid(self._bucket))
+                results.append(self._aggregate())
+                self._accumulator = None
+            if self._accumulator is None:
+                self._bucket = bucket
+                self._accumulator = [value, 1, value, value, value]
+            else:
+                accumulator = self._accumulator
+                accumulator[0] += value
+                accumulator[1] += 1
+                if value < accumulator[2]:
+                    accumulator[2] = value
+                if value > accumulator[3]:
+                    accumulator[3] = value
+                accumulator[4] = value
+        return points, results
+
+    def _aggregate(self):
+        total, count, low, high, last = self._accumulator
+        if self._method == 'mean':
+            return total / count
+        if self._method == 'min':
+            return low
+        if self._method == 'max':
+            return high
+        return last
+
+
+def resample(timestamps, values, step, scale=None, method='linear',
+             start=None):
+    """Resample a whole series.
+
+    Args:
+        timestamps: A sequence of increasing numbers.
+        values: A quantity array of the same length.
+        step: A positive number containing the grid step.
+        scale: A string containing the scale of the results, the scale of
+            the values by default.
+        method: A string containing the resampling method.
+        start: A number containing the first grid point.
+
+    Returns:
+        A (timestamps, array) tuple.
+    """
+    resampler = Resampler(step, scale or values.scale, method, start)
+    points, results = resampler.feed(timestamps, values)
+    last_points, last_results = resampler.flush()
+    if last_points:
+        points.extend(last_points)
+        results.extend(last_results.values)
+    return points, results
@@ -0,0 +1,152 @@
+"""Threshold rules.
+
+This module evaluates threshold rules such as "sensor X above 85 °F"
+against batches of readings.
+
+Thresholds are compiled once into the canonical unit of their quantity
+(Kelvin, kilometer...) and kept sorted per (key, operator). As the scale
+conversions are increasing affine functions, a batch only needs its extreme
+readings converted: the fired rules are then found by binary search, however
+many rules watch the key.
+
+Copyright (c) 2020 Thierry P.G. DECKER
+All Rights Reserved.
+Released under the MIT license
+
+"""
+
+import bisect
+
+_operators = {
+    #
+    # Supported operators: fires when reading <operator> threshold
+    #
+    '>',
+    '>=',
+    '<',
+    '<=',
+}
+
+
+def _canonical(quantity, scale, value):
+    gain, offset = quantity._canonical[scale]
+    return gain * value + offset
+
+
+class RuleEngine:
+    """Rule engine class.
+
+    """
+
+    def __init__(self):
+        """Initialize new RuleEngine instances."""
+        self._rules = {}
+        self._dimensions = {}
+        self._counts = {}
+        self._thresholds = {}
+
+    def __len__(self):
+        return len(self._rules)
+
+    def __contains__(self, rule):
+        return rule in self._rules
+
+    def add(self, rule, key, operator, threshold):
+        """Add a rule.
+
+        Args:
+            rule: A hashable rule id.
+            key: A hashable id of the watched readings (sensor, vehicle...).
+            operator: A string, one of '>', '>=', '<' and '<='.
+            threshold: A Degree, a Distance or any other quantity.
+
+        Raises:
+            KeyError if the rule id is already used.
+            NameError if the operator is not supported.
+            TypeError if the key is watched by rules of another dimension.
+        """
+        if rule in self._rules:
+            raise KeyError(rule)
+        if operator not in _operators:
+            raise NameError(operator)
+        quantity = type(threshold)
+        if self._dimensions.setdefault(key, threshold.dimension) != \
+                threshold.dimension:
+            raise TypeError(quantity.__name__)
+        value = _canonical(quantity, threshold.scale, threshold.value)
+        values, rules = self._thresholds.setdefault(
+            (key, operator), ([], []))
+        index = bisect.bisect_right(values, value)
+        values.insert(index, value)
+        rules.insert(index, rule)
+        self._rules[rule] = (key, operator, value)
+        self._counts[key] = self._counts.get(key, 0) + 1
+
+    def remove(self, rule):
+        """Remove a rule.
+
+        Raises:
+            KeyError if the rule id is unknown.
+        """
+        key, operator, value = self._rules.pop(rule)
+        values, rules = self._thresholds[(key, operator)]
+        index = bisect.bisect_left(values, value)
+        while rules[index] != rule:
+            index += 1
+        del values[index]
+        del rules[index]
+        if not values:
+            del self._thresholds[(key, operator)]
+        self._counts[key] -= 1
+        if not self._counts[key]:
+            del self._counts[key]
+            del self._dimensions[key]
+
+    def evaluate(self, readings):
+        """Evaluate the rules against a batch of readings.
+
+        Args:
+            readings: A dict of the readings by key. Readings are a quantity
+                or a quantity array, in any scale.
+
+        Returns:
+            A set of the ids of the fired rules.
+
+        Raises:
+            TypeError if readings do not match the dimension of their rules.
+        """
+        fired = set()
+        for key, reading in readings.items():
+            dimension = self._dimensions.get(key)
+            if dimension is None:
+                continue
+            if reading.dimension != dimension:
+                raise TypeError(type(reading).__name__)
+            quantity = getattr(reading, '_quantity', None)
+            if quantity is None:
+                quantity = type(reading)
+                low = high = _canonical(quantity, reading.scale, reading.value)
+            else:
+                if not len(reading):
+                    continue
+                values = reading.values
+                low = _canonical(quantity, reading.scale, min(values))
+                high = _canonical(quantity, reading.scale, max(values))
+            fired.update(self._fired(key, low, high))
+        return fired
+
+    def _fired(self, key, low, high):
+        """Rules of a key fired by readings between low and high."""
+        thresholds = self._thresholds
+        if (key, '>') in thresholds:
+            values, rules = thresholds[(key, '>')]
+            yield from rules[:bisect.bisect_left(values, high)]
+        if (key, '>=') in thresholds:
+            values, rules = thresholds[(key, '>=')]
+            yield from rules[:bisect.bisect_right(values, high)]
+        if (key, '<') in thresholds:
+            values, rules = thresholds[(key, '<')]
+            yield from rules[bisect.bisect_right(values, low):]
+        if (key, '<=') in thresholds:
+            values, rules = thresholds[(key, '<=')]
+            yield from rules[bisect.bisect_left(values, low):]
@@ -0,0 +1,297 @@
+"""Conversion service.
+
+This module serves the Degree and Distance conversions over HTTP, for the
+services which can not import the library. Concurrent requests sharing the
+same conversion are coalesced into one array conversion.
+
+Endpoints:
+    POST /convert with a JSON body such as
+        {"quantity": "degree", "scale": "fa", "to": "ce", "value": 70.1}
+    or, for bulk conversions,
+        {"quantity": "degree", "scale": "fa", "to": "ce", "values": [70.1]}
+    GET /stats returning the latency and throughput counters.
+
+Copyright (c) 2020 Thierry P.G. DECKER
+All Rights Reserved.
+Released under the MIT license
+
+"""
+
+import asyncio
+import json
+import math
+import time
+
+from siarnaq.degrees import DegreeArray
+from siarnaq.distances import DistanceArray
+
+_arrays = {
+    #
+    # Supported quantities
+    #
+    'degree': DegreeArray,
+    'distance': DistanceArray,
+}
+
+_reasons = {
+    200: 'OK',
+    400: 'Bad Request',
+    404: 'Not Found',
+    405: 'Method Not Allowed',
+    413: 'Payload Too Large',
+}
+
+
+def _number(value):
+    """Float of a JSON number.
+
+    Raises:
+        TypeError if the value is not a JSON number: strings and booleans
+        are rejected.
+        ValueError if the number is not finite (NaN, Infinity, 1e999...).
+        OverflowError if the number is too large for a float.
+    """
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise TypeError(f'{value!r} is not a number')
+    value = float(value)
+    if not math.isfinite(value):
+        raise ValueError(f'{value} is not finite')
+    return value
+
+
+def _finite(values):
+    """Check that converted values can be encoded in JSON.
+
+    Raises:
+        OverflowError if a value is not finite.
+    """
+    for value in values:
+        if not math.isfinite(value):
+            raise OverflowError(f'{value} is not finite')
+    return values
+
+
+class ConversionServer:
+    """Conversion server class.
+
+    Requests arriving within the batching window and sharing a
+    (quantity, scale, to) key are converted together.
+    """
+
+    def __init__(self, window=0.001, max_body=16 * 1024 * 1024):
+        """Initialize new ConversionServer instances.
+
+        Args:
+            window: A float containing the batching window in seconds.
+            max_body: An int containing the largest accepted body in bytes.
+        """
+        self.window = float(window)
+        self.max_body = int(max_body)
+        self._pending = {}
+        self._started = time.monotonic()
+        self._stats = {
+            'requests': 0,
+            'errors': 0,
+            'values': 0,
+            'batches': 0,
+            'latency_total': 0.,
+            'latency_max': 0.,
+        }
+
+    @property
+    def stats(self):
+        """Counters of the server.
+
+        Returns:
+            A dict of the request, value and batch counters, the mean and
+            maximum latencies in seconds and the throughputs per second.
+        """
+        stats = dict(self._stats)
+        uptime = time.monotonic() - self._started
+        requests = stats['requests']
+        stats['uptime'] = uptime
+        stats['latency_mean'] = stats['latency_total'] / requests \
+            if requests else 0.
+        stats['requests_per_second'] = requests / uptime
+        stats['values_per_second'] = stats['values'] / uptime
+        return stats
+
+    async def convert(self, quantity, scale, to, values):
+        """Convert values, batching them with concurrent conversions.
+
+        Args:
+            quantity: A string containing a supported quantity.
+            scale: A string containing the scale of the values.
+            to: A string containing the scale to convert to.
+            values: A list of floats.
+
+        Returns:
+            A list of floats expressed in the target scale.
+
+        Raises:
+            NameError if the quantity or one of the scales is not supported.
+        """
+        if quantity not in _arrays:
+            raise NameError(quantity)
+        _arrays[quantity]._quantity.affine(scale, to)
+        key = (quantity, scale, to)
+        future = asyncio.get_running_loop().create_future()
+        batch = self._pending.get(key)
+        if batch is None:
+            batch = self._pending[key] = []
+            asyncio.get_running_loop().call_later(
+                self.window, self._flush, key)
+        batch.append((values, future))
+        return await future
+
+    def _flush(self, key):
+        """Convert every pending request of a key in one array."""
+        batch = self._pending.pop(key)
+        quantity, scale, to = key
+        values = []
+        for request_values, _ in batch:
+            values.extend(request_values)
+        try:
+            converted = _arrays[quantity](scale, values).to(to).values
+        except (TypeError, ValueError) as error:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(error)
+            return
+        self._stats['batches'] += 1
+        start = 0
+        for request_values, future in batch:
+            stop = start + len(request_values)
+            if not future.done():
+                future.set_result(converted[start:stop])
+            start = stop
+
+    async def _dispatch(self, method, path, body):
+        """Route a request.
+
+        Numbers which are not finite, in the request or once converted, are
+        rejected with a 400 answer, as they have no JSON representation.
+
+        Returns:
+            A (status, payload) tuple.
+        """
+        if path == '/stats':
+            if method != 'GET':
+                return 405, {'error': method}
+            return 200, self.stats
+        if path != '/convert':
+            return 404, {'error': path}
+        if method != 'POST':
+            return 405, {'error': method}
+        try:
+            request = json.loads(body)
+            quantity = request['quantity']
+            scale = request['scale']
+            to = request.get('to', scale)
+            if 'values' in request:
+                values = request['values']
+                if not isinstance(values, list):
+                    raise TypeError(f'{values!r} is not a list')
+                values = [_number(value) for value in values]
+                converted = _finite(
+                    await self.convert(quantity, scale, to, values))
+                self._stats['values'] += len(values)
+                return 200, {'scale': to, 'values': converted}
+            value = _number(request['value'])
+            converted = _finite(
+                await self.convert(quantity, scale, to, [value]))
+            self._stats['values'] += 1
+            return 200, {'scale': to, 'value': converted[0]}
+        except (KeyError, TypeError, ValueError, OverflowError,
+                NameError) as error:
+            return 400, {'error': f'{type(error).__name__}: {error}'}
+
+    async def handle(self, reader, writer):
+        """Serve the requests of one connection.
+
+        Connections are kept alive until the client closes them or sends
+        a "Connection: close" header.
+        """
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                status, payload, keep_alive = await self._serve(
+                    request_line, reader)
+                content = json.dumps(payload, allow_nan=False).encode()
+                writer.write(
+                    f'HTTP/1.1 {status} {_reasons[status]}\r\n'
+                    f'Content-Type: application/json\r\n'
+                    f'Content-Length: {len(content)}\r\n'
+                    f'Connection: {"keep-alive" if keep_alive else "close"}'
+                    f'\r\n\r\n'.encode('latin-1') + content
+                )
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def _serve(self, request_line, reader):
+        """Read the headers and body of a request and answer it.
+
+        Malformed requests are answered with 400 and oversized bodies with
+        413, the connection being closed after the answer. Every answer is
+        counted in the statistics. The latency is measured from the end of
+        the body, and is zero for the rejected requests.
+
+        Returns:
+            A (status, payload, keep_alive) tuple.
+        """
+        parts = request_line.decode('latin-1').split()
+        if len(parts) != 3:
+            self._account(400, 0.)
+            return 400, {'error': 'malformed request line'}, False
+        method, path, _ = parts
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if not line.strip():
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+        length = headers.get('content-length', '0')
+        if not (length.isascii() and length.isdigit()):
+            self._account(400, 0.)
+            return 400, {'error': f'content-length: {length}'}, False
+        length = int(length)
+        if length > self.max_body:
+            self._account(413, 0.)
+            return 413, {'error': length}, False
+        body = await reader.readexactly(length)
+        start = time.perf_counter()
+        status, payload = await self._dispatch(method, path, body)
+        self._account(status, time.perf_counter() - start)
+        return status, payload, headers.get('connection', '') != 'close'
+
+    def _account(self, status, latency):
+        stats = self._stats
+        stats['requests'] += 1
+        if status != 200:
+            stats['errors'] += 1
+        stats['latency_total'] += latency
+        if latency > stats['latency_max']:
+            stats['latency_max'] = latency
+
+    async def start(self, host='127.0.0.1', port=8000):
+        """Start listening.
+
+        Returns:
+            The asyncio.Server instance.
+        """
+        return await asyncio.start_server(self.handle, host, port)
+
+
+async def serve(host='127.0.0.1', port=8000, window=0.001):
+    """Run a conversion server until cancelled."""
+    server = await ConversionServer(window=window).start(host, port)
+    async with server:
+        await server.serve_forever()
@@ -0,0 +1,289 @@
+"""Quantile sketches.
+
+This module estimates the quantiles of streams too large to be held in
+memory, with a KLL sketch (Karnin, Lang and Liberty, 2016).
+
+Values are normalised into the canonical unit of their quantity on entry,
+so a sketch mixes readings of any scale. Sketches of the same quantity
+built on different shards or processes merge into one sketch of the whole
+stream, and serialise into a compact byte string.
+
+Copyright (c) 2020 Thierry P.G. DECKER
+All Rights Reserved.
+Released under the MIT license
+
+"""
+
+import array
+import math
+import random
+import struct
+import sys
+
+from siarnaq import dimensions
+from siarnaq.degrees import Degree
+
+_magic = b'SQKL'
+_header = struct.Struct('<4sBbbbHQddH')
+_level = struct.Struct('<I')
+
+
+class QuantileSketch:
+    """Quantile sketch class.
+
+    The rank error of the estimated quantiles is about 1.7 / k of the
+    number of values (under 1% for the default k).
+    """
+
+    def __init__(self, quantity=Degree, k=200, seed=None):
+        """Initialize new QuantileSketch instances.
+
+        Args:
+            quantity: The quantity class of the values.
+            k: An int controlling the accuracy and the size of the sketch.
+            seed: An optional seed of the compaction coin flips.
+
+        Raises:
+            ValueError if k is lower than 8.
+        """
+        if k < 8:
+            raise ValueError(k)
+        self._quantity = quantity
+        self._k = int(k)
+        self._random = random.Random(seed)
+        self._compactors = [[]]
+        self._count = 0
+        self._min = math.inf
+        self._max = -math.inf
+
+    def __len__(self):
+        return self._count
+
+    @property
+    def quantity(self):
+        """Quantity class of the values."""
+        return self._quantity
+
+    @property
+    def k(self):
+        """Accuracy parameter of the sketch."""
+        return self._k
+
+    @property
+    def retained(self):
+        """Number of values retained by the sketch.
+
+        Returns:
+            An int, growing with the logarithm of the number of values.
+        """
+        return sum(len(compactor) for compactor in self._compactors)
+
+    def _capacity(self, height):
+        depth = len(self._compactors) - height - 1
+        return max(2, math.ceil(self._k * (2 / 3) ** depth))
+
+    def _compress(self):
+        """Compact every level holding more values than its capacity.
+
+        A compaction sorts a level and promotes every other value, chosen
+        from a random start, to the next level where it weighs twice.
+        """
+        compactors = self._compactors
+        height = 0
+        while height < len(compactors):
+            compactor = compactors[height]
+            if len(compactor) >= self._capacity(height):
+                if height + 1 == len(compactors):
+                    compactors.append([])
+                compactor.sort()
+                start = self._random.getrandbits(1)
+                compactors[height + 1].extend(compactor[start::2])
+                compactor.clear()
+            height += 1
+
+    def _ingest(self, values):
+        if not values:
+            return
+        self._compactors[0].extend(values)
+        self._count += len(values)
+        self._min = min(self._min, min(values))
+        self._max = max(self._max, max(values))
+        if len(self._compactors[0]) >= self._capacity(0):
+            self._compress()
+
+    def add(self, value):
+        """Add a quantity, in any scale.
+
+        Raises:
+            TypeError if the value is not of the sketch dimension.
+        """
+        if value.dimension != self._quantity.dimension:
+            raise TypeError(type(value).__name__)
+        gain, offset = self._quantity._canonical[value.scale]
+        self._ingest([gain * value.value + offset])
+
+    def extend(self, values, scale=None):
+        """Add many values.
+
+        Args:
+            values: A quantity array, or an iterable of floats.
+            scale: A string containing the scale of the floats. Ignored for
+                quantity arrays.
+
+        Raises:
+            TypeError if the values are not of the sketch dimension.
+            NameError if the scale is not supported.
+        """
+        if hasattr(values, 'dimension'):
+            if values.dimension != self._quantity.dimension:
+                raise TypeError(type(values).__name__)
+            scale = values.scale
+            values = values.values
+        if scale not in self._quantity._scales:
+            raise NameError(scale)
+        gain, offset = self._quantity._canonical[scale]
+        self._ingest([gain * value + offset for value in values])
+
+    def merge(self, other):
+        """Merge another sketch of the same quantity into this one.
+
+        Raises:
+            TypeError if the sketches do not share the same dimension.
+        """
+        if other._quantity.dimension != self._quantity.dimension:
+            raise TypeError(other._quantity.__name__)
+        for height, compactor in enumerate(other._compactors):
+            if height == len(self._compactors):
+                self._compactors.append([])
+            self._compactors[height].extend(compactor)
+        self._count += other._count
+        self._min = min(self._min, other._min)
+        self._max = max(self._max, other._max)
+        self._compress()
+
+    def _canonical_quantiles(self, fractions):
+        if not self._count:
+            raise ValueError('empty sketch')
+        for fraction in fractions:
+            if not 0 <= fraction <= 1:
+                raise ValueError(fraction)
+        items = sorted(
+            (value, 1 << height)
+            for height, compactor in enumerate(self._compactors)
+            for value in compactor
+        )
+        total = sum(weight for _, weight in items)
+        results = {}
+        index = 0
+        cumulative = items[0][1]
+        for fraction in sorted(set(fractions)):
+            target = fraction * total
+            while cumulative < target and index + 1 < len(items):
+                index += 1
+                cumulative += items[index][1]
+            results[fraction] = items[index][0]
+        results[0] = self._min
+        results[1] = self._max
+        return [results[fraction] for fraction in fractions]
+
+    def quantiles(self, fractions, scale=None):
+        """Estimate quantiles.
+
+        Args:
+            fractions: An iterable of floats between 0 and 1.
+            scale: A string containing the scale of the results, the
+                canonical scale of the quantity by default.
+
+        Returns:
+            A list of quantities expressed in the given scale.
+
+        Raises:
+            ValueError if the sketch is empty or a fraction out of [0, 1].
+        """
+        quantity = self._quantity
+        if scale is None:
+            scale = quantity._base
+        if scale not in quantity._scales:
+            raise NameError(scale)
+        gain, offset = quantity._canonical[scale]
+        return [
+            quantity(scale, (value - offset) / gain)
+            for value in self._canonical_quantiles(list(fractions))
+        ]
+
+    def quantile(self, fraction, scale=None):
+        """Estimate a quantile.
+
+        Returns:
+            A quantity expressed in the given scale.
+        """
+        return self.quantiles([fraction], scale)[0]
+
+    def to_bytes(self):
+        """Serialise the sketch.
+
+        The retained values are stored as float64, so the size of the
+        result grows with the logarithm of the number of values.
+
+        Returns:
+            A bytes object.
+        """
+        chunks = [_header.pack(
+            _magic,
+            1,
+            *self._quantity.dimension,
+            self._k,
+            self._count,
+            self._min,
+            self._max,
+            len(self._compactors),
+        )]
+        for compactor in self._compactors:
+            values = array.array('d', compactor)
+            if sys.byteorder == 'big':
+                values.byteswap()
+            chunks.append(_level.pack(len(compactor)))
+            chunks.append(values.tobytes())
+        return b''.join(chunks)
+
+    @classmethod
+    def from_bytes(cls, data, seed=None):
+        """Deserialise a sketch.
+
+        Raises:
+            ValueError if the data is not a serialised sketch, including
+            truncated data and data followed by extra bytes.
+        """
+        data = memoryview(data).cast('B')
+        if len(data) < _header.size:
+            raise ValueError('not a quantile sketch')
+        magic, version, *dimension, k, count, low, high, levels = \
+            _header.unpack_from(data)
+        if magic != _magic or version != 1:
+            raise ValueError('not a quantile sketch')
+        try:
+            quantity = dimensions.quantity_type(tuple(dimension))
+        except KeyError:
+            raise ValueError('not a quantile sketch') from None
+        sketch = cls(quantity, k, seed)
+        sketch._count = count
+        sketch._min = low
+        sketch._max = high
+        sketch._compactors = []
+        position = _header.size
+        for _ in range(levels):
+            if len(data) - position < _level.size:
+                raise ValueError('not a quantile sketch')
+            length, = _level.unpack_from(data, position)
+            position += _level.size
+            if len(data) - position < 8 * length:
+                raise ValueError('not a quantile sketch')
+            values = array.array('d')
+            values.frombytes(data[position:position + 8 * length])
+            if sys.byteorder == 'big':
+                values.byteswap()
+            position += 8 * length
+            sketch._compactors.append(values.tolist())
+        if position != len(data):
+            raise ValueError('not a quantile sketch')
+        return sketch
@@ -0,0 +1,74 @@
+"""Speeds conversions.
+
+Speeds result from the division of a Distance by a Duration.
+
+Copyright (c) 2020 Thierry P.G. DECKER
+All Rights Reserved.
+Released under the MIT license
+
+"""
+
+from siarnaq import dimensions
+from siarnaq.arrays import ScaledArray
+
+
+class Speed(dimensions.Quantity):
+    """Speed class.
+
+    """
+    dimension = dimensions.quotient(dimensions.LENGTH, dimensions.TIME)
+    _scales = {
+        #
+        # Supported scales
+        #
+        'kmh',  # Kilometer per hour
+        'mph',  # Mile per hour
+    }
+    _canonical = {
+        #
+        # Affine coefficients (gain, offset) from each scale to km/h
+        #
+        'kmh': (1., 0.),
+        'mph': (1.609, 0.),
+    }
+    _symbols = {
+        'kmh': 'km/h',
+        'mph': 'mph',
+    }
+    _base = 'kmh'
+    _preferred = {
+        #
+        # Distance scale of the numerator: speed scale
+        #
+        'km': 'kmh',
+        'mi': 'mph',
+    }
+
+    @property
+    def kilometer_per_hour(self):
+        """Kilometer per hour value.
+
+        Returns:
+            A float containing the km/h value.
+        """
+        return self.in_scale('kmh')
+
+    @property
+    def mile_per_hour(self):
+        """Mile per hour value.
+
+        Returns:
+            A float containing the mph value.
+        """
+        return self.in_scale('mph')
+
+
+class SpeedArray(ScaledArray):
+    """Speed array class.
+
+    A compact container of speeds sharing one scale.
+    """
+    _quantity = Speed
+
+
+dimensions.register(Speed, SpeedArray)
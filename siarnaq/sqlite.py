@@ -0,0 +1,257 @@
+"""SQLite storage.
+
+This module stores readings in SQLite tables holding the value of each
+reading in the canonical unit of its quantity (Kelvin, kilometer...) in an
+indexed REAL column, next to its original value and scale, which are read
+back without conversion noise.
+
+Range queries given as quantities in any scale are translated into
+predicates on the canonical column, which SQLite answers from the index
+without converting the rows. Writes are batched with executemany, in one
+transaction per call.
+
+Copyright (c) 2020 Thierry P.G. DECKER
+All Rights Reserved.
+Released under the MIT license
+
+"""
+
+import itertools
+import sqlite3
+
+from siarnaq import dimensions
+from siarnaq.degrees import Degree
+from siarnaq.degrees import FrozenDegree
+from siarnaq.degrees import ObservableDegree
+from siarnaq.distances import Distance
+from siarnaq.distances import FrozenDistance
+from siarnaq.distances import ObservableDistance
+
+_quantities = (
+    #
+    # Classes adapted into their canonical value. sqlite3 looks adapters up
+    # by exact type, so every variant is listed
+    #
+    Degree,
+    FrozenDegree,
+    ObservableDegree,
+    Distance,
+    FrozenDistance,
+    ObservableDistance,
+)
+
+
+def _canonical(value):
+    gain, offset = value._canonical[value.scale]
+    return gain * value.value + offset
+
+
+def register():
+    """Register the quantities with the sqlite3 module.
+
+    Degree and Distance objects passed as query parameters are adapted into
+    their canonical value, and columns declared as DEGREE or DISTANCE are
+    converted into Kelvin Degree or kilometer Distance objects on
+    connections opened with detect_types=sqlite3.PARSE_DECLTYPES.
+    """
+    for quantity in _quantities:
+        sqlite3.register_adapter(quantity, _canonical)
+    sqlite3.register_converter(
+        'DEGREE', lambda data: Degree('ke', float(data)))
+    sqlite3.register_converter(
+        'DISTANCE', lambda data: Distance('km', float(data)))
+
+
+class ReadingStore:
+    """Reading store class.
+
+    Rows hold a sensor key, a timestamp, the original value and scale and
+    the canonical value of a reading.
+    """
+
+    def __init__(self, connection, table='readings', quantity=Degree,
+                 batch_size=10000):
+        """Initialize new ReadingStore instances.
+
+        The table and its index on the canonical column are created if
+        needed.
+
+        Args:
+            connection: A sqlite3.Connection.
+            table: A string containing the name of the table.
+            quantity: The quantity class of the readings.
+            batch_size: An int containing the number of rows sent per
+                executemany call.
+
+        Raises:
+            ValueError if the table name is not an identifier or the batch
+            size is not positive.
+        """
+        if not table.isidentifier():
+            raise ValueError(table)
+        if batch_size <= 0:
+            raise ValueError(batch_size)
+        self._connection = connection
+        self._table = table
+        self._quantity = quantity
+        self._batch_size = batch_size
+        with connection:
+            connection.execute(
+                f'CREATE TABLE IF NOT EXISTS {table} ('
+                f'sensor TEXT, timestamp NUMERIC, value REAL NOT NULL, '
+                f'scale TEXT NOT NULL, canonical REAL NOT NULL)')
+            connection.execute(
+                f'CREATE INDEX IF NOT EXISTS {table}_canonical '
+                f'ON {table} (canonical)')
+
+    def __len__(self):
+        return self._connection.execute(
+            f'SELECT COUNT(*) FROM {self._table}').fetchone()[0]
+
+    def _check(self, value):
+        if value.dimension != self._quantity.dimension:
+            raise TypeError(type(value).__name__)
+
+    def _write(self, rows):
+        """Write rows in batches, in one transaction."""
+        sql = f'INSERT INTO {self._table} VALUES (?, ?, ?, ?, ?)'
+        count = 0
+        with self._connection:
+            while True:
+                batch = list(itertools.islice(rows, self._batch_size))
+                if not batch:
+                    return count
+                self._connection.executemany(sql, batch)
+                count += len(batch)
+
+    def insert(self, rows):
+        """Insert readings.
+
+        Args:
+            rows: An iterable of (sensor, timestamp, quantity) tuples, the
+                quantities being in any scale.
+
+        Returns:
+            An int containing the number of inserted rows.
+
+        Raises:
+            TypeError if a reading is not of the store quantity.
+        """
+        def encoded():
+            for sensor, timestamp, value in rows:
+                self._check(value)
+                yield (sensor, timestamp, value.value, value.scale,
+                       _canonical(value))
+        return self._write(encoded())
+
+    def insert_array(self, sensor, timestamps, values):
+        """Insert the readings of an array.
+
+        Args:
+            sensor: The sensor key of the readings.
+            timestamps: A sequence of numbers.
+            values: A quantity array of the same length.
+
+        Returns:
+            An int containing the number of inserted rows.
+
+        Raises:
+            ValueError if the lengths differ.
+            TypeError if the array is not of the store quantity.
+        """
+        self._check(values)
+        if len(timestamps) != len(values):
+            raise ValueError((len(timestamps), len(values)))
+        scale = values.scale
+        gain, offset = self._quantity._canonical[scale]
+        return self._write(
+            (sensor, timestamp, value, scale, gain * value + offset)
+            for timestamp, value in zip(timestamps, values.values))
+
+    def _select(self, columns, low, high, sensor):
+        """Build a query of the rows within [low, high]."""
+        clauses = []
+        parameters = []
+        for value, operator in ((low, '>='), (high, '<=')):
+            if value is not None:
+                self._check(value)
+                clauses.append(f'canonical {operator} ?')
+                parameters.append(_canonical(value))
+        if sensor is not None:
+            clauses.append('sensor = ?')
+            parameters.append(sensor)
+        sql = f'SELECT {columns} FROM {self._table}'
+        if clauses:
+            sql += ' WHERE ' + ' AND '.join(clauses)
+        return sql + ' ORDER BY rowid', parameters
+
+    def query(self, low=None, high=None, scale=None, sensor=None):
+        """Readings within a range.
+
+        Args:
+            low: An optional quantity, in any scale, lower bound included.
+            high: An optional quantity, in any scale, upper bound included.
+            scale: A string containing the scale of the results. By default
+                the readings are returned in their original scale.
+            sensor: An optional sensor key.
+
+        Returns:
+            A list of (sensor, timestamp, quantity) tuples, in insertion
+            order.
+
+        Raises:
+            TypeError if a bound is not of the store quantity.
+            NameError if the scale is not supported.
+        """
+        quantity = self._quantity
+        sql, parameters = self._select(
+            'sensor, timestamp, value, scale', low, high, sensor)
+        converters = {}
+        results = []
+        for sensor, timestamp, value, source in \
+                self._connection.execute(sql, parameters):
+            target = source if scale is None else scale
+            try:
+                converter = converters[source]
+            except KeyError:
+                converter = converters[source] = quantity.converter(
+                    source, target)
+            results.append(
+                (sensor, timestamp, quantity(target, converter(value))))
+        return results
+
+    def query_array(self, low=None, high=None, scale=None, sensor=None):
+        """Readings within a range, as an array.
+
+        Args:
+            low: An optional quantity, lower bound included.
+            high: An optional quantity, upper bound included.
+            scale: A string containing the scale of the array, the
+                canonical scale by default.
+            sensor: An optional sensor key.
+
+        Returns:
+            A (timestamps, array) tuple, in insertion order.
+
+        Raises:
+            TypeError if a bound is not of the store quantity.
+            NameError if the scale is not supported.
+        """
+        quantity = self._quantity
+        if scale is None:
+            scale = quantity._base
+        sql, parameters = self._select(
+            'timestamp, value, scale', low, high, sensor)
+        converters = {}
+        timestamps = []
+        values = []
+        for timestamp, value, source in \
+                self._connection.execute(sql, parameters):
+            try:
+                converter = converters[source]
+            except KeyError:
+                converter = converters[source] = quantity.converter(
+                    source, scale)
+            timestamps.append(timestamp)
+            values.append(converter(value))
+        return timestamps, dimensions.array_type(quantity)(scale, values)
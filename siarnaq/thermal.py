@@ -0,0 +1,139 @@
+"""Thermal comfort metrics.
+
+This module derives the dew point, the heat index and the wind chill from
+temperatures and their companion humidity or wind readings.
+
+The metrics accept a Degree with scalar companions, or a DegreeArray with
+companion sequences of the same length. Temperatures are converted once per
+call, whatever their scale, and the results are returned in the requested
+scale (the scale of the temperatures by default).
+
+Copyright (c) 2020 Thierry P.G. DECKER
+All Rights Reserved.
+Released under the MIT license
+
+"""
+
+import math
+
+from siarnaq.degrees import Degree
+from siarnaq.degrees import DegreeArray
+from siarnaq.speeds import Speed
+
+
+def _dew_point(celcius, humidity):
+    """Magnus formula (Sonntag 1990 coefficients), in Celcius."""
+    gamma = math.log(humidity / 100) + 17.62 * celcius / (243.12 + celcius)
+    return 243.12 * gamma / (17.62 - gamma)
+
+
+def _heat_index(fahrenheit, humidity):
+    """NWS heat index (Rothfusz regression and adjustments), in Fahrenheit."""
+    simple = 0.5 * (fahrenheit + 61 + (fahrenheit - 68) * 1.2
+                    + humidity * 0.094)
+    if simple < 80:
+        return simple
+    t = fahrenheit
+    rh = humidity
+    index = (-42.379 + 2.04901523 * t + 10.14333127 * rh
+             - 0.22475541 * t * rh - 0.00683783 * t * t
+             - 0.05481717 * rh * rh + 0.00122874 * t * t * rh
+             + 0.00085282 * t * rh * rh - 0.00000199 * t * t * rh * rh)
+    if rh < 13 and 80 <= t <= 112:
+        index -= (13 - rh) / 4 * math.sqrt((17 - abs(t - 95)) / 17)
+    elif rh > 85 and 80 <= t <= 87:
+        index += (rh - 85) / 10 * (87 - t) / 5
+    return index
+
+
+def _wind_chill(celcius, wind):
+    """Wind chill index (JAG/TI 2001), in Celcius, wind in km/h.
+
+    Outside of its domain (above 10 °C or below 4.8 km/h) the index is the
+    air temperature.
+    """
+    if celcius > 10 or wind < 4.8:
+        return celcius
+    power = wind ** 0.16
+    return 13.12 + 0.6215 * celcius - 11.37 * power \
+        + 0.3965 * celcius * power
+
+
+def _metric(function, temps, companions, working, scale):
+    """Apply a metric formula to scalar or array temperatures.
+
+    Args:
+        function: The formula, taking a temperature in the working scale
+            and a companion value.
+        temps: A Degree or a DegreeArray.
+        companions: A float, or a sequence of floats for arrays.
+        working: A string containing the scale of the formula.
+        scale: A string containing the scale of the results, or None for
+            the scale of the temperatures.
+
+    Raises:
+        ValueError if the companions and the temperatures lengths differ.
+        NameError if the given scale is not supported.
+    """
+    if scale is None:
+        scale = temps.scale
+    gain, offset = Degree.affine(temps.scale, working)
+    back_gain, back_offset = Degree.affine(working, scale)
+    if isinstance(temps, DegreeArray):
+        companions = list(companions)
+        if len(companions) != len(temps):
+            raise ValueError((len(temps), len(companions)))
+        return DegreeArray(scale, [
+            back_gain * function(gain * value + offset, companion)
+            + back_offset
+            for value, companion in zip(temps.values, companions)
+        ])
+    value = function(gain * temps.value + offset, float(companions))
+    return Degree(scale, back_gain * value + back_offset)
+
+
+def dew_point(temps, humidity, scale=None):
+    """Dew point.
+
+    Args:
+        temps: A Degree or a DegreeArray of air temperatures.
+        humidity: The relative humidity in percent, a float or a sequence.
+        scale: A string containing the scale of the results.
+
+    Returns:
+        A Degree or a DegreeArray.
+    """
+    return _metric(_dew_point, temps, humidity, 'ce', scale)
+
+
+def heat_index(temps, humidity, scale=None):
+    """Heat index, following the US National Weather Service algorithm.
+
+    Args:
+        temps: A Degree or a DegreeArray of air temperatures.
+        humidity: The relative humidity in percent, a float or a sequence.
+        scale: A string containing the scale of the results.
+
+    Returns:
+        A Degree or a DegreeArray.
+    """
+    return _metric(_heat_index, temps, humidity, 'fa', scale)
+
+
+def wind_chill(temps, wind, scale=None):
+    """Wind chill index.
+
+    Args:
+        temps: A Degree or a DegreeArray of air temperatures.
+        wind: The wind speed at 10 m: a Speed or a SpeedArray, or floats in
+            km/h.
+        scale: A string containing the scale of the results.
+
+    Returns:
+        A Degree or a DegreeArray.
+    """
+    if isinstance(wind, Speed):
+        wind = wind.kilometer_per_hour
+    elif hasattr(wind, 'dimension'):
+        wind = wind.to('kmh').values
+    return _metric(_wind_chill, temps, wind, 'ce', scale)
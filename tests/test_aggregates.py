@@ -0,0 +1,119 @@
+"""Test aggregates module.
+
+Copyright (c) 2020 Thierry P.G. DECKER
+All Rights Reserved.
+Released under the MIT license
+
+"""
+
+import copy
+import random
+
+import pytest
+
+from siarnaq.aggregates import Aggregate
+from siarnaq.degrees import Degree
+from siarnaq.degrees import ObservableDegree
+from siarnaq.distances import Distance
+from siarnaq.distances import ObservableDistance
+
+
+def test_observers():
+    calls = []
+    r = ObservableDegree('ce', 10)
+    r.observe(calls.append)
+    r.temp = 20
+    r.scale = 'fa'
+    assert calls == [r, r]
+    assert round(r.temp, 2) == 68.00
+    r.unobserve(calls.append)
+    r.temp = 0
+    assert len(calls) == 2
+    with pytest.raises(ValueError):
+        r.unobserve(calls.append)
+    assert type(r + 1) is ObservableDegree
+    temps = ObservableDegree.from_values('ce', [1, 2])
+    temps[0].observe(calls.append)
+    temps[0].temp = 3
+    assert calls[-1] is temps[0]
+    assert ObservableDegree.from_values('ce', [1], True).values == [1.]
+    assert not hasattr(Degree('ce', 1), 'observe')
+
+
+def test_aggregate():
+    temps = [ObservableDegree('ce', 10), ObservableDegree('fa', 68),
+             ObservableDegree('ke', 303.15)]
+    aggregate = Aggregate(Degree, 'ce', temps)
+    assert len(aggregate) == 3
+    assert temps[0] in aggregate
+    assert round(aggregate.sum, 9) == 60.
+    assert round(aggregate.mean, 9) == 20.
+    assert round(aggregate.min, 9) == 10.
+    assert round(aggregate.max, 9) == 30.
+
+    temps[2].temp = 273.15
+    assert round(aggregate.max, 9) == 20.
+    assert round(aggregate.min, 9) == 0.
+    temps[1].scale = 'ke'
+    assert round(aggregate.mean, 9) == 10.
+    aggregate.remove(temps[2])
+    assert temps[2] not in aggregate
+    temps[2].temp = 1000
+    assert round(aggregate.max, 9) == 20.
+    assert round(aggregate.sum, 9) == 30.
+    with pytest.raises(KeyError):
+        aggregate.remove(temps[2])
+    with pytest.raises(KeyError):
+        aggregate.add(temps[0])
+
+    fahrenheit = Aggregate(Degree, 'fa', temps[:2])
+    assert round(fahrenheit.sum, 9) == 118.
+    assert round(fahrenheit.max, 9) == 68.
+
+
+def test_copies():
+    r = ObservableDegree('ce', 1)
+    aggregate = Aggregate(Degree, 'ce', [r])
+    for copied in (copy.copy(r), copy.deepcopy(r)):
+        copied.temp = 5
+        assert copied not in aggregate
+        assert aggregate.max == 1.
+    aggregate._update(ObservableDegree('ce', 5))
+    assert aggregate.sum == 1.
+    r.temp = 3
+    assert aggregate.sum == 3.
+
+
+def test_random_updates():
+    generator = random.Random(0)
+    dists = ObservableDistance.from_values(
+        'km', [generator.uniform(0, 100) for _ in range(50)])
+    aggregate = Aggregate(Distance, 'mi', dists)
+    for _ in range(2000):
+        dist = generator.choice(dists)
+        if generator.random() < 0.1:
+            dist.scale = generator.choice(['km', 'mi'])
+        else:
+            dist.dist = generator.uniform(0, 100)
+    miles = [dist.mile for dist in dists]
+    assert round(aggregate.sum, 6) == round(sum(miles), 6)
+    assert round(aggregate.mean, 6) == round(sum(miles) / len(miles), 6)
+    assert round(aggregate.min, 9) == round(min(miles), 9)
+    assert round(aggregate.max, 9) == round(max(miles), 9)
+    assert len(aggregate._low) <= 2 * len(dists) + 34
+
+
+def test_errors():
+    aggregate = Aggregate()
+    assert aggregate.scale == 'ke'
+    assert aggregate.sum == 0.
+    with pytest.raises(ValueError):
+        aggregate.mean
+    with pytest.raises(ValueError):
+        aggregate.max
+    with pytest.raises(TypeError):
+        aggregate.add(Degree('ce', 1))
+    with pytest.raises(TypeError):
+        aggregate.add(ObservableDistance('km', 1))
+    with pytest.raises(NameError):
+        Aggregate(Degree, 'km')
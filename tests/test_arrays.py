@@ -0,0 +1,147 @@
+"""Arrays tests module.
+
+Copyright (c) 2020 Thierry P.G. DECKER
+All Rights Reserved.
+Released under the MIT license
+
+"""
+
+import pytest
+
+from siarnaq.degrees import Degree
+from siarnaq.degrees import DegreeArray
+from siarnaq.distances import Distance
+from siarnaq.distances import DistanceArray
+
+
+def test_affine():
+    assert Degree.affine('ce', 'ce') == (1., 0.)
+    gain, offset = Degree.affine('ce', 'fa')
+    assert round(gain, 2) == 1.80
+    assert round(offset, 2) == 32.00
+    gain, offset = Degree.affine('ra', 'ce')
+    assert round(gain * 491.67 + offset, 2) == 0.00
+    assert Degree.affine('fa', 'ce') == (5 / 9, -160 / 9)
+    assert Degree.affine('fa', 'ra') == (1., 459.67)
+    assert Degree.affine('ra', 'ke') == (5 / 9, 0.)
+    gain, offset = Distance.affine('mi', 'km')
+    assert gain == 1.609
+    assert offset == 0.
+    with pytest.raises(NameError):
+        Degree.affine('ce', 'Dummy')
+    with pytest.raises(NameError):
+        Distance.affine('Dummy', 'km')
+
+
+def test_instanciations():
+    assert len(DegreeArray('ce')) == 0
+    assert DegreeArray('ce', [1, 2]).values == [1., 2.]
+    assert DegreeArray('fa', [1], dtype='float32').dtype == 'float32'
+    assert DegreeArray('ke', [1], dtype='int16').resolution == 0.01
+    assert DegreeArray('ke', [1], dtype='float32').resolution is None
+    r = DistanceArray('km', [1], dtype='int32', resolution=1)
+    assert r.resolution == 1
+
+    with pytest.raises(NameError):
+        DegreeArray('Dummy')
+    with pytest.raises(NameError):
+        DegreeArray('ce', dtype='Dummy')
+    with pytest.raises(ValueError):
+        DegreeArray('ce', dtype='int16', resolution=0)
+    with pytest.raises(OverflowError):
+        DegreeArray('ke', [400], dtype='int16')
+
+
+def test_storage():
+    assert DegreeArray('ce', [0] * 10).nbytes == 80
+    assert DegreeArray('ce', [0] * 10, dtype='float32').nbytes == 40
+    assert DegreeArray('ce', [0] * 10, dtype='int32').nbytes == 40
+    assert DegreeArray('ce', [0] * 10, dtype='int16').nbytes == 20
+
+    r = DegreeArray('ce', [21.57, -3.1], dtype='int16')
+    assert [round(v, 2) for v in r.values] == [21.57, -3.10]
+    r = DegreeArray('ce', [21.5], dtype='float32')
+    assert r.values == [21.5]
+
+
+def test_items():
+    r = DegreeArray('fa', [1, 2, 3])
+    assert isinstance(r[0], Degree)
+    assert r[0].scale == 'fa'
+    assert r[-1].temp == 3.
+    assert isinstance(r[1:], DegreeArray)
+    assert r[1:].values == [2., 3.]
+    assert [d.temp for d in r] == [1., 2., 3.]
+
+    r = DistanceArray('mi', [1.5], dtype='int32', resolution=0.5)
+    assert isinstance(r[0], Distance)
+    assert r[0].dist == 1.5
+
+    r.append(2)
+    r.extend([3, 4])
+    assert r.values == [1.5, 2., 3., 4.]
+
+
+def test_conversions():
+    values = [-40., 0., 21.57, 100.]
+    for dtype in ('float64', 'float32', 'int32', 'int16'):
+        r = DegreeArray('ce', values, dtype=dtype)
+        for scale in ('ce', 'fa', 'ke', 'ra'):
+            if dtype == 'int16' and scale in ('ke', 'ra'):
+                continue
+            converted = r.to(scale)
+            assert converted.scale == scale
+            assert converted.dtype == dtype
+            error = r.conversion_error(scale)
+            for value, result in zip(values, converted.values):
+                exact = Degree('ce', value)
+                expected = getattr(exact, {
+                    'ce': 'celcius',
+                    'fa': 'fahrenheit',
+                    'ke': 'kelvin',
+                    'ra': 'rankine',
+                }[scale])
+                assert abs(result - expected) <= error + 1e-9
+
+    r = DistanceArray('km', [1.609])
+    r.scale = 'mi'
+    assert r.scale == 'mi'
+    assert round(r.values[0], 2) == 1.00
+    with pytest.raises(NameError):
+        r.scale = 'Dummy'
+
+
+def test_float_conversions_match_objects():
+    values = [-40., 0., 20., 21.57, 37., 100., 1234.5678]
+    for source in ('ce', 'fa', 'ke', 'ra'):
+        for scale in ('ce', 'fa', 'ke', 'ra'):
+            converted = DegreeArray(source, values).to(scale).values
+            assert converted == [
+                Degree(source, value).to(scale).temp for value in values]
+    assert DegreeArray('fa', [37.]).to('ce').values == \
+        [Degree('fa', 37).celcius]
+    r = DistanceArray('mi', [12.5])
+    r.scale = 'km'
+    assert r.values == [Distance('mi', 12.5).kilometer]
+
+
+def test_conversion_error():
+    r = DegreeArray('ce', [20], dtype='int16', resolution=0.01)
+    assert r.conversion_error('ce') == 0.005
+    assert round(r.conversion_error('fa'), 4) == 0.014
+    assert DegreeArray('ce', [20]).conversion_error('fa') < 1e-12
+    r = DegreeArray('ce', [20], dtype='float32')
+    assert r.conversion_error('ke') < 1e-4
+
+
+def test_astype():
+    r = DegreeArray('ce', [1.25, 2.5]).astype('int16', resolution=0.25)
+    assert r.dtype == 'int16'
+    assert r.values == [1.25, 2.5]
+
+
+def test_repr():
+    assert repr(DegreeArray('ce', [1])) == \
+        'DegreeArray(\'ce\', [1.0], dtype=\'float64\')'
+    assert repr(DistanceArray('mi', [1], dtype='int16', resolution=0.5)) == \
+        'DistanceArray(\'mi\', [1.0], dtype=\'int16\', resolution=0.5)'
@@ -0,0 +1,75 @@
+"""Calibration tests module.
+
+Copyright (c) 2020 Thierry P.G. DECKER
+All Rights Reserved.
+Released under the MIT license
+
+"""
+
+import pytest
+
+from siarnaq.calibration import Calibrations
+from siarnaq.calibration import fuse
+from siarnaq.degrees import Degree
+from siarnaq.degrees import DegreeArray
+from siarnaq.distances import Distance
+from siarnaq.distances import DistanceArray
+
+
+def test_fuse():
+    gain, offset = fuse(2, 1, Degree, 'ce', 'ce')
+    assert (gain, offset) == (2, 1)
+    gain, offset = fuse(1.01, -0.5, Degree, 'fa', 'ke')
+    expected = Degree('fa', 1.01 * 70 - 0.5).kelvin
+    assert round(gain * 70 + offset, 9) == round(expected, 9)
+    gain, offset = fuse(1, 0, Distance, 'mi', 'km')
+    assert (gain, offset) == (1.609, 0)
+    with pytest.raises(NameError):
+        fuse(1, 0, Degree, 'ce', 'Dummy')
+
+
+def test_registry():
+    calibrations = Calibrations()
+    calibrations.set('a', 2, 1)
+    assert 'a' in calibrations
+    assert len(calibrations) == 1
+    assert calibrations.fused('a', 'ce', 'ce') == (2, 1)
+    assert calibrations.fused('a', 'ce', 'fa') is \
+        calibrations.fused('a', 'ce', 'fa')
+
+    calibrations.set('a', 1, 0)
+    assert calibrations.fused('a', 'ce', 'ce') == (1, 0)
+
+    calibrations.remove('a')
+    assert 'a' not in calibrations
+    with pytest.raises(KeyError):
+        calibrations.fused('a', 'ce', 'ce')
+    with pytest.raises(KeyError):
+        calibrations.remove('a')
+
+
+def test_apply():
+    calibrations = Calibrations()
+    calibrations.set('a', 1, 0)
+    calibrations.set('b', 2, -1)
+    result = calibrations.apply(['a', 'b', 'a'], [0, 1, 100], 'ce', 'fa')
+    assert isinstance(result, DegreeArray)
+    assert result.scale == 'fa'
+    assert [round(v, 2) for v in result.values] == [32.00, 33.80, 212.00]
+
+    result = calibrations.apply(['a', 'b'], [32, 0], ['fa', 'ce'], 'ce')
+    assert [round(v, 2) for v in result.values] == [0.00, -1.00]
+
+    with pytest.raises(KeyError):
+        calibrations.apply(['Dummy'], [0], 'ce', 'ce')
+
+
+def test_apply_many_sensors():
+    calibrations = Calibrations(Distance)
+    for sensor in range(5000):
+        calibrations.set(sensor, 1 + sensor / 10000, 0)
+    sensors = [i % 5000 for i in range(20000)]
+    result = calibrations.apply(sensors, [1.] * 20000, 'mi', 'km')
+    assert isinstance(result, DistanceArray)
+    assert len(result) == 20000
+    assert result.values[4999] == 1.609 * (1 + 4999 / 10000)
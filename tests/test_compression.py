@@ -0,0 +1,94 @@
+"""Compression tests module.
+
+Copyright (c) 2020 Thierry P.G. DECKER
+All Rights Reserved.
+Released under the MIT license
+
+"""
+
+import math
+import random
+
+import pytest
+
+from siarnaq.compression import decode
+from siarnaq.compression import encode
+from siarnaq.degrees import DegreeArray
+from siarnaq.distances import DistanceArray
+
+
+def _series(size, seed=0):
+    generator = random.Random(seed)
+    timestamps = []
+    temps = []
+    timestamp = 1600000000
+    for i in range(size):
+        timestamp += 60 + generator.choice((0, 0, 0, 1, -1, 1000))
+        timestamps.append(timestamp)
+        temps.append(round(20 + 5 * math.sin(i / 200)
+                           + generator.gauss(0, 0.05), 2))
+    return timestamps, DegreeArray('fa', temps)
+
+
+def test_round_trip():
+    timestamps, temps = _series(5000)
+    data = encode(timestamps, temps, block_size=512)
+    decoded_timestamps, decoded = decode(data)
+    assert decoded_timestamps == timestamps
+    assert isinstance(decoded, DegreeArray)
+    assert decoded.scale == 'fa'
+    assert decoded.values == temps.values
+    assert len(data) < temps.nbytes + 8 * len(timestamps)
+
+
+def test_special_values():
+    timestamps = [0, 1, 2, 10 ** 12, 10 ** 12 + 1, -5, 3, 3]
+    values = [0., -0., 1e308, -1e-308, math.inf, 5e-324, 1., 1.]
+    data = encode(timestamps, DistanceArray('mi', values), block_size=3)
+    decoded_timestamps, decoded = decode(data)
+    assert decoded_timestamps == timestamps
+    assert isinstance(decoded, DistanceArray)
+    assert decoded.scale == 'mi'
+    assert decoded.values == values
+
+    decoded_timestamps, decoded = decode(encode([], DegreeArray('ce')))
+    assert decoded_timestamps == []
+    assert len(decoded) == 0
+
+
+def test_seeking():
+    timestamps = list(range(0, 10000, 10))
+    temps = DegreeArray('ce', [t / 100 for t in timestamps])
+    data = encode(timestamps, temps, block_size=64)
+    decoded_timestamps, decoded = decode(data, start=5005, stop=5100)
+    assert decoded_timestamps == list(range(5010, 5100, 10))
+    assert decoded.values == [t / 100 for t in range(5010, 5100, 10)]
+    assert decode(data, stop=20)[0] == [0, 10]
+    assert decode(data, start=9990)[0] == [9990]
+    assert decode(data, start=20000)[0] == []
+
+    timestamps = [0, 60, 60, 60, 120]
+    data = encode(timestamps, DegreeArray('ce', [1, 2, 3, 4, 5]),
+                  block_size=2)
+    decoded_timestamps, decoded = decode(data, start=60)
+    assert decoded_timestamps == [60, 60, 60, 120]
+    assert decoded.values == [2., 3., 4., 5.]
+    assert decode(data, start=60, stop=120)[0] == [60, 60, 60]
+
+
+def test_errors():
+    with pytest.raises(ValueError):
+        encode([1, 2], DegreeArray('ce', [1]))
+    with pytest.raises(ValueError):
+        encode([1], DegreeArray('ce', [1]), block_size=0)
+    for timestamp in (1.7, float('nan'), float('inf'), '1'):
+        with pytest.raises(ValueError):
+            encode([0, timestamp], DegreeArray('ce', [1, 2]))
+    assert decode(encode([0, 60.0], DegreeArray('ce', [1, 2])))[0] == [0, 60]
+    with pytest.raises(ValueError):
+        decode(b'Dummy' * 20)
+    data = encode(range(0, 600, 60), DegreeArray('ce', range(10)),
+                  block_size=4)
+    for truncated in (b'', b'abc', data[:20], data[:40], data[:-8]):
+        with pytest.raises(ValueError, match='not an encoded series'):
+            decode(truncated)
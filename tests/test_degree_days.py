@@ -0,0 +1,92 @@
+"""Test degree_days module.
+
+Copyright (c) 2020 Thierry P.G. DECKER
+All Rights Reserved.
+Released under the MIT license
+
+"""
+
+import pytest
+
+from siarnaq.degree_days import DegreeDayEngine
+from siarnaq.degree_days import degree_days
+from siarnaq.degrees import Degree
+from siarnaq.degrees import DegreeArray
+from siarnaq.distances import DistanceArray
+
+HOUR = 3600
+DAY = 86400
+
+
+def test_mean():
+    timestamps = list(range(0, 2 * DAY, HOUR))
+    temps = DegreeArray('ce', [10] * 24 + [20] * 12 + [30] * 12)
+    results = degree_days(timestamps, temps, Degree('fa', 64.4))
+    assert [result.day for result in results] == [0, DAY]
+    assert round(results[0].heating(), 6) == 8.
+    assert round(results[0].heating('fa'), 6) == 14.4
+    assert round(results[0].heating('ke'), 6) == 8.
+    assert results[0].cooling('ra') == 0.
+    assert round(results[1].cooling(), 6) == 7.
+    assert results[1].heating() == 0.
+
+    fahrenheit = degree_days(timestamps, temps.to('fa'), Degree('ce', 18))
+    assert [round(result.heating(), 6) for result in fahrenheit] == [8., 0.]
+
+    results = degree_days(timestamps, temps, Degree('ce', 18), 'mean',
+                          cooling_base=Degree('ce', 24))
+    assert round(results[1].cooling(), 6) == 1.
+
+
+def test_integration():
+    results = degree_days([0, DAY], DegreeArray('ce', [8, 28]),
+                          Degree('ce', 18), 'integration')
+    assert round(results[0].heating(), 6) == 2.5
+    assert round(results[0].cooling(), 6) == 2.5
+    assert len(results) == 1
+
+    results = degree_days([DAY // 2, 3 * DAY // 2, 5 * DAY // 2],
+                          DegreeArray('ce', [10, 10, 10]),
+                          Degree('ce', 18), 'integration')
+    assert [round(result.heating(), 6) for result in results] == [8., 8., 8.]
+
+
+def test_partial_days():
+    timestamps = list(range(0, 2 * DAY, HOUR))
+    temps = DegreeArray('ce', [10] * 48)
+    for method in ('mean', 'integration'):
+        results = degree_days(timestamps, temps, Degree('ce', 18), method)
+        assert [round(result.heating(), 6) for result in results] == [8., 8.]
+
+
+def test_streaming():
+    engine = DegreeDayEngine(Degree('ce', 18), day=24, origin=6)
+    assert engine.feed([6, 12, 18], DegreeArray('ce', [10, 12, 14]),
+                       ['a', 'b', 'a']) == []
+    results = engine.feed([30, 31], DegreeArray('ce', [0, 0]), ['a', 'b'])
+    assert [(result.group, result.day) for result in results] == \
+        [('a', 6), ('b', 6)]
+    assert [round(result.heating(), 6) for result in results] == [6., 6.]
+    results = engine.flush()
+    assert [round(result.heating(), 6) for result in results] == [18., 18.]
+    assert engine.flush() == []
+    assert repr(results[0]) == \
+        "DegreeDays('a', 30, heating=18.0, cooling=0.0)"
+
+
+def test_errors():
+    with pytest.raises(NameError):
+        DegreeDayEngine(Degree('ce', 18), 'Dummy')
+    with pytest.raises(ValueError):
+        DegreeDayEngine(Degree('ce', 18), day=0)
+    engine = DegreeDayEngine(Degree('ce', 18))
+    with pytest.raises(ValueError):
+        engine.feed([1, 2], DegreeArray('ce', [1]))
+    with pytest.raises(ValueError):
+        engine.feed([1], DegreeArray('ce', [1]), ['a', 'b'])
+    with pytest.raises(ValueError):
+        engine.feed([2, 1], DegreeArray('ce', [1, 1]))
+    with pytest.raises(TypeError):
+        engine.feed([1], DistanceArray('km', [1]))
+    with pytest.raises(NameError):
+        degree_days([1], DegreeArray('ce', [1]), Degree())[0].heating('km')
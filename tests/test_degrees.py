@@ -6,9 +6,15 @@ Released under the MIT license
 
 """
 
+import copy
+import pickle
+import weakref
+
 import pytest
 
 from siarnaq.degrees import Degree
+from siarnaq.degrees import FrozenDegree
+from siarnaq.degrees import ObservableDegree
 
 
 def test_instanciations():
@@ -378,3 +384,99 @@ def test_repr():
     r.scale = 'ra'
     r.temp = 0
     assert repr(r) == 'Degree(\'ra\', 0.0)'
+
+
+def test_converter():
+    assert Degree.converter('ce', 'fa') is Degree.conv_ce_to_fa
+    assert Degree.converter('ke', 'ke')(1) == 1.
+    with pytest.raises(NameError):
+        Degree.converter('ce', 'Dummy')
+
+
+def test_cached_views():
+    r = Degree(scale='ce', temp=0)
+    assert r._ke is None
+    assert round(r.kelvin, 2) == 273.15
+    assert r._ke is not None
+    assert r.kelvin is r.kelvin
+    assert r.in_scale('ke') is r.kelvin
+
+    r.temp = 10
+    assert r._ke is None
+    assert round(r.kelvin, 2) == 283.15
+
+    r.scale = 'fa'
+    assert (r._ce, r._fa, r._ke, r._ra) == (None,) * 4
+    assert round(r.temp, 2) == 50.00
+    assert round(r.celcius, 2) == 10.00
+    assert round(r.kelvin, 2) == 283.15
+
+    r.temp = 50
+    assert r._ce is not None
+    with pytest.raises(NameError):
+        r.in_scale('scale')
+
+
+def test_from_values():
+    temps = Degree.from_values('fa', [32, '50', 68.5])
+    assert [type(temp) for temp in temps] == [Degree] * 3
+    assert [temp.temp for temp in temps] == [32.0, 50.0, 68.5]
+    assert temps[1].scale == 'fa'
+    assert round(temps[1].celcius, 2) == 10.00
+    temps[1].scale = 'ce'
+    assert temps[0].scale == 'fa'
+    assert not hasattr(temps[0], '__dict__')
+    assert weakref.ref(temps[0])() is temps[0]
+
+    temps = Degree.from_values('ce', (value for value in [1, 2]), True)
+    assert temps.scale == 'ce'
+    assert temps.values == [1.0, 2.0]
+    assert Degree.from_values('ke', []) == []
+    with pytest.raises(NameError):
+        Degree.from_values('Dummy', [1])
+
+
+def test_frozen():
+    r = FrozenDegree('fa', 50)
+    assert isinstance(r, Degree)
+    assert repr(r) == "FrozenDegree('fa', 50.0)"
+    assert round(r.celcius, 2) == 10.00
+    with pytest.raises(AttributeError):
+        r.scale = 'ce'
+    with pytest.raises(AttributeError):
+        r.temp = 10
+    assert (r.scale, r.temp) == ('fa', 50.)
+
+    s = r.to('ce')
+    assert type(s) is FrozenDegree
+    assert (s.scale, round(s.temp, 2)) == ('ce', 10.00)
+    assert r.scale == 'fa'
+    assert type(r + 1) is FrozenDegree
+    assert r == FrozenDegree('fa', 50)
+    assert r != s
+    assert r != Degree('fa', 50)
+    assert {r: 1}[FrozenDegree('fa', 50.)] == 1
+    assert type(Degree('ce', 1).to('ke')) is Degree
+    with pytest.raises(NameError):
+        r.to('Dummy')
+
+
+def test_pickle():
+    for type_ in (Degree, FrozenDegree, ObservableDegree):
+        r = type_('fa', 70.1)
+        r.in_scale('ce')
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            s = pickle.loads(pickle.dumps(r, protocol))
+            assert type(s) is type_
+            assert (s.scale, s.temp) == ('fa', 70.1)
+            assert str(s) == str(r)
+        s = copy.copy(r)
+        assert (s.scale, s.temp) == ('fa', 70.1)
+
+    r = ObservableDegree('fa', 70.1)
+    r.observe(print)
+    s = copy.copy(r)
+    assert s._observers == []
+    assert r._observers == [print]
+    s = pickle.loads(pickle.dumps(r, 0))
+    assert s._observers == []
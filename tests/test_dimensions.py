@@ -0,0 +1,127 @@
+"""Dimensions tests module.
+
+Copyright (c) 2020 Thierry P.G. DECKER
+All Rights Reserved.
+Released under the MIT license
+
+"""
+
+import pytest
+
+from siarnaq import dimensions
+from siarnaq.degrees import Degree
+from siarnaq.distances import Distance
+from siarnaq.distances import DistanceArray
+from siarnaq.durations import Duration
+from siarnaq.durations import DurationArray
+from siarnaq.speeds import Speed
+from siarnaq.speeds import SpeedArray
+
+
+def test_vectors():
+    assert dimensions.product(dimensions.LENGTH, dimensions.TIME) == (1, 1, 0)
+    assert dimensions.quotient(dimensions.LENGTH, dimensions.TIME) == \
+        (1, -1, 0)
+    assert Speed.dimension == (1, -1, 0)
+
+
+def test_result_type():
+    assert dimensions.result_type(Distance, Duration, '/') is Speed
+    assert dimensions.result_type(Speed, Duration, '*') is Distance
+    assert dimensions.result_type(Duration, Speed, '*') is Distance
+    assert dimensions.result_type(Distance, Speed, '/') is Duration
+    assert dimensions.result_type(Distance, Distance, '/') is float
+    with pytest.raises(TypeError):
+        dimensions.result_type(Degree, Duration, '/')
+    for left, right in ((Degree, Degree), (Distance, Degree),
+                        (Degree, Distance)):
+        for operation in ('*', '/'):
+            with pytest.raises(TypeError):
+                dimensions.result_type(left, right, operation)
+
+
+def test_duration():
+    r = Duration('mn', 90)
+    assert r.scale == 'mn'
+    assert r.value == 90
+    assert r.hour == 1.5
+    assert round(r.second, 2) == 5400.00
+    assert Duration().scale == 'ho'
+    assert str(Duration('se', 1)) == '1.0 s'
+    assert repr(Duration('se', 1)) == 'Duration(\'se\', 1.0)'
+    assert (Duration('ho', 1) + Duration('mn', 30)).value == 1.5
+    assert (Duration('ho', 1) - 0.5).value == 0.5
+    assert (2 * Duration('ho', 1)).value == 2
+    r.scale = 'ho'
+    assert r.value == 1.5
+    with pytest.raises(NameError):
+        Duration('Dummy')
+    with pytest.raises(NameError):
+        r.scale = 'Dummy'
+
+
+def test_speed():
+    r = Distance('km', 100) / Duration('ho', 2)
+    assert isinstance(r, Speed)
+    assert r.scale == 'kmh'
+    assert r.value == 50
+    assert round(r.mile_per_hour, 2) == 31.08
+    assert str(r) == '50.0 km/h'
+
+    r = Distance('mi', 30) / Duration('mn', 30)
+    assert r.scale == 'mph'
+    assert round(r.value, 2) == 60.00
+    assert round(r.kilometer_per_hour, 2) == 96.54
+
+    r = Speed('mph', 60) * Duration('mn', 30)
+    assert isinstance(r, Distance)
+    assert r.scale == 'mi'
+    assert round(r.dist, 2) == 30.00
+
+    r = Distance('km', 30) / Speed('kmh', 60)
+    assert isinstance(r, Duration)
+    assert r.hour == 0.5
+
+
+def test_dimensionless():
+    assert round(Distance('km', 1) / Distance('mi', 1), 2) == 0.62
+
+
+def test_unchanged_scalar_arithmetic():
+    r = Distance('km', 10) / 2
+    assert isinstance(r, Distance)
+    assert r.dist == 5
+    r = Degree('ce', 10) * 2
+    assert isinstance(r, Degree)
+    assert r.temp == 20
+    with pytest.raises(TypeError):
+        Degree('ce', 10) / Duration('ho', 1)
+    with pytest.raises(TypeError):
+        Degree('ce', 20) / Degree('ce', 10)
+    assert (Degree('ce', 20) / 2).temp == 10
+    with pytest.raises(TypeError):
+        Distance('km', 10) * Distance('km', 10)
+
+
+def test_arrays():
+    r = DistanceArray('km', [10, 20]) / Duration('mn', 30)
+    assert isinstance(r, SpeedArray)
+    assert r.scale == 'kmh'
+    assert r.values == [20., 40.]
+
+    r = DistanceArray('mi', [10, 20]) / DurationArray('ho', [1, 4])
+    assert r.scale == 'mph'
+    assert [round(v, 2) for v in r.values] == [10.00, 5.00]
+
+    r = Distance('km', 10) / DurationArray('ho', [1, 2])
+    assert r.values == [10., 5.]
+
+    r = DistanceArray('km', [1, 2]) * 2
+    assert isinstance(r, DistanceArray)
+    assert r.values == [2., 4.]
+    assert (DistanceArray('km', [1, 2]) / 2).values == [.5, 1.]
+
+    with pytest.raises(ValueError):
+        DistanceArray('km', [1, 2]) / DurationArray('ho', [1])
+    with pytest.raises(TypeError):
+        DistanceArray('km', [1, 2]) * DurationArray('ho', [1, 2])
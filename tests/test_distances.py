@@ -5,9 +5,15 @@ All Rights Reserved.
 Released under the MIT license
 
 """
+import copy
+import pickle
+import weakref
+
 import pytest
 
 from siarnaq.distances import Distance
+from siarnaq.distances import FrozenDistance
+from siarnaq.distances import ObservableDistance
 
 
 def test_instanciations():
@@ -180,3 +186,71 @@ def test_div():
     assert r.scale == 'km'
     with pytest.raises(Exception):
         r = 2 / r
+
+
+def test_converter():
+    assert Distance.converter('km', 'mi') is Distance.conv_km_to_mi
+    assert Distance.converter('mi', 'mi')(1) == 1.
+    with pytest.raises(NameError):
+        Distance.converter('km', 'Dummy')
+
+
+def test_cached_views():
+    r = Distance(scale='mi', dist=10)
+    assert r._km is None
+    assert r.kilometer == 16.09
+    assert r._km == 16.09
+    assert r.in_scale('km') == 16.09
+
+    r.dist = 1
+    assert r._km is None
+    assert r.kilometer == 1.609
+
+    r.scale = 'km'
+    assert (r._km, r._mi) == (None, None)
+    assert r.dist == 1.609
+    assert round(r.mile, 2) == 1.00
+
+
+def test_from_values():
+    dists = Distance.from_values('mi', [1, '2'])
+    assert [dist.dist for dist in dists] == [1.0, 2.0]
+    assert round(dists[0].kilometer, 3) == 1.609
+    assert weakref.ref(dists[0])() is dists[0]
+    assert Distance.from_values('km', [3], array=True).values == [3.0]
+    with pytest.raises(NameError):
+        Distance.from_values('Dummy', [1])
+
+
+def test_frozen():
+    r = FrozenDistance('mi', 1)
+    with pytest.raises(AttributeError):
+        r.scale = 'km'
+    with pytest.raises(AttributeError):
+        r.dist = 2
+    s = r.to('km')
+    assert type(s) is FrozenDistance
+    assert (s.scale, s.dist) == ('km', 1.609)
+    assert hash(r) == hash(FrozenDistance('mi', 1.))
+    assert repr(r * 2) == "FrozenDistance('mi', 2.0)"
+
+
+def test_pickle():
+    for type_ in (Distance, FrozenDistance, ObservableDistance):
+        r = type_('mi', 12.5)
+        r.in_scale('km')
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            s = pickle.loads(pickle.dumps(r, protocol))
+            assert type(s) is type_
+            assert (s.scale, s.dist) == ('mi', 12.5)
+            assert str(s) == str(r)
+        s = copy.copy(r)
+        assert (s.scale, s.dist) == ('mi', 12.5)
+
+    r = ObservableDistance('mi', 12.5)
+    r.observe(print)
+    s = copy.copy(r)
+    assert s._observers == []
+    assert r._observers == [print]
+    s = pickle.loads(pickle.dumps(r, 0))
+    assert s._observers == []
@@ -0,0 +1,79 @@
+"""Test formatting module.
+
+Copyright (c) 2020 Thierry P.G. DECKER
+All Rights Reserved.
+Released under the MIT license
+
+"""
+
+import io
+
+import pytest
+
+from siarnaq.degrees import Degree
+from siarnaq.degrees import DegreeArray
+from siarnaq.distances import Distance
+from siarnaq.distances import DistanceArray
+from siarnaq.durations import Duration
+from siarnaq.formatting import Formatter
+from siarnaq.formatting import format_values
+
+
+def test_default_style():
+    temps = [Degree(scale, temp)
+             for scale in ('ce', 'fa', 'ke', 'ra')
+             for temp in (0, -17.5, 1 / 3, 1e20, float('nan'))]
+    for temp in temps:
+        formatter = Formatter(Degree, temp.scale)
+        assert formatter.format(temp) == str(temp)
+        assert formatter.dumps([temp]) == f'{temp}\n'
+    dists = [Distance('mi', 12.25), Distance('mi', 0.1)]
+    assert format_values(dists) == ''.join(f'{dist}\n' for dist in dists)
+    array = DegreeArray('fa', [70.1, 68])
+    assert format_values(array, separator=';') == \
+        ''.join(f'{temp};' for temp in array)
+    assert format_values([Duration('mn', 90)]) == '90.0 min\n'
+
+
+def test_options():
+    temps = [Degree('ce', 20), Degree('fa', 68), Degree('ke', 293.15)]
+    assert format_values(temps, 'fa', 1) == '68.0 °F\n' * 3
+    assert format_values(temps, 'ce', 2, 'ascii', separator=',') == \
+        '20.00 degC,' * 3
+    assert format_values(temps, 'ra', 0, 'none') == '528\n' * 3
+    assert format_values(DegreeArray('ce', [1.5]), 'ke', 2) == '274.65 K\n'
+    assert format_values(DegreeArray('ce', [37.0]), 'fa') == '98.6 °F\n'
+    for source in ('ce', 'fa', 'ke', 'ra'):
+        values = [-40., 0., 20., 21.57, 37., 100.]
+        for scale in ('ce', 'fa', 'ke', 'ra'):
+            assert format_values(DegreeArray(source, values), scale) == \
+                ''.join(f'{Degree(source, value).to(scale)}\n'
+                        for value in values)
+    array = DegreeArray('ce', [21.57], dtype='int32')
+    assert format_values(array, 'fa') == f'{array[0].to("fa")}\n'
+    assert format_values(DistanceArray('mi', [12.5]), 'km') == \
+        f'{Distance("mi", 12.5).to("km")}\n'
+    assert format_values([]) == ''
+
+
+def test_streams():
+    array = DegreeArray('ce', range(10000))
+    stream = io.StringIO()
+    assert format_values(array, stream=stream) == 10000
+    assert stream.getvalue() == ''.join(f'{temp}\n' for temp in array)
+    buffer = io.BytesIO()
+    formatter = Formatter(Degree, 'ce')
+    assert formatter.write(array, buffer, chunk_size=7) == 10000
+    assert buffer.getvalue() == stream.getvalue().encode('utf-8')
+    assert format_values([], stream=buffer) == 0
+
+
+def test_errors():
+    with pytest.raises(NameError):
+        Formatter(Degree, 'km')
+    with pytest.raises(NameError):
+        Formatter(Degree, 'ce', style='Dummy')
+    with pytest.raises(TypeError):
+        format_values([Degree('ce', 1), Distance('km', 1)])
+    with pytest.raises(TypeError):
+        Formatter(Degree, 'ce').dumps(DistanceArray('km', [1]))
@@ -0,0 +1,81 @@
+"""Test interning module.
+
+Copyright (c) 2020 Thierry P.G. DECKER
+All Rights Reserved.
+Released under the MIT license
+
+"""
+
+import pytest
+
+from siarnaq.degrees import Degree
+from siarnaq.degrees import FrozenDegree
+from siarnaq.distances import Distance
+from siarnaq.distances import FrozenDistance
+from siarnaq.interning import InternPool
+
+
+def test_get():
+    pool = InternPool()
+    r = pool.get('fa', 70)
+    assert type(r) is FrozenDegree
+    assert (r.scale, r.temp) == ('fa', 70.)
+    assert pool.get('fa', 70.) is r
+    assert pool.get('ce', 70) is not r
+    with pytest.raises(AttributeError):
+        r.scale = 'ce'
+    assert len(pool) == 2
+    assert pool.stats == {
+        'hits': 1, 'misses': 2, 'evictions': 0, 'size': 2, 'maxsize': 4096}
+    with pytest.raises(NameError):
+        pool.get('km', 1)
+
+
+def test_convert():
+    pool = InternPool(Distance, maxsize=2)
+    assert pool.quantity is FrozenDistance
+    assert pool.convert('mi', 1, 'km') == 1.609
+    assert pool.get('mi', 1)._km == 1.609
+    assert pool.convert('mi', 1, 'km') == 1.609
+    assert type(pool.get('km', 1)) is FrozenDistance
+    with pytest.raises(NameError):
+        pool.convert('mi', 1, 'ce')
+
+
+def test_eviction():
+    pool = InternPool(FrozenDegree, maxsize=2)
+    first = pool.get('ce', 1)
+    pool.get('ce', 2)
+    assert pool.get('ce', 1) is first
+    pool.get('ce', 3)
+    assert pool.get('ce', 1) is first
+    assert pool.stats['evictions'] == 1
+    assert pool.get('ce', 2) is not None
+    assert pool.stats == {
+        'hits': 2, 'misses': 4, 'evictions': 2, 'size': 2, 'maxsize': 2}
+    pool.clear()
+    assert len(pool) == 0
+    assert pool.stats['misses'] == 0
+
+
+def test_failed_gets():
+    pool = InternPool(Degree, maxsize=2)
+    for _ in range(3):
+        with pytest.raises(NameError):
+            pool.get('xx', 1)
+    with pytest.raises(ValueError):
+        pool.get('ce', 'Dummy')
+    assert pool.stats == {
+        'hits': 0, 'misses': 0, 'evictions': 0, 'size': 0, 'maxsize': 2}
+    pool.get('ce', 1)
+    pool.get('ce', 2)
+    pool.get('ce', 3)
+    assert pool.stats == {
+        'hits': 0, 'misses': 3, 'evictions': 1, 'size': 2, 'maxsize': 2}
+
+
+def test_errors():
+    with pytest.raises(TypeError):
+        InternPool(float)
+    with pytest.raises(ValueError):
+        InternPool(Degree, maxsize=0)
@@ -0,0 +1,54 @@
+"""Test merging module.
+
+Copyright (c) 2020 Thierry P.G. DECKER
+All Rights Reserved.
+Released under the MIT license
+
+"""
+
+import pytest
+
+from siarnaq.degrees import Degree
+from siarnaq.distances import Distance
+from siarnaq.merging import merge
+
+
+def test_merge():
+    us = [(1, Degree('fa', 32)), (4, Degree('fa', 50)), (4, Degree('fa', 68))]
+    eu = iter([(2, Degree('ce', 5)), (4, Degree('ke', 273.15))])
+    raw = [(0, 491.67), (5, 527.67)]
+    batches = list(merge([us, eu, raw], 'ce', scales=[None, None, 'ra'],
+                         batch_size=3))
+    assert [len(temps) for _, _, temps in batches] == [3, 3, 1]
+    timestamps = [t for batch, _, _ in batches for t in batch]
+    sources = [s for _, batch, _ in batches for s in batch]
+    values = [round(value, 6) for _, _, temps in batches
+              for value in temps.values]
+    assert timestamps == [0, 1, 2, 4, 4, 4, 5]
+    assert sources == [2, 0, 1, 0, 0, 1, 2]
+    assert values == [0., 0., 5., 10., 20., 0., 20.]
+    assert all(temps.scale == 'ce' for _, _, temps in batches)
+
+
+def test_streams():
+    assert list(merge([], 'ce')) == []
+    assert list(merge([[], iter([])], 'ke')) == []
+    dists = [(0, Distance('mi', 1)), (1, Distance('km', 1))]
+    (timestamps, sources, result), = merge([dists], 'km', Distance)
+    assert [round(value, 3) for value in result.values] == [1.609, 1.]
+    assert sources == [0, 0]
+
+
+def test_errors():
+    with pytest.raises(NameError):
+        list(merge([], 'km'))
+    with pytest.raises(NameError):
+        list(merge([[(0, 1.)]], 'ce', scales=['km']))
+    with pytest.raises(ValueError):
+        list(merge([[]], 'ce', scales=[]))
+    with pytest.raises(ValueError):
+        list(merge([], 'ce', batch_size=0))
+    with pytest.raises(ValueError):
+        list(merge([[(1, 1.), (0, 1.)]], 'ce', scales=['ce']))
+    with pytest.raises(TypeError):
+        list(merge([[(1, Distance('km', 1))]], 'ce'))
@@ -0,0 +1,97 @@
+"""Test ndjson module.
+
+Copyright (c) 2020 Thierry P.G. DECKER
+All Rights Reserved.
+Released under the MIT license
+
+"""
+
+import io
+import json
+
+import pytest
+
+from siarnaq import ndjson
+from siarnaq.degrees import Degree
+from siarnaq.degrees import DegreeArray
+from siarnaq.distances import Distance
+from siarnaq.distances import DistanceArray
+from siarnaq.speeds import Speed
+
+
+def test_dicts():
+    assert ndjson.to_dict(Degree('fa', 70.1)) == {'scale': 'fa', 'temp': 70.1}
+    assert ndjson.to_dict(Distance('mi', 2)) == {'scale': 'mi', 'dist': 2.}
+    assert ndjson.to_dict(Speed('kmh', 9)) == {'scale': 'kmh', 'value': 9.}
+    temp = ndjson.from_dict({'scale': 'fa', 'temp': 50})
+    assert (temp.scale, temp.temp) == ('fa', 50.)
+    temp = ndjson.from_dict({'scale': 'fa', 'temp': 50}, scale='ce')
+    assert (temp.scale, round(temp.temp, 2)) == ('ce', 10.)
+    dist = ndjson.from_dict({'scale': 'mi', 'dist': 1}, Distance, 'km')
+    assert round(dist.dist, 3) == 1.609
+    with pytest.raises(KeyError):
+        ndjson.from_dict({'scale': 'fa', 'dist': 50})
+    with pytest.raises(NameError):
+        ndjson.from_dict({'scale': 'Dummy', 'temp': 50})
+
+
+def test_write():
+    temps = [Degree('ce', 20), Degree('fa', 70.1), Degree('ke', 1e-7)]
+    stream = io.StringIO()
+    assert ndjson.write(temps, stream) == 3
+    assert stream.getvalue() == ''.join(
+        json.dumps({'scale': temp.scale, 'temp': temp.temp}) + '\n'
+        for temp in temps)
+
+    array = DegreeArray('fa', [70.1, float('nan'), 32])
+    stream = io.BytesIO()
+    assert ndjson.write(array, stream, 'ce', chunk_size=2) == 3
+    lines = stream.getvalue().decode('utf-8').splitlines()
+    assert lines[0] == json.dumps({'scale': 'ce', 'temp': array[0].celcius})
+    assert lines[1] == '{"scale": "ce", "temp": NaN}'
+    assert lines[2] == '{"scale": "ce", "temp": 0.0}'
+
+    stream = io.StringIO()
+    ndjson.write(temps, stream, 'fa')
+    assert '"scale": "ce"' not in stream.getvalue()
+    with pytest.raises(NameError):
+        ndjson.write(array, io.StringIO(), 'km')
+
+
+def test_read():
+    lines = [
+        '{"scale": "ce", "temp": 20}',
+        '',
+        '{"scale": "fa", "temp": 68.0}',
+    ]
+    temps = list(ndjson.read(lines))
+    assert [(temp.scale, temp.temp) for temp in temps] == \
+        [('ce', 20.), ('fa', 68.)]
+    temps = list(ndjson.read(lines, scale='ce'))
+    assert [round(temp.temp, 9) for temp in temps] == [20., 20.]
+
+    stream = io.BytesIO('\n'.join(lines * 3).encode('utf-8'))
+    arrays = list(ndjson.read_arrays(stream, scale='fa', chunk_size=4))
+    assert [len(array) for array in arrays] == [4, 2]
+    assert all(round(value, 9) == 68. for array in arrays
+               for value in array.values)
+    arrays = list(ndjson.read_arrays(lines))
+    assert arrays[0].scale == 'ke'
+    with pytest.raises(ValueError):
+        list(ndjson.read(['{"scale"']))
+
+
+def test_round_trip():
+    dists = DistanceArray('mi', [0.1, 12.25, 1e300])
+    text = ndjson.dumps(dists)
+    assert json.loads(text) == [
+        {'scale': 'mi', 'dist': value} for value in dists.values]
+    decoded = ndjson.loads(text, Distance, 'mi')
+    assert decoded.values == dists.values
+    stream = io.StringIO()
+    ndjson.write(dists, stream)
+    stream.seek(0)
+    decoded, = ndjson.read_arrays(stream, Distance, 'mi')
+    assert decoded.values == dists.values
+    assert ndjson.dumps([]) == '[]'
+    assert len(ndjson.loads('[]', Distance)) == 0
@@ -0,0 +1,52 @@
+"""Test parallel module.
+
+Copyright (c) 2020 Thierry P.G. DECKER
+All Rights Reserved.
+Released under the MIT license
+
+"""
+
+import concurrent.futures
+
+import pytest
+
+from siarnaq import parallel
+from siarnaq.degrees import DegreeArray
+from siarnaq.degrees import FrozenDegree
+from siarnaq.distances import DistanceArray
+
+
+def test_arrays():
+    temps = DegreeArray('fa', range(1001), dtype='int16', resolution=0.1)
+    expected = [
+        round(value, 6)
+        for value in temps.astype('float64').to('ce').values
+    ]
+    for threads in (1, 3, 8):
+        result = parallel.convert(temps, 'ce', threads)
+        assert type(result) is DegreeArray
+        assert result.scale == 'ce'
+        assert result.dtype == 'float64'
+        assert [round(value, 6) for value in result.values] == expected
+    dists = parallel.convert(DistanceArray('mi', [1, 2]), 'km')
+    assert [round(value, 3) for value in dists.values] == [1.609, 3.218]
+    assert len(parallel.convert(DegreeArray('ce'), 'ke', 4)) == 0
+    temps = FrozenDegree.from_values('fa', [37, 20.5])
+    assert parallel.convert(DegreeArray('fa', [37, 20.5]), 'ce').values == \
+        [temp.temp for temp in parallel.convert(temps, 'ce')]
+
+
+def test_objects():
+    temps = FrozenDegree.from_values('ce', range(100))
+    with concurrent.futures.ThreadPoolExecutor(2) as executor:
+        result = parallel.convert(temps, 'ke', 4, executor)
+    assert [type(temp) for temp in result] == [FrozenDegree] * 100
+    assert [temp.scale for temp in temps] == ['ce'] * 100
+    assert result == [FrozenDegree('ke', temp.kelvin) for temp in temps]
+
+
+def test_errors():
+    with pytest.raises(ValueError):
+        parallel.convert(DegreeArray('ce', [1]), 'ke', 0)
+    with pytest.raises(NameError):
+        parallel.convert(DegreeArray('ce', [1]), 'km')
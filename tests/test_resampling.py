@@ -0,0 +1,108 @@
+"""Resampling tests module.
+
+Copyright (c) 2020 Thierry P.G. DECKER
+All Rights Reserved.
+Released under the MIT license
+
+"""
+
+import pytest
+
+from siarnaq.degrees import DegreeArray
+from siarnaq.distances import DistanceArray
+from siarnaq.resampling import Resampler
+from siarnaq.resampling import resample
+
+
+def _rounded(values):
+    return [round(value, 2) for value in values]
+
+
+def test_interpolation():
+    timestamps = [0, 30, 150, 180]
+    temps = DegreeArray('ce', [0, 10, 20, 20])
+    points, r = resample(timestamps, temps, 60)
+    assert points == [0, 60, 120, 180]
+    assert isinstance(r, DegreeArray)
+    assert r.scale == 'ce'
+    assert _rounded(r.values) == [0.00, 12.50, 17.50, 20.00]
+
+    points, r = resample(timestamps, temps, 60, method='previous')
+    assert _rounded(r.values) == [0.00, 10.00, 10.00, 20.00]
+
+    points, r = resample(timestamps, temps, 60, scale='fa', start=-60)
+    assert points == [0, 60, 120, 180]
+    assert r.scale == 'fa'
+    assert _rounded(r.values) == [32.00, 54.50, 63.50, 68.00]
+
+
+def test_downsampling():
+    timestamps = [5, 10, 50, 70, 200]
+    temps = DegreeArray('ce', [1, 2, 6, 4, 8])
+    points, r = resample(timestamps, temps, 60, method='mean', start=0)
+    assert points == [0, 60, 180]
+    assert _rounded(r.values) == [3.00, 4.00, 8.00]
+    _, r = resample(timestamps, temps, 60, method='min', start=0)
+    assert _rounded(r.values) == [1.00, 4.00, 8.00]
+    _, r = resample(timestamps, temps, 60, method='max', start=0)
+    assert _rounded(r.values) == [6.00, 4.00, 8.00]
+    _, r = resample(timestamps, temps, 60, method='last', start=0)
+    assert _rounded(r.values) == [6.00, 4.00, 8.00]
+    _, r = resample(timestamps, temps, 60, 'ke', 'mean', 0)
+    assert _rounded(r.values) == [276.15, 277.15, 281.15]
+
+
+def test_streaming():
+    resampler = Resampler(60, 'km', 'mean', start=0)
+    points, r = resampler.feed([0, 30], DistanceArray('km', [1, 3]))
+    assert points == []
+    assert isinstance(r, DistanceArray)
+    points, r = resampler.feed([60, 90], DistanceArray('mi', [1, 1]))
+    assert points == [0]
+    assert r.values == [2.]
+    points, r = resampler.flush()
+    assert points == [60]
+    assert r.values == [1.609]
+
+    resampler = Resampler(10, 'ce')
+    points, r = resampler.feed([0, 5], DegreeArray('ce', [0, 5]))
+    assert points == [0]
+    points, r = resampler.feed([20], DegreeArray('ce', [20]))
+    assert points == [10]
+    assert _rounded(r.values) == [10.00]
+    points, r = resampler.flush()
+    assert points == [20]
+    assert r.values == [20.]
+    assert resampler.flush()[0] == []
+
+
+def test_repeated_timestamps():
+    timestamps = [0, 60, 60, 60, 120]
+    temps = DegreeArray('ce', [1, 2, 3, 4, 5])
+    for method in ('linear', 'previous'):
+        points, r = resample(timestamps, temps, 60, method=method)
+        assert points == [0, 60, 120]
+        assert r.values == [1., 4., 5.]
+
+    resampler = Resampler(60, 'ce', 'previous')
+    points, _ = resampler.feed([0, 60], DegreeArray('ce', [1, 2]))
+    assert points == [0]
+    points, r = resampler.feed([60, 90], DegreeArray('ce', [3, 4]))
+    assert points == [60]
+    assert r.values == [3.]
+
+
+def test_errors():
+    with pytest.raises(NameError):
+        Resampler(60, 'ce', 'Dummy')
+    with pytest.raises(ValueError):
+        Resampler(0, 'ce')
+    resampler = Resampler(60, 'ce')
+    with pytest.raises(ValueError):
+        resampler.feed([0, 1], DegreeArray('ce', [1]))
+    resampler.feed([10], DegreeArray('ce', [1]))
+    with pytest.raises(ValueError):
+        resampler.feed([5], DegreeArray('ce', [1]))
+    with pytest.raises(TypeError):
+        resampler.feed([20], DistanceArray('km', [1]))
+    assert Resampler(60, 'ce').flush() == ([], None)
@@ -0,0 +1,83 @@
+"""Rules tests module.
+
+Copyright (c) 2020 Thierry P.G. DECKER
+All Rights Reserved.
+Released under the MIT license
+
+"""
+
+import pytest
+
+from siarnaq.degrees import Degree
+from siarnaq.degrees import DegreeArray
+from siarnaq.distances import Distance
+from siarnaq.distances import DistanceArray
+from siarnaq.rules import RuleEngine
+
+
+def _engine():
+    engine = RuleEngine()
+    engine.add('hot', 'x', '>', Degree('fa', 85))
+    engine.add('warm', 'x', '>=', Degree('ce', 25))
+    engine.add('frost', 'x', '<', Degree('ce', 0))
+    engine.add('cold', 'x', '<=', Degree('ke', 278.15))
+    engine.add('long', 'y', '>', Distance('km', 500))
+    return engine
+
+
+def test_add_remove():
+    engine = _engine()
+    assert len(engine) == 5
+    assert 'hot' in engine
+    with pytest.raises(KeyError):
+        engine.add('hot', 'x', '>', Degree('fa', 90))
+    with pytest.raises(NameError):
+        engine.add('other', 'x', '!=', Degree('fa', 90))
+    with pytest.raises(TypeError):
+        engine.add('other', 'x', '>', Distance('km', 1))
+
+    engine.remove('hot')
+    assert 'hot' not in engine
+    assert engine.evaluate({'x': Degree('fa', 100)}) == {'warm'}
+    with pytest.raises(KeyError):
+        engine.remove('hot')
+
+    engine.remove('long')
+    engine.add('long', 'y', '>', Degree('ce', 1))
+    assert engine.evaluate({'y': Degree('ce', 2)}) == {'long'}
+
+
+def test_evaluate_scalars():
+    engine = _engine()
+    assert engine.evaluate({'x': Degree('ce', 20)}) == set()
+    assert engine.evaluate({'x': Degree('ce', 25)}) == {'warm'}
+    assert engine.evaluate({'x': Degree('ce', 30)}) == {'warm', 'hot'}
+    assert engine.evaluate({'x': Degree('ce', 5)}) == {'cold'}
+    assert engine.evaluate({'x': Degree('fa', 14)}) == {'cold', 'frost'}
+    assert engine.evaluate({'y': Distance('mi', 320)}) == {'long'}
+    assert engine.evaluate({'y': Distance('mi', 300)}) == set()
+    assert engine.evaluate({'z': Distance('mi', 300)}) == set()
+    with pytest.raises(TypeError):
+        engine.evaluate({'x': Distance('km', 1)})
+
+
+def test_evaluate_arrays():
+    engine = _engine()
+    readings = {
+        'x': DegreeArray('fa', [20, 70, 90]),
+        'y': DistanceArray('km', [100, 200]),
+    }
+    assert engine.evaluate(readings) == {'hot', 'warm', 'cold', 'frost'}
+    assert engine.evaluate({'x': DegreeArray('ce')}) == set()
+    with pytest.raises(TypeError):
+        engine.evaluate({'x': DistanceArray('km', [1])})
+
+
+def test_many_rules():
+    engine = RuleEngine()
+    for i in range(1000):
+        engine.add(i, 'x', '>', Degree('ce', i / 10))
+    assert engine.evaluate({'x': Degree('ce', 10)}) == set(range(100))
+    for i in range(0, 1000, 2):
+        engine.remove(i)
+    assert engine.evaluate({'x': Degree('ce', 10)}) == set(range(1, 100, 2))
@@ -0,0 +1,170 @@
+"""Conversion server tests module.
+
+Copyright (c) 2020 Thierry P.G. DECKER
+All Rights Reserved.
+Released under the MIT license
+
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from siarnaq.degrees import Degree
+from siarnaq.server import ConversionServer
+
+
+async def _request(port, method, path, payload=None):
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    body = b'' if payload is None else json.dumps(payload).encode()
+    writer.write(
+        f'{method} {path} HTTP/1.1\r\n'
+        f'Content-Length: {len(body)}\r\n'
+        f'Connection: close\r\n\r\n'.encode() + body
+    )
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, content = response.partition(b'\r\n\r\n')
+    return int(head.split()[1]), json.loads(content, parse_constant=_strict)
+
+
+def _strict(constant):
+    """Reject the NaN and Infinity constants, which are not JSON."""
+    raise ValueError(constant)
+
+
+def _run(scenario):
+    async def main():
+        service = ConversionServer(window=0.01)
+        server = await service.start('127.0.0.1', 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            return service, await scenario(port)
+    return asyncio.run(main())
+
+
+def test_single_conversion():
+    async def scenario(port):
+        return await _request(port, 'POST', '/convert', {
+            'quantity': 'degree', 'scale': 'ce', 'to': 'fa', 'value': 100,
+        })
+    _, (status, payload) = _run(scenario)
+    assert status == 200
+    assert payload['scale'] == 'fa'
+    assert round(payload['value'], 2) == 212.00
+
+
+def test_conversions_match_objects():
+    async def scenario(port):
+        return await _request(port, 'POST', '/convert', {
+            'quantity': 'degree', 'scale': 'fa', 'to': 'ce', 'value': 37,
+        })
+    _, (status, payload) = _run(scenario)
+    assert payload['value'] == Degree('fa', 37).celcius
+
+
+def test_bulk_conversion():
+    async def scenario(port):
+        return await _request(port, 'POST', '/convert', {
+            'quantity': 'distance', 'scale': 'mi', 'to': 'km',
+            'values': [1, 10],
+        })
+    _, (status, payload) = _run(scenario)
+    assert status == 200
+    assert payload == {'scale': 'km', 'values': [1.609, 16.09]}
+
+
+def test_batching():
+    async def scenario(port):
+        return await asyncio.gather(*(
+            _request(port, 'POST', '/convert', {
+                'quantity': 'degree', 'scale': 'ke', 'to': 'ce', 'value': i,
+            })
+            for i in range(20)
+        ))
+    service, responses = _run(scenario)
+    assert [round(payload['value'], 2) for _, payload in responses] == \
+        [round(i - 273.15, 2) for i in range(20)]
+    stats = service.stats
+    assert stats['requests'] == 20
+    assert stats['values'] == 20
+    assert stats['batches'] < 20
+
+
+@pytest.mark.parametrize('method, path, payload, expected', [
+    ('POST', '/convert', {'quantity': 'Dummy', 'scale': 'ce', 'value': 1},
+     400),
+    ('POST', '/convert', {'quantity': 'degree', 'scale': 'ce', 'to': 'Dummy',
+                          'value': 1}, 400),
+    ('POST', '/convert', {'quantity': 'degree', 'scale': 'ce',
+                          'value': 'Dummy'}, 400),
+    ('POST', '/convert', {'quantity': 'degree'}, 400),
+    ('POST', '/convert', {'quantity': 'degree', 'scale': 'ce',
+                          'value': 10 ** 400}, 400),
+    ('POST', '/convert', {'quantity': 'degree', 'scale': 'ce',
+                          'values': [1, float('inf')]}, 400),
+    ('POST', '/convert', {'quantity': 'degree', 'scale': 'ce',
+                          'value': float('nan')}, 400),
+    ('POST', '/convert', {'quantity': 'degree', 'scale': 'ke', 'to': 'ra',
+                          'value': 1.7e308}, 400),
+    ('POST', '/convert', {'quantity': 'degree', 'scale': 'ce',
+                          'values': '12'}, 400),
+    ('POST', '/convert', {'quantity': 'degree', 'scale': 'ce',
+                          'value': True}, 400),
+    ('POST', '/convert', {'quantity': 'degree', 'scale': 'ce',
+                          'values': [1, '5']}, 400),
+    ('POST', '/convert', {'quantity': 'degree', 'scale': 'ce',
+                          'value': '5'}, 400),
+    ('GET', '/convert', None, 405),
+    ('GET', '/Dummy', None, 404),
+])
+def test_errors(method, path, payload, expected):
+    async def scenario(port):
+        return await _request(port, method, path, payload)
+    service, (status, payload) = _run(scenario)
+    assert status == expected
+    assert 'error' in payload
+    assert service.stats['errors'] == 1
+
+
+@pytest.mark.parametrize('request_head, expected', [
+    (b'GARBAGE\r\n', 400),
+    (b'POST /convert HTTP/1.1\r\nContent-Length: x\r\n\r\n', 400),
+    (b'POST /convert HTTP/1.1\r\nContent-Length: 99999\r\n\r\n', 413),
+])
+def test_malformed_requests(request_head, expected):
+    async def scenario(port):
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        writer.write(request_head)
+        await writer.drain()
+        response = await reader.read()
+        writer.close()
+        return response
+    service = ConversionServer(max_body=1024)
+
+    async def main():
+        server = await service.start('127.0.0.1', 0)
+        async with server:
+            return await scenario(server.sockets[0].getsockname()[1])
+    response = asyncio.run(main())
+    head, _, content = response.partition(b'\r\n\r\n')
+    assert int(head.split()[1]) == expected
+    assert 'error' in json.loads(content)
+    assert service.stats['requests'] == 1
+    assert service.stats['errors'] == 1
+
+
+def test_stats():
+    async def scenario(port):
+        await _request(port, 'POST', '/convert', {
+            'quantity': 'degree', 'scale': 'ce', 'values': [1, 2, 3],
+        })
+        return await _request(port, 'GET', '/stats')
+    _, (status, payload) = _run(scenario)
+    assert status == 200
+    assert payload['requests'] == 1
+    assert payload['values'] == 3
+    assert payload['batches'] == 1
+    assert payload['latency_max'] >= payload['latency_mean'] > 0
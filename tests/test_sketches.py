@@ -0,0 +1,112 @@
+"""Quantile sketches tests module.
+
+Copyright (c) 2020 Thierry P.G. DECKER
+All Rights Reserved.
+Released under the MIT license
+
+"""
+
+import random
+
+import pytest
+
+from siarnaq.degrees import Degree
+from siarnaq.degrees import DegreeArray
+from siarnaq.distances import Distance
+from siarnaq.distances import DistanceArray
+from siarnaq.sketches import QuantileSketch
+
+
+def _rank_error(sketch, values, fraction):
+    estimate = sketch.quantile(fraction).value
+    rank = sum(1 for value in values if value <= estimate)
+    return abs(rank / len(values) - fraction)
+
+
+def test_instanciations():
+    assert len(QuantileSketch()) == 0
+    assert QuantileSketch().quantity is Degree
+    assert QuantileSketch(Distance, k=100).k == 100
+    with pytest.raises(ValueError):
+        QuantileSketch(k=2)
+    with pytest.raises(ValueError):
+        QuantileSketch().quantile(0.5)
+
+
+def test_small_stream():
+    sketch = QuantileSketch()
+    for temp in range(101):
+        sketch.add(Degree('ce', temp))
+    assert len(sketch) == 101
+    r = sketch.quantile(0.5, scale='ce')
+    assert isinstance(r, Degree)
+    assert round(r.temp, 2) == 50.00
+    assert round(sketch.quantile(0, 'ce').temp, 2) == 0.00
+    assert round(sketch.quantile(1, 'ce').temp, 2) == 100.00
+    assert round(sketch.quantile(0.5).kelvin, 2) == 323.15
+    assert round(sketch.quantile(0.5, 'fa').temp, 2) == 122.00
+    with pytest.raises(ValueError):
+        sketch.quantile(1.5)
+    with pytest.raises(NameError):
+        sketch.quantile(0.5, 'Dummy')
+    with pytest.raises(TypeError):
+        sketch.add(Distance('km', 1))
+
+
+def test_mixed_scales():
+    sketch = QuantileSketch(Distance)
+    sketch.extend([1, 2, 3], 'km')
+    sketch.extend(DistanceArray('mi', [1 / 1.609 * 4]))
+    sketch.add(Distance('km', 5))
+    assert [round(d.dist, 2) for d in sketch.quantiles([0, 0.5, 1])] == \
+        [1.00, 3.00, 5.00]
+    with pytest.raises(NameError):
+        sketch.extend([1], 'Dummy')
+    with pytest.raises(TypeError):
+        sketch.extend(DegreeArray('ce', [1]))
+
+
+def test_accuracy():
+    generator = random.Random(1)
+    values = [generator.gauss(20, 5) for _ in range(100000)]
+    sketch = QuantileSketch(seed=1)
+    for start in range(0, len(values), 10000):
+        sketch.extend(values[start:start + 10000], 'ke')
+    assert len(sketch) == 100000
+    assert sketch.retained < 2000
+    for fraction in (0.01, 0.5, 0.95, 0.99):
+        assert _rank_error(sketch, values, fraction) < 0.02
+
+
+def test_merge_and_serialise():
+    generator = random.Random(2)
+    values = [generator.uniform(0, 100) for _ in range(60000)]
+    shards = []
+    for shard in range(3):
+        sketch = QuantileSketch(seed=shard)
+        sketch.extend(values[shard::3], 'ke')
+        shards.append(QuantileSketch.from_bytes(sketch.to_bytes()))
+    merged = shards[0]
+    merged.merge(shards[1])
+    merged.merge(shards[2])
+    assert len(merged) == 60000
+    assert merged.quantity is Degree
+    for fraction in (0.5, 0.95, 0.99):
+        assert _rank_error(merged, values, fraction) < 0.02
+    assert len(merged.to_bytes()) < 8 * 2000 + 200
+
+    with pytest.raises(TypeError):
+        merged.merge(QuantileSketch(Distance))
+    with pytest.raises(ValueError):
+        QuantileSketch.from_bytes(b'Dummy' * 20)
+
+
+def test_malformed_bytes():
+    sketch = QuantileSketch(seed=1)
+    sketch.extend(range(1000), 'ce')
+    data = sketch.to_bytes()
+    assert len(QuantileSketch.from_bytes(bytearray(data))) == 1000
+    for malformed in (b'', b'abc', data[:20], data[:-1], data[:-8],
+                      data + b'\0'):
+        with pytest.raises(ValueError, match='not a quantile sketch'):
+            QuantileSketch.from_bytes(malformed)
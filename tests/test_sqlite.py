@@ -0,0 +1,105 @@
+"""Test sqlite module.
+
+Copyright (c) 2020 Thierry P.G. DECKER
+All Rights Reserved.
+Released under the MIT license
+
+"""
+
+import sqlite3
+
+import pytest
+
+from siarnaq.degrees import Degree
+from siarnaq.degrees import DegreeArray
+from siarnaq.degrees import FrozenDegree
+from siarnaq.degrees import ObservableDegree
+from siarnaq.distances import Distance
+from siarnaq.distances import ObservableDistance
+from siarnaq.sqlite import ReadingStore
+from siarnaq.sqlite import register
+
+
+@pytest.fixture
+def store():
+    store = ReadingStore(sqlite3.connect(':memory:'))
+    store.insert([
+        ('a', 1, Degree('ce', 20)),
+        ('b', 2, Degree('fa', 50)),
+        ('a', 3, FrozenDegree('ke', 300)),
+    ])
+    return store
+
+
+def test_insert(store):
+    assert len(store) == 3
+    rows = store._connection.execute(
+        'SELECT sensor, timestamp, canonical, scale FROM readings').fetchall()
+    assert [(sensor, timestamp, round(canonical, 6), scale)
+            for sensor, timestamp, canonical, scale in rows] == [
+        ('a', 1, 293.15, 'ce'), ('b', 2, 283.15, 'fa'), ('a', 3, 300, 'ke')]
+    store = ReadingStore(store._connection, batch_size=2)
+    assert store.insert_array('c', [4, 5, 6], DegreeArray('ra', [1, 2, 3])) \
+        == 3
+    assert len(store) == 6
+    with pytest.raises(TypeError):
+        store.insert([('a', 7, Degree()), ('a', 8, Distance())])
+    assert len(store) == 6
+    with pytest.raises(ValueError):
+        store.insert_array('c', [1], DegreeArray('ce', [1, 2]))
+
+
+def test_query(store):
+    rows = store.query(Degree('fa', 60), Degree('ce', 30))
+    assert [(sensor, timestamp, temp.scale, round(temp.temp, 6))
+            for sensor, timestamp, temp in rows] == \
+        [('a', 1, 'ce', 20.), ('a', 3, 'ke', 300.)]
+    rows = store.query(high=Degree('ce', 20), scale='ce')
+    assert [round(temp.temp, 6) for _, _, temp in rows] == [20., 10.]
+    assert [sensor for sensor, _, _ in store.query(sensor='b')] == ['b']
+    assert len(store.query()) == 3
+
+    timestamps, temps = store.query_array(low=Degree('ce', 15), scale='fa')
+    assert timestamps == [1, 3]
+    assert temps.scale == 'fa'
+    assert [round(value, 6) for value in temps.values] == [68., 80.33]
+    timestamps, temps = store.query_array(sensor='a')
+    assert temps.scale == 'ke'
+    with pytest.raises(TypeError):
+        store.query(Distance('km', 1))
+    with pytest.raises(NameError):
+        store.query_array(scale='km')
+
+
+def test_index(store):
+    sql, parameters = store._select(
+        'canonical', Degree('ce', 0), Degree('fa', 100), None)
+    plan = store._connection.execute(
+        'EXPLAIN QUERY PLAN ' + sql, parameters).fetchall()
+    assert any('readings_canonical' in row[-1] for row in plan)
+
+
+def test_register():
+    register()
+    connection = sqlite3.connect(
+        ':memory:', detect_types=sqlite3.PARSE_DECLTYPES)
+    connection.execute('CREATE TABLE t (temp DEGREE, dist DISTANCE)')
+    connection.execute('INSERT INTO t VALUES (?, ?)',
+                       (Degree('ce', 0), Distance('mi', 1)))
+    temp, dist = connection.execute('SELECT temp, dist FROM t').fetchone()
+    assert (temp.scale, round(temp.temp, 2)) == ('ke', 273.15)
+    assert (dist.scale, round(dist.dist, 3)) == ('km', 1.609)
+    assert connection.execute(
+        'SELECT COUNT(*) FROM t WHERE temp > ?',
+        (FrozenDegree('fa', 31),)).fetchone() == (1,)
+    assert connection.execute(
+        'SELECT ?, ?',
+        (ObservableDegree('ce', 0), ObservableDistance('km', 2)),
+    ).fetchone() == (273.15, 2.)
+
+
+def test_errors():
+    with pytest.raises(ValueError):
+        ReadingStore(sqlite3.connect(':memory:'), 'readings; DROP')
+    with pytest.raises(ValueError):
+        ReadingStore(sqlite3.connect(':memory:'), batch_size=0)
@@ -0,0 +1,66 @@
+"""Thermal metrics tests module.
+
+Copyright (c) 2020 Thierry P.G. DECKER
+All Rights Reserved.
+Released under the MIT license
+
+"""
+
+import pytest
+
+from siarnaq.degrees import Degree
+from siarnaq.degrees import DegreeArray
+from siarnaq.speeds import Speed
+from siarnaq.speeds import SpeedArray
+from siarnaq.thermal import dew_point
+from siarnaq.thermal import heat_index
+from siarnaq.thermal import wind_chill
+
+
+def test_dew_point():
+    r = dew_point(Degree('ce', 20), 50)
+    assert isinstance(r, Degree)
+    assert r.scale == 'ce'
+    assert round(r.temp, 1) == 9.3
+    assert round(dew_point(Degree('ce', 20), 100).temp, 6) == 20
+
+    r = dew_point(Degree('fa', 68), 50, scale='ce')
+    assert r.scale == 'ce'
+    assert round(r.temp, 1) == 9.3
+
+
+def test_heat_index():
+    assert round(heat_index(Degree('fa', 90), 60).temp) == 100
+    assert round(heat_index(Degree('fa', 70), 50).temp) == 69
+    r = heat_index(Degree('ce', 35), 50)
+    assert r.scale == 'ce'
+    assert round(r.fahrenheit) == 105
+    assert round(heat_index(Degree('fa', 100), 10).temp) == 94
+    assert round(heat_index(Degree('fa', 85), 90).temp) == 102
+
+
+def test_wind_chill():
+    assert round(wind_chill(Degree('ce', -10), 20).temp, 1) == -17.9
+    assert wind_chill(Degree('ce', 15), 20).temp == 15
+    assert wind_chill(Degree('ce', -10), 2).temp == -10
+    r = wind_chill(Degree('ce', -10), Speed('mph', 20 / 1.609))
+    assert round(r.temp, 1) == -17.9
+    r = wind_chill(Degree('fa', 14), 20, scale='ce')
+    assert round(r.temp, 1) == -17.9
+
+
+def test_arrays():
+    temps = DegreeArray('fa', [68, 90])
+    r = dew_point(temps, [50, 60])
+    assert isinstance(r, DegreeArray)
+    assert r.scale == 'fa'
+    assert [round(v, 1) for v in r.to('ce').values] == [9.3, 23.5]
+
+    r = heat_index(temps, [50, 60], scale='fa')
+    assert [round(v) for v in r.values] == [67, 100]
+
+    r = wind_chill(DegreeArray('ce', [-10, 15]), SpeedArray('kmh', [20, 20]))
+    assert [round(v, 1) for v in r.values] == [-17.9, 15.0]
+
+    with pytest.raises(ValueError):
+        dew_point(temps, [50])